@@ -16,11 +16,20 @@ from sqlalchemy_history.exc import (  # noqa: F401
     ImproperlyConfigured,
     TableNotVersioned,
 )
+from sqlalchemy_history.fetcher import (  # noqa: F401
+    VersionHistory,
+    aprefetch_history,
+    prefetch_history,
+    version_changesets,
+)
 from sqlalchemy_history.manager import VersioningManager
 from sqlalchemy_history.operation import Operation  # noqa: F401
+from sqlalchemy_history.relationship_builder import aload_relationships, load_relationships  # noqa: F401
 from sqlalchemy_history.transaction import TransactionFactory  # noqa: F401
 from sqlalchemy_history.unit_of_work import UnitOfWork  # noqa: F401
 from sqlalchemy_history.utils import (  # noqa: F401
+    as_of,
+    changed_versioned_keys,
     changeset,
     count_versions,
     get_versioning_manager,
@@ -50,7 +59,8 @@ def make_versioned(
 ):
     """This is the public API function of SQLAlchemy-History for making certain mappers and sessions
      versioned.
-    By default this applies to all mappers and all sessions.
+    By default this applies to all mappers and all sessions. Inserts, updates and deletes are only
+    tracked for the mappers of versioned classes.
 
     **Examples**
 
@@ -82,7 +92,6 @@ def make_versioned(
 
     manager.user_cls = user_cls
     manager.apply_class_configuration_listeners(mapper)
-    manager.track_operations(mapper)
     manager.track_session(session)
 
     sqlalchemy.event.listen(sa.engine.Engine, "before_cursor_execute", manager.track_sql_operations)
@@ -115,9 +124,9 @@ def remove_versioning(mapper=Mapper, session=Session, manager=versioning_manager
     :returns: None
     :rtype: NoneType
     """
+    manager.remove_tracking()
     manager.reset()
     manager.remove_class_configuration_listeners(mapper)
-    manager.remove_operations_tracking(mapper)
     manager.remove_session_tracking(session)
     sqlalchemy.event.remove(sa.engine.Engine, "before_cursor_execute", manager.track_sql_operations)
 
@@ -6,6 +6,7 @@ import typing as t
 from copy import copy
 from functools import wraps
 from inspect import getmro
+from types import MappingProxyType
 
 import sqlalchemy as sa
 from sqlalchemy.orm import Mapper, column_property
@@ -13,6 +14,7 @@ from sqlalchemy.orm.descriptor_props import ConcreteInheritedProperty
 from sqlalchemy_utils.functions import get_declarative_base, get_hybrid_properties
 
 from sqlalchemy_history.model_builder import ModelBuilder
+from sqlalchemy_history.plan import VersioningPlan
 from sqlalchemy_history.relationship_builder import RelationshipBuilder
 from sqlalchemy_history.table_builder import TableBuilder
 from sqlalchemy_history.utils import get_association_proxies, version_class
@@ -141,26 +143,34 @@ class Builder:
     def configure_versioned_classes(self) -> None:
         """
         Configures all versioned classes that were collected during
-        instrumentation process. The configuration has 6 steps:
+        instrumentation process. The configuration has 11 steps:
 
-        1. Build tables for version models.
-        2. Build the actual version model declarative classes.
-        3. Build relationships between these models.
-        4. Empty pending_classes list so that consecutive mapper configuration
+        1. Attach operation tracking listeners to the mappers of versioned classes.
+        2. Build tables for version models.
+        3. Build the actual version model declarative classes.
+        4. Build relationships between these models.
+        5. Empty pending_classes list so that consecutive mapper configuration
            does not create multiple version classes
-        5. Build aliases for columns.
-        6. Assign all versioned attributes to use active history.
-        7. Add Association proxy for Versioned Models.
-        8. Add Hybrid Property to Versioned Model
+        6. Build aliases for columns.
+        7. Assign all versioned attributes to use active history.
+        8. Add Association proxy for Versioned Models.
+        9. Add Hybrid Property to Versioned Model
+        10. Build versioning plans of the versioned classes.
+        11. Index the version tables of association tables by their name.
         """
         if not self.manager.options["versioning"]:
             return
 
+        for cls in self.manager.pending_classes:
+            if self.manager.option(cls, "versioning"):
+                self.manager.track_versioned_class(cls)
+
         self.build_tables()
         self.build_transaction_class()
 
         if not self.manager.options["create_models"]:
             self.manager.pending_classes = []
+            self.build_association_table_index()
             return
 
         self.build_models()
@@ -174,6 +184,8 @@ class Builder:
         self.create_column_aliases(pending_classes_copies)
         self.create_association_proxies(pending_classes_copies)
         self.create_hybrid_properties(pending_classes_copies)
+        self.build_plans(pending_classes_copies)
+        self.build_association_table_index()
 
     def enable_active_history(self, version_classes) -> None:
         """
@@ -248,3 +260,37 @@ class Builder:
                         update_expr=prop.update_expr,
                     ),
                 )
+
+    def build_plans(self, version_classes) -> None:
+        """
+        Build the VersioningPlan of each versioned class used by the write path.
+
+        :param version_classes: All version classes tracked.
+
+        """
+        for cls in version_classes:
+            if self.manager.option(cls, "versioning"):
+                self.manager.plans[cls] = VersioningPlan(self.manager, cls)
+
+    def build_association_table_index(self) -> None:
+        """
+        Build the index of association version tables by the schema qualified name of their parent
+        table, which is used for tracking the SQL operations on association tables.
+
+        Tables of versioned classes are tracked by the mapper listeners and hence not indexed.
+
+        """
+        orm_tracked_tables = {
+            cls.__table__
+            for cls in self.manager.version_class_map
+            # NOTE: We add hasattr(cls, '__table__') cause some ORM may not have a physical table
+            #  associated to them
+            if hasattr(cls, "__table__")
+        }
+        self.manager.association_tables = MappingProxyType(
+            {
+                table.schema + "." + table.name if table.schema else table.name: version_table
+                for table, version_table in self.manager.version_table_map.items()
+                if table not in orm_tracked_tables
+            }
+        )
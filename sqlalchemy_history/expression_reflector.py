@@ -4,6 +4,7 @@ import typing as t
 
 import sqlalchemy as sa
 from sqlalchemy.orm import RelationshipProperty
+from sqlalchemy.orm.util import AliasedClass
 from sqlalchemy.sql.expression import bindparam
 from sqlalchemy.sql.visitors import ExternallyTraversible, ReplacingCloningVisitor
 
@@ -28,7 +29,9 @@ class VersionExpressionReflector(ReplacingCloningVisitor):
                 raise AssertionError(f"Unable to find version_table for {elem.table}")
             reflected_column = table.c[elem.name]
             if elem in self.relationship.local_columns and table == self.parent.__table__:
-                reflected_column = bindparam(elem.key, getattr(self.parent, elem.key))
+                value = getattr(self.parent, elem.key)
+                # An aliased version class reflects to its columns, used when loading batches of versions
+                reflected_column = value if isinstance(self.parent, AliasedClass) else bindparam(elem.key, value)
 
         return reflected_column
 
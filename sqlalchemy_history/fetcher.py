@@ -2,17 +2,22 @@
 
 import operator
 import typing as t
+from collections import defaultdict
+from copy import copy
 
 import sqlalchemy as sa
 from sqlalchemy.ext.asyncio import async_object_session
 from sqlalchemy.orm import aliased, object_session
+from sqlalchemy.orm.util import identity_key
 from sqlalchemy_utils import get_primary_keys, identity
 
-from sqlalchemy_history.utils import end_tx_column_name, tx_column_name
+from sqlalchemy_history.schema import key_criteria
+from sqlalchemy_history.utils import get_versioning_manager, parent_class, tx_column_name
 
 
 if t.TYPE_CHECKING:
     from sqlalchemy_history.manager import VersioningManager
+    from sqlalchemy_history.plan import VersioningPlan
 
 
 def parent_identity(obj_or_class) -> tuple:
@@ -28,6 +33,27 @@ def eqmap(callback, iterable) -> t.Iterator[bool]:
         yield a == b
 
 
+def history_window(version_cls, plan: "VersioningPlan", *criteria) -> sa.Select:
+    """
+    Returns the query numbering the versions of given version class matching
+    given criteria within the history of their parent object along with the
+    transaction ids of their previous and next versions.
+    """
+    keys = [getattr(version_cls, key) for key in plan.version_parent_keys]
+    tx_column = getattr(version_cls, plan.tx_column_name)
+
+    def over(func):
+        return func.over(partition_by=keys, order_by=tx_column)
+
+    return sa.select(
+        *(column.label(key) for key, column in zip(plan.version_parent_keys, keys)),
+        tx_column.label("transaction_id"),
+        (over(sa.func.row_number()) - 1).label("index"),
+        over(sa.func.lag(tx_column)).label("previous_transaction_id"),
+        over(sa.func.lead(tx_column)).label("next_transaction_id"),
+    ).where(*criteria)
+
+
 def parent_criteria(obj, class_=None) -> t.Iterator[bool]:
     if class_ is None:
         class_ = obj.__class__
@@ -38,6 +64,14 @@ class VersionObjectFetcher:
     def __init__(self, manager: "VersioningManager") -> None:
         self.manager = manager
 
+    def plan(self, obj) -> "VersioningPlan":
+        """Return the VersioningPlan of the parent class of given version object."""
+        return self.manager.plan(parent_class(obj.__class__))
+
+    def parent_criteria(self, obj) -> list:
+        """Return the criteria matching the versions of the parent object of given version object."""
+        return [getattr(obj.__class__, key) == getattr(obj, key) for key in self.plan(obj).version_parent_keys]
+
     def previous(self, obj):
         """
         Returns the previous version relative to this version in the version
@@ -111,20 +145,17 @@ class VersionObjectFetcher:
         else:
             table = alias.original
             attrs = alias.c
+        plan = self.plan(obj)
         query = (
-            sa.select(func(getattr(attrs, tx_column_name(obj))))
+            sa.select(func(getattr(attrs, plan.tx_column_name)))
             .select_from(table)
             .where(
                 sa.and_(
                     op(
-                        getattr(attrs, tx_column_name(obj)),
-                        getattr(obj, tx_column_name(obj)),
+                        getattr(attrs, plan.tx_column_name),
+                        getattr(obj, plan.tx_column_name),
                     ),
-                    *[
-                        getattr(attrs, pk) == getattr(obj, pk)
-                        for pk in get_primary_keys(obj.__class__)
-                        if pk != tx_column_name(obj)
-                    ],
+                    *[getattr(attrs, pk) == getattr(obj, pk) for pk in plan.version_parent_keys],
                 )
             )
             .correlate(table)
@@ -136,7 +167,7 @@ class VersionObjectFetcher:
         subquery = subquery.scalar_subquery()
 
         return sa.select(obj.__class__).filter(
-            sa.and_(getattr(obj.__class__, tx_column_name(obj)) == subquery, *parent_criteria(obj))
+            sa.and_(getattr(obj.__class__, self.plan(obj).tx_column_name) == subquery, *self.parent_criteria(obj))
         )
 
     def _index_query(self, obj) -> sa.Select:
@@ -145,11 +176,16 @@ class VersionObjectFetcher:
         to version history.
         """
         alias = aliased(obj.__class__)
+        plan = self.plan(obj)
+        tx_column = plan.tx_column_name
 
         subquery = (
             sa.select(sa.func.count("1"))
             .select_from(alias.__table__)
-            .where(getattr(alias, tx_column_name(obj)) < getattr(obj, tx_column_name(obj)))
+            .where(
+                getattr(alias, tx_column) < getattr(obj, tx_column),
+                *[getattr(alias, key) == getattr(obj, key) for key in plan.version_parent_keys],
+            )
             .correlate(alias.__table__)
             .label("position")
         )
@@ -157,7 +193,7 @@ class VersionObjectFetcher:
             sa.select(subquery)
             .select_from(obj.__table__)
             .where(sa.and_(*eqmap(identity, (obj.__class__, obj))))
-            .order_by(getattr(obj.__class__, tx_column_name(obj)))
+            .order_by(getattr(obj.__class__, tx_column))
         )
 
 
@@ -183,10 +219,11 @@ class ValidityFetcher(VersionObjectFetcher):
         Returns the query that fetches the next version relative to this
         version in the version history.
         """
+        plan = self.plan(obj)
         return sa.select(obj.__class__).filter(
             sa.and_(
-                getattr(obj.__class__, tx_column_name(obj)) == getattr(obj, end_tx_column_name(obj)),
-                *parent_criteria(obj),
+                getattr(obj.__class__, plan.tx_column_name) == getattr(obj, plan.end_tx_column_name),
+                *self.parent_criteria(obj),
             )
         )
 
@@ -195,9 +232,528 @@ class ValidityFetcher(VersionObjectFetcher):
         Returns the query that fetches the previous version relative to this
         version in the version history.
         """
+        plan = self.plan(obj)
         return sa.select(obj.__class__).filter(
             sa.and_(
-                getattr(obj.__class__, end_tx_column_name(obj)) == getattr(obj, tx_column_name(obj)),
-                *parent_criteria(obj),
+                getattr(obj.__class__, plan.end_tx_column_name) == getattr(obj, plan.tx_column_name),
+                *self.parent_criteria(obj),
+            )
+        )
+
+
+class WindowFetcher(VersionObjectFetcher):
+    """
+    Fetches the index, previous and next versions of a version object with
+    a single query using the ``ROW_NUMBER``, ``LAG`` and ``LEAD`` window
+    functions over the versions of its parent object. The three values are
+    fetched together when the first of them is accessed.
+    """
+
+    #: Key of the fetched index, previous and next versions in the ``__dict__`` of the version object
+    cache_key = "_history_position"
+
+    def window_subquery(self, obj) -> sa.Subquery:
+        """
+        Returns the subquery numbering the versions of the parent object of
+        given version object along with the transaction ids of their
+        neighbouring versions.
+        """
+        return history_window(obj.__class__, self.plan(obj), *self.parent_criteria(obj)).subquery()
+
+    def position_query(self, obj) -> sa.Select:
+        """
+        Returns the query that fetches the index of given version object along
+        with its previous and next versions.
+        """
+        plan = self.plan(obj)
+        window = self.window_subquery(obj)
+        previous = aliased(obj.__class__)
+        next_ = aliased(obj.__class__)
+
+        def neighbour_criteria(alias, tx_id):
+            return sa.and_(
+                getattr(alias, plan.tx_column_name) == tx_id,
+                *[getattr(alias, key) == getattr(obj, key) for key in plan.version_parent_keys],
             )
+
+        return (
+            sa.select(window.c.index, previous, next_)
+            .select_from(window)
+            .outerjoin(previous, neighbour_criteria(previous, window.c.previous_transaction_id))
+            .outerjoin(next_, neighbour_criteria(next_, window.c.next_transaction_id))
+            .where(window.c.transaction_id == getattr(obj, plan.tx_column_name))
+        )
+
+    def position(self, obj) -> tuple:
+        """
+        Returns the index, previous version and next version of given version
+        object.
+        """
+        try:
+            return obj.__dict__[self.cache_key]
+        except KeyError:
+            session = object_session(obj)
+            position = obj.__dict__[self.cache_key] = tuple(session.execute(self.position_query(obj)).one())
+            return position
+
+    async def aposition(self, obj) -> tuple:
+        """
+        Returns the index, previous version and next version of given version
+        object.
+
+        Use this when working with async SQLAlchemy.
+        """
+        try:
+            return obj.__dict__[self.cache_key]
+        except KeyError:
+            async_session = async_object_session(obj)
+            result = await async_session.execute(self.position_query(obj))
+            position = obj.__dict__[self.cache_key] = tuple(result.one())
+            return position
+
+    def previous(self, obj):
+        return self.position(obj)[1]
+
+    def index(self, obj) -> int:
+        return self.position(obj)[0]
+
+    def next(self, obj):
+        return self.position(obj)[2]
+
+    async def aprevious(self, obj):
+        return (await self.aposition(obj))[1]
+
+    async def aindex(self, obj) -> int:
+        return (await self.aposition(obj))[0]
+
+    async def anext(self, obj):
+        return (await self.aposition(obj))[2]
+
+    def _neighbour_query(self, obj, tx_id_label: str) -> sa.Select:
+        window = self.window_subquery(obj)
+        tx_column = self.plan(obj).tx_column_name
+        tx_id = sa.select(window.c[tx_id_label]).where(window.c.transaction_id == getattr(obj, tx_column))
+        return sa.select(obj.__class__).where(
+            getattr(obj.__class__, tx_column) == tx_id.scalar_subquery(), *self.parent_criteria(obj)
+        )
+
+    def previous_query(self, obj) -> sa.Select:
+        """
+        Returns the query that fetches the previous version relative to this
+        version in the version history.
+        """
+        return self._neighbour_query(obj, "previous_transaction_id")
+
+    def next_query(self, obj) -> sa.Select:
+        """
+        Returns the query that fetches the next version relative to this
+        version in the version history.
+        """
+        return self._neighbour_query(obj, "next_transaction_id")
+
+
+#: Column types compared in Python by :func:`version_changesets`. Their values can not be compared on
+#: every database (for example ``json`` columns of PostgreSQL or the LOBs Oracle uses for ``Text``),
+#: and strings would be compared according to the collation of the column (for example case
+#: insensitively by MySQL).
+PYTHON_COMPARED_TYPES = (sa.String, sa.LargeBinary, sa.JSON, sa.PickleType)
+
+
+def version_changesets(
+    session,
+    version_cls,
+    *criteria,
+    start_tx_id: t.Optional[int] = None,
+    end_tx_id: t.Optional[int] = None,
+    yield_per: int = 1000,
+) -> t.Iterator[tuple[t.Any, dict[str, list[t.Any]]]]:
+    """
+    Yield the version objects of given version class along with their
+    changesets. Each version is joined to its previous version found with the
+    ``LAG`` window function over the transaction ids, so that whole histories
+    can be streamed without fetching the previous version of every version
+    object. Columns of other types than :data:`PYTHON_COMPARED_TYPES` are
+    compared by the database. The changesets are equal to
+    ``version.changeset`` including the ``after_construct_changeset`` plugin
+    hook.
+
+    ::
+
+        for version, changeset in version_changesets(session, ArticleVersion, ArticleVersion.id == article.id):
+            ...
+
+    :param session: SQLAlchemy session object
+    :param version_cls: Version class
+    :param criteria: Criteria selecting the version histories, they should match every version of
+        a parent object (for example the primary key of the parent object) for the previous
+        versions to be available
+    :param start_tx_id: Only yield the versions created in or after this transaction
+    :param end_tx_id: Only yield the versions created in or before this transaction
+    :param yield_per: Number of rows fetched at once
+    """
+    manager = get_versioning_manager(version_cls)
+    plan = manager.plan(parent_class(version_cls))
+    internal_columns = (plan.tx_column_name, plan.end_tx_column_name, plan.operation_type_column_name)
+    column_keys = [key for key in sa.inspect(version_cls).columns.keys() if key not in internal_columns]  # noqa: SIM118
+    keys = [getattr(version_cls, key) for key in plan.version_parent_keys]
+    tx_column = getattr(version_cls, plan.tx_column_name)
+
+    if end_tx_id is not None:
+        criteria = (*criteria, tx_column <= end_tx_id)
+    # Only the transaction ids go through the window function, LOB columns can not on every database
+    window = (
+        sa.select(
+            *keys,
+            tx_column,
+            sa.func.lag(tx_column).over(partition_by=keys, order_by=tx_column).label("previous_transaction_id"),
+        )
+        .where(*criteria)
+        .subquery()
+    )
+    window_keys = list(window.c)[: len(keys) + 1]
+    previous = aliased(version_cls, flat=True)
+    previous_values = [getattr(previous, key) for key in column_keys]
+
+    changed = []
+    for key, previous_value in zip(column_keys, previous_values):
+        attr = getattr(version_cls, key)
+        if isinstance(attr.type, PYTHON_COMPARED_TYPES):
+            changed.append(sa.null())
+            continue
+        unchanged = sa.or_(attr == previous_value, sa.and_(attr.is_(None), previous_value.is_(None)))
+        changed.append(sa.case((unchanged, 0), else_=1))
+
+    query = (
+        sa.select(version_cls, *previous_values, *changed)
+        .join(window, sa.and_(*(attr == column for attr, column in zip((*keys, tx_column), window_keys))))
+        .outerjoin(
+            previous,
+            sa.and_(
+                *(getattr(previous, key) == attr for key, attr in zip(plan.version_parent_keys, keys)),
+                getattr(previous, plan.tx_column_name) == window.c.previous_transaction_id,
+            ),
+        )
+        .order_by(*keys, tx_column)
+        .execution_options(yield_per=yield_per)
+    )
+    if start_tx_id is not None:
+        query = query.where(tx_column >= start_tx_id)
+
+    for version_obj, *values in session.execute(query):
+        data = {}
+        for key, previous_value, flag in zip(column_keys, values, values[len(column_keys) :]):
+            new = getattr(version_obj, key)
+            if flag == 1 or (flag is None and previous_value != new):
+                data[key] = [previous_value, new]
+        manager.plugins.after_construct_changeset(version_obj, data)
+        yield version_obj, data
+
+
+class HistoryPrefetch:
+    """
+    Fills the ``index``, ``previous`` and ``next`` of versions of given
+    version class. Neighbours found among the given versions or in the
+    identity map of the session are wired in memory, the missing ones are
+    loaded with one query per batch. With the validity strategy the
+    neighbours among the given versions are linked through their end
+    transaction ids, the window query is only needed for the index and the
+    remaining neighbours.
+    """
+
+    #: Names of the cached properties of the version objects filled by the prefetch
+    properties = ("index", "previous", "next")
+
+    def __init__(self, manager: "VersioningManager", version_cls, versions: list, batch_size: int = 500) -> None:
+        self.version_cls = version_cls
+        self.plan = manager.plan(parent_class(version_cls))
+        self.batch_size = batch_size
+        self.versions = {self.key(version): version for version in versions}
+        self.missing = defaultdict(list)
+        mapper = sa.inspect(version_cls)
+        key_names = (*self.plan.version_parent_keys, self.plan.tx_column_name)
+        pk_names = [mapper.get_property_by_column(column).key for column in mapper.primary_key]
+        # Positions of the primary key values in the keys of the versions, if they identify a version
+        self.identity_positions = (
+            [key_names.index(name) for name in pk_names] if sorted(pk_names) == sorted(key_names) else None
         )
+
+    def key(self, version) -> tuple:
+        """Return the parent identity and transaction id of given version object."""
+        return (
+            *(getattr(version, key) for key in self.plan.version_parent_keys),
+            getattr(version, self.plan.tx_column_name),
+        )
+
+    def batches(self, keys) -> t.Iterator[list]:
+        keys = list(keys)
+        for i in range(0, len(keys), self.batch_size):
+            yield keys[i : i + self.batch_size]
+
+    def window_queries(self) -> t.Iterator[sa.Select]:
+        """Yield the queries fetching the index and neighbouring transaction ids of the versions."""
+        keys = [getattr(self.version_cls, key) for key in self.plan.version_parent_keys]
+        tx_ids = defaultdict(set)
+        for *parent_id, tx_id in self.versions:
+            tx_ids[tuple(parent_id)].add(tx_id)
+        for batch in self.batches(tx_ids):
+            window = history_window(self.version_cls, self.plan, key_criteria(keys, batch)).subquery()
+            yield sa.select(window).where(window.c.transaction_id.in_(set().union(*(tx_ids[key] for key in batch))))
+
+    def link(self) -> None:
+        """Link the versions with the neighbours found among the versions through their end transaction
+        ids. This is only possible with the validity strategy.
+        """
+        if self.plan.strategy != "validity":
+            return
+        for (*parent_id, _), version in self.versions.items():
+            if self.plan.end_tx_column_name not in version.__dict__:
+                # Expired, the window query will tell
+                continue
+            end_tx_id = version.__dict__[self.plan.end_tx_column_name]
+            if end_tx_id is None:
+                version.__dict__["next"] = None
+                continue
+            next_version = self.versions.get((*parent_id, end_tx_id))
+            if next_version is not None:
+                version.__dict__["next"] = next_version
+                next_version.__dict__["previous"] = version
+
+    def wire(self, rows) -> None:
+        """Fill the cached properties of the versions from the rows of :meth:`window_queries`."""
+        for *parent_id, tx_id, index, previous_tx_id, next_tx_id in rows:
+            version = self.versions.get((*parent_id, tx_id))
+            if version is None:
+                continue
+            version.__dict__["index"] = index
+            for name, neighbour_tx_id in (("previous", previous_tx_id), ("next", next_tx_id)):
+                if name in version.__dict__:
+                    continue
+                neighbour_key = (*parent_id, neighbour_tx_id)
+                if neighbour_tx_id is None:
+                    version.__dict__[name] = None
+                elif neighbour_key in self.versions:
+                    version.__dict__[name] = self.versions[neighbour_key]
+                else:
+                    self.missing[neighbour_key].append((version, name))
+
+    def fill_from_identity_map(self, session) -> None:
+        """Fill the cached properties of the versions with the missing neighbours already loaded into
+        given session.
+
+        :param session: SQLAlchemy session object
+        """
+        if self.identity_positions is None:
+            return
+        for key in list(self.missing):
+            identity = identity_key(self.version_cls, tuple(key[i] for i in self.identity_positions))
+            neighbour = session.identity_map.get(identity)
+            if neighbour is not None:
+                self.fill([neighbour])
+
+    def missing_queries(self) -> t.Iterator[sa.Select]:
+        """Yield the queries loading the neighbouring versions not found among the versions."""
+        columns = [getattr(self.version_cls, key) for key in (*self.plan.version_parent_keys, self.plan.tx_column_name)]
+        for batch in self.batches(self.missing):
+            yield sa.select(self.version_cls).where(key_criteria(columns, batch))
+
+    def fill(self, neighbours) -> None:
+        """Fill the cached properties of the versions with the neighbours of :meth:`missing_queries`."""
+        for neighbour in neighbours:
+            for version, name in self.missing.pop(self.key(neighbour), []):
+                version.__dict__[name] = neighbour
+
+
+def history_prefetches(versions: list, batch_size: int = 500) -> list[HistoryPrefetch]:
+    by_class = defaultdict(list)
+    for version in versions:
+        if not all(name in version.__dict__ for name in HistoryPrefetch.properties):
+            by_class[version.__class__].append(version)
+    return [
+        HistoryPrefetch(get_versioning_manager(version_cls), version_cls, class_versions, batch_size)
+        for version_cls, class_versions in by_class.items()
+    ]
+
+
+def prefetch_history(versions: list, batch_size: int = 500) -> None:
+    """
+    Fetch the ``index``, ``previous`` and ``next`` of given version objects in
+    bulk so that accessing them, and the ``changeset`` depending on them,
+    issues no further queries. Consecutive versions found in the given list
+    or already loaded into the session are wired together in memory, the
+    other neighbours are loaded with one query per version class.
+
+    ::
+
+        versions = article.versions.all()
+        prefetch_history(versions)
+        changesets = [version.changeset for version in versions]
+
+    :param versions: List of version objects
+    :param batch_size: Maximum number of parent objects or neighbours per query
+    """
+    if not versions:
+        return
+    session = object_session(versions[0])
+    for prefetch in history_prefetches(versions, batch_size):
+        prefetch.link()
+        for query in prefetch.window_queries():
+            prefetch.wire(session.execute(query))
+        prefetch.fill_from_identity_map(session)
+        for query in prefetch.missing_queries():
+            prefetch.fill(session.scalars(query))
+
+
+async def aprefetch_history(versions: list, batch_size: int = 500) -> None:
+    """
+    Fetch the ``aindex``, ``aprevious`` and ``anext`` of given version objects
+    in bulk, see :func:`prefetch_history`.
+
+    Use this when working with async SQLAlchemy.
+
+    :param versions: List of version objects
+    :param batch_size: Maximum number of parent objects or neighbours per query
+    """
+    if not versions:
+        return
+    async_session = async_object_session(versions[0])
+    for prefetch in history_prefetches(versions, batch_size):
+        prefetch.link()
+        for query in prefetch.window_queries():
+            prefetch.wire(await async_session.execute(query))
+        prefetch.fill_from_identity_map(async_session.sync_session)
+        for query in prefetch.missing_queries():
+            prefetch.fill(await async_session.scalars(query))
+
+
+class VersionHistory:
+    """
+    Iterates over the versions of a versioned object in pages. Each page is
+    fetched with a keyset predicate on the transaction id of the last version
+    of the previous page instead of an OFFSET, so every page is read from the
+    primary key index of the version table however long the history is.
+
+    ::
+
+        for version in VersionHistory(article):
+            ...
+
+        # The ten latest versions, newest first
+        VersionHistory(article).latest(10)
+
+        # The versions created after transaction 1000, newest first
+        for version in VersionHistory(article).since(1000).reverse():
+            ...
+
+    With async SQLAlchemy use ``async for`` along with :meth:`apages` and
+    :meth:`alatest`, the pages are read with ``AsyncSession.stream_scalars``.
+
+    :param obj: Versioned object
+    :param page_size: Number of versions fetched per query
+    """
+
+    def __init__(self, obj, page_size: int = 1000) -> None:
+        self.obj = obj
+        self.plan = get_versioning_manager(obj).plan(obj.__class__)
+        self.parent_criteria = [
+            getattr(self.plan.version_cls, key) == getattr(obj, key) for key in self.plan.version_parent_keys
+        ]
+        self.page_size = page_size
+        self.descending = False
+        self.since_tx_id = None
+        self.before_tx_id = None
+
+    def _clone(self, **kwargs) -> "VersionHistory":
+        history = copy(self)
+        history.__dict__.update(kwargs)
+        return history
+
+    def since(self, tx_id: int) -> "VersionHistory":
+        """Return the history limited to the versions created after given transaction."""
+        return self._clone(since_tx_id=tx_id)
+
+    def before(self, tx_id: int) -> "VersionHistory":
+        """Return the history limited to the versions created before given transaction."""
+        return self._clone(before_tx_id=tx_id)
+
+    def reverse(self) -> "VersionHistory":
+        """Return the history iterating the versions in reverse order."""
+        return self._clone(descending=not self.descending)
+
+    def query(self, after_tx_id: t.Optional[int] = None, limit: t.Optional[int] = None) -> sa.Select:
+        """
+        Returns the query that fetches the page of versions following the
+        version created in given transaction.
+        """
+        version_cls = self.plan.version_cls
+        tx_column = getattr(version_cls, self.plan.tx_column_name)
+        criteria = list(self.parent_criteria)
+        if self.since_tx_id is not None:
+            criteria.append(tx_column > self.since_tx_id)
+        if self.before_tx_id is not None:
+            criteria.append(tx_column < self.before_tx_id)
+        if after_tx_id is not None:
+            criteria.append(tx_column < after_tx_id if self.descending else tx_column > after_tx_id)
+        return (
+            sa.select(version_cls)
+            .where(*criteria)
+            .order_by(tx_column.desc() if self.descending else tx_column)
+            .limit(limit or self.page_size)
+        )
+
+    def _next_tx_id(self, page: list) -> t.Optional[int]:
+        if len(page) < self.page_size:
+            return None
+        return getattr(page[-1], self.plan.tx_column_name)
+
+    def pages(self) -> t.Iterator[list]:
+        """Yield the versions in lists of at most ``page_size`` versions."""
+        session = object_session(self.obj)
+        after_tx_id = None
+        while True:
+            page = session.scalars(self.query(after_tx_id)).all()
+            if page:
+                yield page
+            after_tx_id = self._next_tx_id(page)
+            if after_tx_id is None:
+                return
+
+    def __iter__(self) -> t.Iterator:
+        for page in self.pages():
+            yield from page
+
+    def latest(self, n: int) -> list:
+        """Return the ``n`` latest versions, newest first."""
+        session = object_session(self.obj)
+        return session.scalars(self._clone(descending=True).query(limit=n)).all()
+
+    async def apages(self) -> t.AsyncIterator[list]:
+        """
+        Yield the versions in lists of at most ``page_size`` versions.
+
+        Use this when working with async SQLAlchemy.
+        """
+        async_session = async_object_session(self.obj)
+        after_tx_id = None
+        while True:
+            result = await async_session.stream_scalars(self.query(after_tx_id))
+            page = [version async for version in result]
+            if page:
+                yield page
+            after_tx_id = self._next_tx_id(page)
+            if after_tx_id is None:
+                return
+
+    async def __aiter__(self) -> t.AsyncIterator:
+        async for page in self.apages():
+            for version in page:
+                yield version
+
+    async def alatest(self, n: int) -> list:
+        """
+        Return the ``n`` latest versions, newest first.
+
+        Use this when working with async SQLAlchemy.
+        """
+        async_session = async_object_session(self.obj)
+        result = await async_session.stream_scalars(self._clone(descending=True).query(limit=n))
+        return [version async for version in result]
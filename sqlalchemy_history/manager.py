@@ -8,6 +8,8 @@ The Module contains following Class
 """
 
 from functools import wraps
+from itertools import chain
+from types import MappingProxyType
 
 import sqlalchemy as sa
 from sqlalchemy.orm import object_session
@@ -15,12 +17,13 @@ from sqlalchemy.orm.exc import UnmappedColumnError
 from sqlalchemy_utils import get_column_key
 
 from sqlalchemy_history.builder import Builder
-from sqlalchemy_history.fetcher import SubqueryFetcher, ValidityFetcher
+from sqlalchemy_history.fetcher import SubqueryFetcher, ValidityFetcher, WindowFetcher
 from sqlalchemy_history.operation import Operation
+from sqlalchemy_history.plan import VersioningPlan
 from sqlalchemy_history.plugins import PluginCollection
 from sqlalchemy_history.transaction import TransactionFactory
 from sqlalchemy_history.unit_of_work import UnitOfWork
-from sqlalchemy_history.utils import is_modified, is_versioned
+from sqlalchemy_history.utils import changed_versioned_keys, is_versioned
 
 
 def tracked_operation(func):
@@ -30,7 +33,12 @@ def tracked_operation(func):
             return None
         session = object_session(target)
         conn = session.connection()
-        uow = self.get_uow(conn)
+        try:
+            uow = self.get_uow(conn)
+        except KeyError:
+            # before_flush skipped creating a unit of work as the flush had no versioned changes
+            # when it started.
+            uow = self.unit_of_work(session)
         return func(self, uow, target)
 
     return wrapper
@@ -51,6 +59,9 @@ class VersioningManager:
     :param plugins: Versioning plugins that listen the events invoked by the manager.
     :param builder: Builder object which handles the building of versioning tables and
             models.
+    :param transaction_id_allocator: TransactionIdAllocator object used to assign transaction ids
+            in-process. If None, the id of each transaction is fetched by flushing the Transaction
+            object as soon as the transaction is created.
 
     """
 
@@ -62,6 +73,7 @@ class VersioningManager:
         options=None,
         plugins=None,
         builder=None,
+        transaction_id_allocator=None,
     ):
         if options is None:
             options = {}
@@ -71,6 +83,8 @@ class VersioningManager:
         else:
             self.builder = builder
         self.builder.manager = self
+        # Mappers and engines the operation tracking listeners have been attached to
+        self.tracked_mappers = []
         self.reset()
         if transaction_cls is not None:
             self.transaction_cls = transaction_cls
@@ -78,6 +92,7 @@ class VersioningManager:
             self.transaction_cls = TransactionFactory()
         if user_cls is not None:
             self.user_cls = user_cls
+        self.transaction_id_allocator = transaction_id_allocator
 
         self.options = {
             "versioning": True,
@@ -93,6 +108,10 @@ class VersioningManager:
             "operation_type_column_name": "operation_type",
             "strategy": "validity",
             "use_module_name": False,
+            "write_mode": "orm",
+            "streaming": False,
+            "fetcher": "auto",
+            "indexes": "default",
         }
         if plugins is None:
             self.plugins = []
@@ -109,6 +128,8 @@ class VersioningManager:
         self._plugins = PluginCollection(plugin_collection)
 
     def fetcher(self, obj):
+        if self.option(obj, "fetcher") == "window":
+            return WindowFetcher(self)
         if self.option(obj, "strategy") == "subquery":
             return SubqueryFetcher(self)
         return ValidityFetcher(self)
@@ -140,11 +161,16 @@ class VersioningManager:
         self.version_table_map = {}  # Key is the parent table, Value is the version table
         self.declarative_base = None
         self.version_class_map = {}  # Key is the parent model, Value is the version model
+        self.parent_table_map = {}  # Key is the version table, Value is the parent table
+        self.parent_class_map = {}  # Key is the version model, Value is the parent model
+        self.plans = {}  # Key is the parent model, Value is its VersioningPlan
+        # Key is the schema qualified name of an association table, Value is its version table
+        self.association_tables = MappingProxyType({})
         self.session_listeners = {
             "before_flush": self.before_flush,
             "after_flush": self.after_flush,
-            "after_commit": self.clear,
-            "after_rollback": self.clear,
+            "after_commit": self.after_commit,
+            "after_rollback": self.after_rollback,
         }
         self.mapper_listeners = {
             "after_delete": self.track_deletes,
@@ -170,6 +196,20 @@ class VersioningManager:
             self.transaction_cls = self.transaction_cls(self)
         return self.transaction_cls
 
+    def plan(self, cls):
+        """Return the VersioningPlan of given versioned class.
+
+        Plans are built by the builder when the versioned classes are configured. Plans of classes
+        which were not configured through the builder are built on first use.
+
+        :param cls: SQLAlchemy versioned declarative class
+        """
+        try:
+            return self.plans[cls]
+        except KeyError:
+            plan = self.plans[cls] = VersioningPlan(self, cls)
+            return plan
+
     def is_excluded_column(self, model, column):
         try:
             key = get_column_key(model, column)
@@ -253,6 +293,26 @@ class VersioningManager:
         for event_name, listener in self.mapper_listeners.items():
             sa.event.remove(mapper, event_name, listener)
 
+    def track_versioned_class(self, cls):
+        """Attach the operation tracking listeners to the mapper of given versioned class.
+
+        The listeners are only attached to the mappers of versioned classes so that inserts, updates and
+        deletes of non versioned classes are not intercepted at all.
+
+        :param cls: SQLAlchemy versioned declarative class
+
+        """
+        mapper = sa.inspect(cls)
+        if mapper not in self.tracked_mappers:
+            self.track_operations(mapper)
+            self.tracked_mappers.append(mapper)
+
+    def remove_tracking(self):
+        """Remove the operation tracking listeners from all versioned mappers."""
+        for mapper in self.tracked_mappers:
+            self.remove_operations_tracking(mapper)
+        self.tracked_mappers = []
+
     def track_session(self, session):
         """Attach listeners that track the operations (flushing, committing and
         rolling back) of given session.
@@ -282,7 +342,7 @@ class VersioningManager:
 
         Whenever object is inserted it is added to this UnitOfWork's internal operations dictionary.
         """
-        uow.operations.add_insert(target)
+        uow.operations.add_insert(target, changed_versioned_keys(target))
 
     @tracked_operation
     def track_updates(self, uow, target):
@@ -290,9 +350,10 @@ class VersioningManager:
 
         Whenever object is updated it is added to this UnitOfWork's internal operations dictionary.
         """
-        if not is_modified(target):
+        changed_keys = changed_versioned_keys(target)
+        if not changed_keys:
             return
-        uow.operations.add_update(target)
+        uow.operations.add_update(target, changed_keys)
 
     @tracked_operation
     def track_deletes(self, uow, target):
@@ -318,6 +379,21 @@ class VersioningManager:
         self.units_of_work[conn] = uow
         return uow
 
+    def has_versioned_changes(self, session):
+        """Return whether or not given session has pending changes the versioning has to look at.
+
+        This is the case if any of the new, dirty or deleted objects of the session is versioned or if
+        any of the plugins returns that session has been modified. Unlike `is_session_modified` this
+        does not inspect the attribute histories and thus serves as a cheap check for flushes that
+        contain no versioned work at all.
+
+        :param session: SQLAlchemy session object
+
+        """
+        return any(is_versioned(obj) for obj in chain(session.new, session.dirty, session.deleted)) or any(
+            self.plugins.is_session_modified(session)
+        )
+
     def before_flush(self, session, flush_context, instances):
         """Before flush listener for SQLAlchemy sessions.
         If this manager has versioning enabled this listener invokes the process before flush of associated
@@ -331,6 +407,9 @@ class VersioningManager:
         if not self.options["versioning"]:
             return
 
+        if not self.has_versioned_changes(session):
+            return
+
         uow = self.unit_of_work(session)
         uow.process_before_flush(session)
 
@@ -346,9 +425,40 @@ class VersioningManager:
         """
         if not self.options["versioning"]:
             return
+        if session.connection() not in self.units_of_work:
+            # Neither this flush nor an earlier one of the transaction had versioned changes
+            return
         uow = self.unit_of_work(session)
         uow.process_after_flush(session)
 
+    def after_commit(self, session):
+        """After commit listener for SQLAlchemy sessions.
+
+        Invokes the after_commit hook of the plugins for the UnitOfWork associated with given session,
+        also when only a savepoint was released, and clears it.
+
+        :param session: SQLAlchemy session object
+
+        """
+        uow = self.units_of_work.get(self.session_connection_map.get(session))
+        if uow is not None:
+            self.plugins.after_commit(uow, session)
+        self.clear(session)
+
+    def after_rollback(self, session):
+        """After rollback listener for SQLAlchemy sessions.
+
+        Invokes the after_rollback hook of the plugins for the UnitOfWork associated with given session,
+        also when only a savepoint was rolled back, and clears it.
+
+        :param session: SQLAlchemy session object
+
+        """
+        uow = self.units_of_work.get(self.session_connection_map.get(session))
+        if uow is not None:
+            self.plugins.after_rollback(uow, session)
+        self.clear(session)
+
     def clear(self, session):
         """Simple SQLAlchemy listener that is being invoked after successful transaction commit or when
          transaction rollback occurs.
@@ -391,7 +501,7 @@ class VersioningManager:
                 del self.units_of_work[connection]
 
     def append_association_operation(self, conn, table_name, params, op):
-        """Append history association operation to pending_statements list.
+        """Append history association operation to the pending association rows of the unit of work.
 
         :param conn:
         :param table_name:
@@ -399,13 +509,15 @@ class VersioningManager:
         :param op:
 
         """
-        stmt = (
-            self.metadata.tables[self.options["table_name"] % table_name]
-            .insert()
-            .values({**params, "operation_type": op})
-        )
-        uow = self.get_uow(conn)
-        uow.pending_statements.append(stmt)
+        table = self.association_tables[table_name]
+        try:
+            uow = self.get_uow(conn)
+        except KeyError:
+            # The association rows were changed before any versioned flush of the transaction, for
+            # example with session.execute(). The unit of work keeps them until the next flush with
+            # versioned changes writes their versions.
+            uow = self.units_of_work[conn] = self.uow_class(self)
+        uow.pending_association_rows[table].append({**params, self.options["operation_type_column_name"]: op})
 
     def track_cloned_connections(self, c, opt):
         """Track cloned connections from association tables.
@@ -427,7 +539,7 @@ class VersioningManager:
         We use it to track operations on tables which are not mapped to a ORM model.
 
         This is mainly used to generate the history of association tables by adding
-        those operations to pending_statements list.
+        those operations to the pending association rows of the unit of work.
         If we later want to track datatables also we may need to handle autoincrement and Edit operations
         FOr now, assoc tables will never have autoincrement nor do they modify an existing record
 
@@ -449,25 +561,10 @@ class VersioningManager:
             op = Operation.DELETE
 
         if op is not None:
-            table_name = (
-                context.invoked_statement.table.schema + "." + context.invoked_statement.table.name
-                if context.invoked_statement.table.schema
-                else context.invoked_statement.table.name
-            )
-            # ORM tables are tracked using `mapper_listeners`. We only need to track table which do not
-            #  have mappers here
-            orm_tracked_tables = {
-                c.__table__
-                for c in self.version_class_map
-                # NOTE: We add hasattr(c, '__table__') cause some ORM may not have a physical table
-                #  associated to them
-                if hasattr(c, "__table__")
-            }
-            table_names = [
-                table.name if not table.schema else table.schema + "." + table.name
-                for table in self.version_table_map
-                if table not in orm_tracked_tables
-            ]
-            if table_name in table_names:
+            table = context.invoked_statement.table
+            table_name = table.schema + "." + table.name if table.schema else table.name
+            # ORM tables are tracked using `mapper_listeners`. Only tables without mappers are part of
+            # the association table index.
+            if table_name in self.association_tables:
                 for params in context.compiled_parameters:
                     self.append_association_operation(conn, table_name, params, op)
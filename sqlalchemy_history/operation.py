@@ -1,7 +1,7 @@
 """Operations module contains Operation Class."""
 
 from collections import OrderedDict
-from copy import copy
+from itertools import chain
 
 import sqlalchemy as sa
 from sqlalchemy_utils import identity
@@ -12,9 +12,12 @@ class Operation:
     UPDATE = 1
     DELETE = 2
 
-    def __init__(self, target, type_):
+    def __init__(self, target, type_, changed_keys=frozenset()):
         self.target = target
         self.type = type_
+        # Keys of the versioned properties of the target changed by this operation, captured once
+        # when the operation is recorded.
+        self.changed_keys = changed_keys
         self.processed = False
 
     def __eq__(self, other):
@@ -25,27 +28,50 @@ class Operation:
 
 
 class Operations:
-    """A collection of operations"""
+    """A collection of operations
 
-    def __init__(self):
+    Besides all operations of the current transaction, the collection keeps a queue of the
+    operations which have not been processed yet, so that each flush only has to look at the
+    operations recorded since the previous flush.
+
+    Processed operations can be released with :meth:`release_processed`. Only their keys and
+    operation types are kept, which is enough to determine the type of later operations on the
+    same objects.
+    """
+
+    def __init__(self, manager=None):
+        self.manager = manager
         self.objects = OrderedDict()
+        self.unprocessed = OrderedDict()
+        self.released = {}
+        self._entities = set()
 
     def format_key(self, target):
         # We cannot use target._sa_instance_state.identity here since object's
         # identity is not yet updated at this phase
-        return (target.__class__, identity(target))
+        if self.manager is None:
+            return (target.__class__, identity(target))
+        return (target.__class__, self.manager.plan(target.__class__).identity(target))
 
     def __contains__(self, target):
-        return self.format_key(target) in self.objects
+        key = self.format_key(target)
+        return key in self.objects or key in self.released
 
     def __setitem__(self, key, operation):
         self.objects[key] = operation
+        self._entities.add(key[0])
+        if operation.processed:
+            self.unprocessed.pop(key, None)
+        else:
+            self.unprocessed[key] = operation
 
     def __getitem__(self, key):
         return self.objects[key]
 
     def __delitem__(self, key):
         del self.objects[key]
+        self.unprocessed.pop(key, None)
+        self._entities = {key[0] for key in chain(self.objects, self.released)}
 
     def __bool__(self):
         return bool(self.objects)
@@ -62,37 +88,81 @@ class Operations:
 
         :param session: SQLAlchemy session object
         """
-        return {key[0] for key, _ in self.items()}
+        return set(self._entities)
 
     def items(self):
         return self.objects.items()
 
-    def add(self, operation):
-        self[self.format_key(operation.target)] = operation
+    def pop_unprocessed(self):
+        """Return the operations which have not been processed yet in the order they were first
+        recorded and clear the queue of unprocessed operations.
+        """
+        operations = list(self.unprocessed.values())
+        self.unprocessed.clear()
+        return operations
+
+    def operation_type(self, key):
+        """Return the type of the operation recorded for given key, even if it has been released.
+
+        :param key: Key of the operation as returned by :meth:`format_key`
+        """
+        try:
+            return self.objects[key].type
+        except KeyError:
+            return self.released[key]
+
+    def release_processed(self):
+        """Drop the references to the processed operations and their targets, keeping only their
+        keys and operation types.
+        """
+        for key, operation in list(self.objects.items()):
+            if operation.processed:
+                self.released[key] = operation.type
+                del self.objects[key]
 
-    def add_insert(self, target):
+    def changed_keys(self, target):
+        """Return the keys of the versioned properties of given target changed by its operation.
+
+        :param target: Target object of a recorded operation
+        """
+        return self.objects[self.format_key(target)].changed_keys
+
+    def collection_keys(self, target):
+        """Return the keys of the one-to-many and many-to-many relationships of given target."""
+        if self.manager is not None:
+            return self.manager.plan(target.__class__).collection_keys
+        return {
+            key
+            for key, relationship in sa.inspect(target.__class__).relationships.items()
+            if relationship.direction.name in ("ONETOMANY", "MANYTOMANY")
+        }
+
+    def add(self, operation):
+        key = self.format_key(operation.target)
+        previous = self.unprocessed.get(key)
+        if previous is not None:
+            # The target changed again within the same flush
+            operation.changed_keys = previous.changed_keys | operation.changed_keys
+        self[key] = operation
+
+    def add_insert(self, target, changed_keys=frozenset()):
         if target in self:
             # If the object is deleted and then inserted within the same
             # transaction we are actually dealing with an update.
-            self.add(Operation(target, Operation.UPDATE))
+            self.add(Operation(target, Operation.UPDATE, changed_keys))
         else:
-            self.add(Operation(target, Operation.INSERT))
-
-    def add_update(self, target):
-        state_copy = copy(sa.inspect(target).committed_state)
-        relationships = sa.inspect(target.__class__).relationships
-        # Remove all ONETOMANY and MANYTOMANY relationships
-        for rel_key, relationship in relationships.items():
-            if relationship.direction.name in ["ONETOMANY", "MANYTOMANY"] and rel_key in state_copy:
-                del state_copy[rel_key]
+            self.add(Operation(target, Operation.INSERT, changed_keys))
 
-        if state_copy:
+    def add_update(self, target, changed_keys=frozenset()):
+        collection_keys = self.collection_keys(target)
+        # Changes of ONETOMANY and MANYTOMANY relationships alone do not change the row
+        if any(key not in collection_keys for key in sa.inspect(target).committed_state):
             if target in self:
                 # If already in current transaction and some event hook did a update
                 # prior to commit hook, continue with operation type as it is
-                self.add(Operation(target, self[self.format_key(target)].type))
+                self.add(Operation(target, self.operation_type(self.format_key(target)), changed_keys))
             else:
-                self.add(Operation(target, Operation.UPDATE))
+                self.add(Operation(target, Operation.UPDATE, changed_keys))
 
     def add_delete(self, target):
         self.add(Operation(target, Operation.DELETE))
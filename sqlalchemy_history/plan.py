@@ -0,0 +1,120 @@
+"""Plan module holds the versioning configuration of versioned classes precomputed for the write path."""
+
+import typing as t
+
+import sqlalchemy as sa
+from sqlalchemy.orm.exc import UnmappedColumnError
+from sqlalchemy_utils import get_primary_keys
+
+from sqlalchemy_history.utils import versioned_column_properties, versioned_relationships
+
+
+if t.TYPE_CHECKING:
+    from sqlalchemy_history.manager import VersioningManager
+
+
+class VersioningPlan:
+    """Immutable versioning configuration of a versioned class.
+
+    Plans are built by the Builder once the version classes have been configured. The UnitOfWork,
+    Operations, fetchers and plugins read the options, versioned properties and primary keys of a
+    class from its plan instead of resolving options and inspecting mappers for every changed object
+    in every flush.
+
+    :param manager: VersioningManager of the versioned class
+    :param cls: Versioned SQLAlchemy declarative class
+    """
+
+    __slots__ = (
+        "cls",
+        "collection_keys",
+        "column_keys",
+        "column_properties",
+        "end_tx_column_name",
+        "operation_type_column_name",
+        "primary_keys",
+        "strategy",
+        "tracked_keys",
+        "tx_column_name",
+        "validity_tables",
+        "version_cls",
+        "version_parent_keys",
+    )
+
+    def __init__(self, manager: "VersioningManager", cls) -> None:
+        set_ = object.__setattr__
+        set_(self, "cls", cls)
+        set_(self, "version_cls", manager.version_class_map.get(cls))
+        set_(self, "tx_column_name", manager.option(cls, "transaction_column_name"))
+        set_(self, "end_tx_column_name", manager.option(cls, "end_transaction_column_name"))
+        set_(self, "operation_type_column_name", manager.option(cls, "operation_type_column_name"))
+        set_(self, "strategy", manager.option(cls, "strategy"))
+        column_properties = tuple(versioned_column_properties(cls))
+        set_(self, "column_properties", column_properties)
+        set_(self, "column_keys", tuple(prop.key for prop in column_properties))
+        # Keys whose changes make an update versioned: the versioned columns and the relationships
+        # backed by them. One-to-many and many-to-many relationships do not change the row itself.
+        set_(
+            self,
+            "tracked_keys",
+            frozenset(self.column_keys).union(prop.key for prop in versioned_relationships(cls, self.column_keys)),
+        )
+        set_(
+            self,
+            "collection_keys",
+            frozenset(
+                key
+                for key, prop in sa.inspect(cls).relationships.items()
+                if prop.direction.name in ("ONETOMANY", "MANYTOMANY")
+            ),
+        )
+        set_(
+            self,
+            "primary_keys",
+            tuple(get_primary_keys(cls)),
+        )
+        version_parent_keys = ()
+        validity_tables = []
+        if self.version_cls is not None:
+            mapper = sa.inspect(self.version_cls)
+            version_parent_keys = tuple(key for key in get_primary_keys(self.version_cls) if key != self.tx_column_name)
+            # Version tables of the version class and its versioned base classes along with the
+            # version class attributes making up the version key of each table. Tables of concrete
+            # base classes are not mapped by the version class and thus skipped.
+            version_classes = set(manager.version_class_map.values())
+            validity_tables = []
+            for class_ in mapper.class_.__mro__:
+                if class_ not in version_classes:
+                    continue
+                table = class_.__table__
+                try:
+                    key_attrs = tuple(
+                        mapper.get_property_by_column(column).key
+                        for column in table.primary_key
+                        if column.name != self.tx_column_name
+                    )
+                except UnmappedColumnError:
+                    continue
+                validity_tables.append((table, key_attrs))
+        set_(self, "version_parent_keys", version_parent_keys)
+        set_(self, "validity_tables", tuple(validity_tables))
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.cls.__name__}>"
+
+    def identity(self, obj) -> tuple:
+        """Return the primary key values of given versioned object.
+
+        :param obj: Object of the versioned class
+        """
+        return tuple(getattr(obj, key) for key in self.primary_keys)
+
+    def version_parent_identity(self, version_obj) -> tuple:
+        """Return the primary key values of the parent object of given version object.
+
+        :param version_obj: Object of the version class
+        """
+        return tuple(getattr(version_obj, key) for key in self.version_parent_keys)
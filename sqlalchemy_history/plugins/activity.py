@@ -150,19 +150,51 @@ target is the given article.
 ... ).all()
 ```
 
+#### Activity feeds
+
+The activity table is indexed by (object_type, object_id, id) and
+(target_type, target_id, id), which can be turned off with the `object_index`
+and `target_index` arguments of the plugin. The `feed_query` method of the
+plugin returns a page of activities, newest first, optionally filtered by
+object or target, verb and actor. Pages are keyset paginated by activity id
+instead of using OFFSET:
+
+```python
+>>> page = session.scalars(activity_plugin.feed_query(article, limit=20)).all()
+>>> next_page = session.scalars(
+...     activity_plugin.feed_query(article, limit=20, before_id=page[-1].id)
+... ).all()
+```
+
+Rendering a feed usually accesses the objects and targets of the activities and
+their versions. `load_related` loads them with one query per type instead of
+one query per activity and attribute. It returns the loaded objects, which have
+to stay referenced while the feed is rendered as the session only keeps weak
+references to them:
+
+```python
+>>> related = activity_plugin.load_related(session, page)
+>>> [activity.object_version.name for activity in page]  # No further queries
+```
+
 #### Also Read
 - [_activity stream specification](http://www.activitystrea.ms)
 - [_generic relationships](https://sqlalchemy-utils.readthedocs.io/en/latest/generic_relationship.html)
 """  # noqa: E501
 
+from collections import defaultdict
+from itertools import chain
+
 import sqlalchemy as sa
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.inspection import inspect
 from sqlalchemy.orm import backref, object_session, relationship
+from sqlalchemy.orm.util import identity_key
 from sqlalchemy_utils import JSONType, generic_relationship
 
 from sqlalchemy_history.factory import ModelFactory
 from sqlalchemy_history.plugins.base import Plugin
+from sqlalchemy_history.schema import key_criteria
 from sqlalchemy_history.utils import version_class, version_obj
 
 
@@ -184,6 +216,20 @@ class ActivityBase:
 class ActivityFactory(ModelFactory):
     model_name = "Activity"
 
+    def __init__(self, *, object_index=True, target_index=True):
+        self.object_index = object_index
+        self.target_index = target_index
+
+    def table_args(self):
+        """Return the indexes serving the lookups of the activities of given object or target in id
+        order."""
+        args = []
+        if self.object_index:
+            args.append(sa.Index("ix_activity_object", "object_type", "object_id", "id"))
+        if self.target_index:
+            args.append(sa.Index("ix_activity_target", "target_type", "target_id", "id"))
+        return tuple(args)
+
     def create_class(self, manager):
         """Create Activity class.
 
@@ -193,6 +239,7 @@ class ActivityFactory(ModelFactory):
 
         class Activity(manager.declarative_base, ActivityBase):
             __tablename__ = "activity"
+            __table_args__ = self.table_args()
             manager = self
 
             transaction_id = sa.Column(sa.BigInteger, index=True, nullable=False)
@@ -268,27 +315,190 @@ class ActivityFactory(ModelFactory):
 
 
 class ActivityPlugin(Plugin):
+    """
+    :param object_index: Whether or not to index the activities by (object_type, object_id, id)
+    :param target_index: Whether or not to index the activities by (target_type, target_id, id)
+    """
+
     activity_cls = None
 
+    def __init__(self, *, object_index=True, target_index=True):
+        self.object_index = object_index
+        self.target_index = target_index
+
     def after_build_models(self, manager):
-        self.activity_cls = ActivityFactory()(manager)
+        self.activity_cls = ActivityFactory(object_index=self.object_index, target_index=self.target_index)(manager)
         manager.activity_cls = self.activity_cls
 
+    def load_related(self, session, activities, batch_size=500):
+        """Load the objects, targets and their versions of given activities in batches.
+
+        The activities are grouped by object and target type and the parent objects of each type are
+        loaded with one IN query, the versions of each type with one query over the (id, tx_id) pairs.
+        Afterwards accessing `object`, `object_version`, `target` and `target_version` of the activities
+        is served from the identity map of the session. The identity map only holds weak references,
+        so the returned list of loaded objects has to be kept for as long as the activities are used.
+
+        ```python
+        >>> activities = session.scalars(activity_plugin.feed_query(article)).all()
+        >>> related = activity_plugin.load_related(session, activities)
+        ```
+
+        :param session: SQLAlchemy session the activities belong to
+        :param activities: Activity objects
+        :param batch_size: Maximum number of objects loaded with a single query (Default value = 500)
+        :returns: List of the loaded objects and versions
+        """
+        classes = {mapper.class_.__name__: mapper.class_ for mapper in inspect(self.activity_cls).registry.mappers}
+        # Key is the class name, Value is the set of identities to load
+        identities = defaultdict(set)
+        for activity in activities:
+            for type_, id_, tx_id in (
+                (activity.object_type, activity.object_id, activity.object_tx_id),
+                (activity.target_type, activity.target_id, activity.target_tx_id),
+            ):
+                if type_ is None or id_ is None:
+                    continue
+                identities[type_].add((id_,))
+                if tx_id is not None:
+                    identities[type_ + "Version"].add((id_, tx_id))
+
+        loaded = {}
+        for name, keys in identities.items():
+            cls = classes.get(name)
+            if cls is None:
+                continue
+            mapper = inspect(cls)
+            missing = []
+            for key in keys:
+                obj = session.identity_map.get(identity_key(cls, key))
+                if obj is None:
+                    missing.append(key)
+                else:
+                    loaded[name, key] = obj
+            pk_attrs = [getattr(cls, mapper.get_property_by_column(column).key) for column in mapper.primary_key]
+            for i in range(0, len(missing), batch_size):
+                for obj in session.scalars(sa.select(cls).where(key_criteria(pk_attrs, missing[i : i + batch_size]))):
+                    loaded[name, inspect(obj).identity] = obj
+
+        return list(loaded.values())
+
+    def feed_query(self, obj=None, *, verb=None, actor=None, before_id=None, limit=50):
+        """Return a query fetching a page of the activity feed, newest activities first.
+
+                Pages are keyset paginated by activity id: the next page is fetched by passing the id of the
+                last activity of the current page as `before_id`, so that deep pages cost the same as the first
+                one. Activities of given object are read from the (type, id) indexes of the activity table with one
+        limited subquery per index, whose union is then ordered and limited once more.
+
+                ```python
+                >>> page = session.scalars(activity_plugin.feed_query(article)).all()
+                >>> next_page = session.scalars(activity_plugin.feed_query(article, before_id=page[-1].id)).all()
+                ```
+
+                :param obj: Only include the activities having given object as their object or target. A
+                        `ValueError` is raised if the object has not been saved or has a composite primary key.
+                :param verb: Only include the activities with given verb
+                :param actor: Only include the activities of the transactions of given user
+                :param before_id: Only include the activities with an id lower than this one
+                :param limit: Maximum number of activities in the page (Default value = 50)
+        """
+        Activity = self.activity_cls  # noqa: N806
+        criteria = []
+        if verb is not None:
+            criteria.append(Activity.verb == verb)
+        if actor is not None:
+            criteria.append(Activity.transaction.has(user=actor))
+        if before_id is not None:
+            criteria.append(Activity.id < before_id)
+        if obj is None:
+            return sa.select(Activity).where(*criteria).order_by(Activity.id.desc()).limit(limit)
+
+        state = inspect(obj)
+        if len(state.mapper.primary_key) > 1:
+            raise ValueError(
+                f"Activities reference objects by a single primary key, {type(obj).__name__} has a composite one."
+            )
+        if state.identity is None:
+            raise ValueError(f"{obj!r} has not been saved, it has no activities.")
+        object_type = type(obj).__name__
+        object_id = state.identity[0]
+        # Each side is read from its own index in id order and limited on its own. Matching both
+        # sides with OR would prevent the use of either index.
+        pages = [
+            sa.select(Activity.id)
+            .where(type_column == object_type, id_column == object_id, *criteria)
+            .order_by(Activity.id.desc())
+            .limit(limit)
+            .subquery()
+            for type_column, id_column in [
+                (Activity.object_type, Activity.object_id),
+                (Activity.target_type, Activity.target_id),
+            ]
+        ]
+        ids = sa.union_all(*[sa.select(page.c.id) for page in pages])
+        return sa.select(Activity).where(Activity.id.in_(ids)).order_by(Activity.id.desc()).limit(limit)
+
     def is_session_modified(self, session):
-        """Return that the session has been modified if the session contains an
-        activity class.
+        """Return that the session has been modified if the session contains a
+        new or modified activity.
 
         :param session: SQLAlchemy session object
 
         """
-        return any(isinstance(obj, self.activity_cls) for obj in session)
+        return any(isinstance(obj, self.activity_cls) for obj in chain(session.new, session.dirty))
 
     def before_flush(self, uow, session):
-        for obj in session:
-            if isinstance(obj, self.activity_cls):
-                obj.transaction = uow.current_transaction
-                obj.calculate_target_tx_id()
-                obj.calculate_object_tx_id()
+        activities = [obj for obj in chain(session.new, session.dirty) if isinstance(obj, self.activity_cls)]
+        if activities:
+            self.calculate_tx_ids(uow, session, activities)
+
+    def calculate_tx_ids(self, uow, session, activities, batch_size=500):
+        """Assign the current transaction and the object and target transaction ids of given activities.
+
+        The transaction id of an object versioned earlier in the current transaction is read from the
+        version objects of the UnitOfWork. The last transaction ids of the remaining objects are selected
+        with one grouped query per object class and batch of objects.
+
+        :param uow: UnitOfWork object
+        :param session: SQLAlchemy session object
+        :param activities: Activity objects to assign the transaction ids to
+        :param batch_size: Maximum number of objects resolved with a single query (Default value = 500)
+        """
+        # Key is the object class, Value maps the object identities to the activity attributes to assign
+        pending = defaultdict(lambda: defaultdict(list))
+        for activity in activities:
+            activity.transaction = uow.current_transaction
+            for name in ("object", "target"):
+                obj = getattr(activity, name)
+                tx_id = None
+                if obj is not None:
+                    plan = uow.manager.plan(obj.__class__)
+                    identity = plan.identity(obj)
+                    version_obj = uow.version_object(obj)
+                    if version_obj is not None:
+                        tx_id = getattr(version_obj, plan.tx_column_name)
+                    elif (plan.version_cls, (*identity, uow.current_transaction.id)) in uow.released_versions:
+                        # Written and released by an earlier flush in streaming mode
+                        tx_id = uow.current_transaction.id
+                    else:
+                        pending[obj.__class__][identity].append((activity, name))
+                setattr(activity, f"{name}_tx_id", tx_id)
+
+        for cls, targets in pending.items():
+            plan = uow.manager.plan(cls)
+            key_attrs = [getattr(plan.version_cls, key) for key in plan.version_parent_keys]
+            tx_attr = getattr(plan.version_cls, plan.tx_column_name)
+            identities = list(targets)
+            for i in range(0, len(identities), batch_size):
+                stmt = (
+                    sa.select(*key_attrs, sa.func.max(tx_attr))
+                    .where(key_criteria(key_attrs, identities[i : i + batch_size]))
+                    .group_by(*key_attrs)
+                )
+                for *identity, tx_id in session.execute(stmt):
+                    for activity, name in targets.get(tuple(identity), ()):
+                        setattr(activity, f"{name}_tx_id", tx_id)
 
     def after_version_class_built(self, parent_cls, version_cls):
         pass
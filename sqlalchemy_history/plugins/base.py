@@ -23,6 +23,19 @@ class Plugin:
     def after_create_version_object(self, uow, parent_obj, version_obj):
         pass
 
+    def after_create_version_objects_batch(self, uow, pairs):
+        """Batched variant of `after_create_version_object` invoked once per flush.
+
+        :param uow: UnitOfWork object
+        :param pairs: List of (parent object, version object) tuples created during the flush
+        """
+
+    def after_commit(self, uow, session):
+        pass
+
+    def after_rollback(self, uow, session):
+        pass
+
     def transaction_args(self, uow, session):
         return {}
 
@@ -32,42 +45,108 @@ class Plugin:
     def after_construct_changeset(self, version_obj, changeset):
         pass
 
+    def merged_version_columns(self, table):
+        """Return the keys of the columns of given version table whose values are merged with bitwise OR
+        into the stored values when a version row written earlier in the transaction is updated.
+
+        :param table: Version table
+        """
+        return []
+
+
+def overrides_hook(plugin, name):
+    """Return whether or not given plugin implements given hook itself instead of inheriting the no-op
+    from `Plugin`.
+
+    :param plugin: Plugin object
+    :param name: Name of the hook
+    """
+    if name in getattr(plugin, "__dict__", {}):
+        return True
+    return getattr(type(plugin), name, None) is not getattr(Plugin, name, None)
+
 
 class PluginCollection:
+    """A collection of plugins dispatching hook calls to its plugins.
+
+    Calling a hook on the collection calls it on every plugin implementing it and returns the list of
+    their return values. The plugins implementing a hook are looked up once per hook, so hooks which no
+    plugin implements cost a single call returning an empty list. The collection keeps its own copy of
+    the plugins, which are changed through its methods only so that the lookups are refreshed.
+    """
+
     def __init__(self, plugins=None):
+        self._dispatchers = {}
         if plugins is None:
             plugins = []
-        if isinstance(plugins, self.__class__):
-            self.plugins = plugins.plugins
-        else:
-            self.plugins = plugins
+        self.plugins = plugins
+
+    @property
+    def plugins(self):
+        return list(self._plugins)
+
+    @plugins.setter
+    def plugins(self, plugins):
+        self._plugins = list(plugins)
+        self._dispatchers.clear()
 
     def __iter__(self):
-        yield from self.plugins
+        yield from self._plugins
 
     def __len__(self):
-        return len(self.plugins)
+        return len(self._plugins)
 
     def __repr__(self):
         return "<{} [{}]>".format(
             self.__class__.__name__,
-            ", ".join(map(repr, self.plugins)),
+            ", ".join(map(repr, self._plugins)),
         )
 
     def __getitem__(self, index):
-        return self.plugins[index]
+        return self._plugins[index]
 
     def __setitem__(self, index, element):
-        self.plugins[index] = element
+        self._plugins[index] = element
+        self._dispatchers.clear()
 
     def __delitem__(self, index):
-        del self.plugins[index]
+        del self._plugins[index]
+        self._dispatchers.clear()
 
     def __getattr__(self, attr):
-        def wrapper(*args, **kwargs):
-            return [getattr(plugin, attr)(*args, **kwargs) for plugin in self.plugins]
-
-        return wrapper
+        if attr.startswith("__") or attr in ("_plugins", "_dispatchers"):
+            raise AttributeError(attr)
+        try:
+            return self._dispatchers[attr]
+        except KeyError:
+            hooks = self.hooks(attr)
+            if hooks:
+
+                def dispatcher(*args, **kwargs):
+                    return [hook(*args, **kwargs) for hook in hooks]
+
+            else:
+
+                def dispatcher(*args, **kwargs):
+                    return []
+
+            self._dispatchers[attr] = dispatcher
+            return dispatcher
+
+    def hooks(self, name):
+        """Return the bound methods of given hook for the plugins implementing it.
+
+        :param name: Name of the hook
+        """
+        key = ("hooks", name)
+        try:
+            return self._dispatchers[key]
+        except KeyError:
+            hooks = self._dispatchers[key] = tuple(
+                getattr(plugin, name) for plugin in self._plugins if overrides_hook(plugin, name)
+            )
+            return hooks
 
     def append(self, el):
-        self.plugins.append(el)
+        self._plugins.append(el)
+        self._dispatchers.clear()
@@ -4,7 +4,7 @@ from sqlalchemy.orm import ColumnProperty
 
 from sqlalchemy_history.operation import Operation
 from sqlalchemy_history.plugins.base import Plugin
-from sqlalchemy_history.utils import is_internal_column, versioned_column_properties
+from sqlalchemy_history.utils import is_internal_column
 
 
 if t.TYPE_CHECKING:
@@ -12,20 +12,22 @@ if t.TYPE_CHECKING:
 
 
 class NullDeletePlugin(Plugin):
-    def should_nullify_column(self, version_obj, prop: ColumnProperty) -> bool:
+    def should_nullify_column(self, version_obj, prop: ColumnProperty, parent_obj=None) -> bool:
         """Return whether or not given column of given version object should
         be nullified (set to None) at the end of the transaction.
 
         :param version_obj: Version object to check the attribute nullification
         :parem prop:        SQLAlchemy ColumnProperty object
+        :param parent_obj:  Parent object of the version object. Used for option lookups when the
+                            version object is a plain version row. (Default value = None)
         """
         return (
             version_obj.operation_type == Operation.DELETE
             and not prop.columns[0].primary_key
-            and not is_internal_column(version_obj, prop.key)
+            and not is_internal_column(version_obj if parent_obj is None else parent_obj, prop.key)
         )
 
     def after_create_version_object(self, uow: "UnitOfWork", parent_obj, version_obj) -> None:
-        for prop in versioned_column_properties(parent_obj):
-            if self.should_nullify_column(version_obj, prop):
+        for prop in uow.manager.plan(parent_obj.__class__).column_properties:
+            if self.should_nullify_column(version_obj, prop, parent_obj):
                 setattr(version_obj, prop.key, None)
@@ -12,6 +12,22 @@ versioned column. So for example if you have versioned model called Article
 with columns `name` and `content`, this plugin would add two additional boolean
 columns `name_mod` and `content_mod` for the version model. When user commits
 transactions the plugin automatically updates these boolean columns.
+
+Wide tables can use the bitmask storage instead, which stores the modification
+flags of a version row as bits of a single integer column `mod_mask` (tables
+with more than 63 tracked columns get additional `mod_mask_1`, `mod_mask_2`...
+columns). The column-to-bit mapping follows the column order of the parent
+table and is recorded in the `info` of the mask columns, so new columns should
+be appended to keep the mapping stable. Version classes get a `modified`
+classmethod compiling to the bitwise predicate::
+
+    plugin = PropertyModTrackerPlugin(storage="bitmask")
+    session.scalars(sa.select(ArticleVersion).where(ArticleVersion.modified("name")))
+
+Bitwise predicates can only use expression indexes, see
+`PropertyModTrackerPlugin.create_modified_index`. Existing version tables using
+the boolean columns can be migrated with
+`sqlalchemy_history.schema.update_property_mod_mask`.
 """
 
 import typing as t
@@ -24,15 +40,29 @@ if t.TYPE_CHECKING:
 from copy import copy
 
 import sqlalchemy as sa
-from sqlalchemy.orm import object_session
-from sqlalchemy_utils.functions import has_changes
 
+from sqlalchemy_history.exc import ImproperlyConfigured
+from sqlalchemy_history.operation import Operation
 from sqlalchemy_history.plugins.base import Plugin
-from sqlalchemy_history.utils import versioned_column_properties
+from sqlalchemy_history.schema import MOD_BITS_INFO_KEY
+
+
+def mask_columns(table: sa.Table) -> list[sa.Column]:
+    """Return the modification mask columns of given version table."""
+    return [column for column in table.c if MOD_BITS_INFO_KEY in column.info]
 
 
 class PropertyModTrackerPlugin(Plugin):
     column_suffix = "_mod"
+    mask_column_name = "mod_mask"
+    #: Number of flags stored in a single mask column, keeping clear of the sign bit of BIGINT
+    bits_per_mask_column = 63
+
+    def __init__(self, storage: t.Literal["columns", "bitmask"] = "columns") -> None:
+        if storage not in ("columns", "bitmask"):
+            raise ImproperlyConfigured(f"Unknown PropertyModTrackerPlugin storage {storage!r}.")
+        self.storage = storage
+        self.mask_bits = {}
 
     def create_mod_column(self, column: sa.Column) -> sa.Column:
         return sa.Column(
@@ -44,26 +74,137 @@ class PropertyModTrackerPlugin(Plugin):
             nullable=False,
         )
 
+    def create_mask_columns(self, table_builder: "TableBuilder", tracked_columns: list[sa.Column]) -> list[sa.Column]:
+        name = self.mask_column_name
+        mapper = sa.inspect(table_builder.model)
+        if mapper.inherits is not None and not mapper.concrete:
+            # Tables of joined inheritance are mapped together, their mask columns need distinct keys
+            name = f"{table_builder.parent_table.name}_{name}"
+        size = self.bits_per_mask_column
+        return [
+            sa.Column(
+                name if i == 0 else f"{name}_{i // size}",
+                sa.BigInteger,
+                default=0,
+                server_default="0",
+                nullable=False,
+                info={MOD_BITS_INFO_KEY: {column.key: bit for bit, column in enumerate(tracked_columns[i : i + size])}},
+            )
+            for i in range(0, len(tracked_columns), size)
+        ]
+
+    def after_build_models(self, manager) -> None:
+        self.mask_bits = {}
+
     def after_build_version_table_columns(self, table_builder: "TableBuilder", columns: list[sa.Column]) -> None:
         # Only create modification tracking columns for tables that are
         # associated with actual model classes. In other words do not create
         # mod tracking columns for association tables.
         if table_builder.model:
-            columns.extend(
-                self.create_mod_column(column)
+            tracked_columns = [
+                column
                 for column in table_builder.parent_table.c
                 if not table_builder.manager.is_excluded_column(table_builder.model, column) and not column.primary_key
-            )
+            ]
+            if self.storage == "bitmask":
+                columns.extend(self.create_mask_columns(table_builder, tracked_columns))
+            else:
+                columns.extend(self.create_mod_column(column) for column in tracked_columns)
+
+    def after_version_class_built(self, parent_cls, version_cls) -> None:
+        if self.storage == "bitmask":
+            version_cls.modified = classmethod(self.modified_criteria)
+
+    def modified_bit(self, version_cls, key: str) -> tuple[str, int]:
+        """Return the key of the mask attribute of given version class holding the modification flag of
+        given column along with the value of the flag.
+
+        :param version_cls: Version class
+        :param key: Key of the tracked column
+        """
+        mapper = sa.inspect(version_cls)
+        for table in mapper.tables:
+            for column in mask_columns(table):
+                bits = column.info[MOD_BITS_INFO_KEY]
+                if key in bits:
+                    return mapper.get_property_by_column(column).key, 1 << bits[key]
+        raise KeyError(f"Modifications of {key!r} are not tracked by {version_cls.__name__}.")
+
+    def modified_criteria(self, version_cls, key: str) -> sa.ColumnElement[bool]:
+        """Return the criteria matching the versions of given version class that modified given column.
+
+        :param version_cls: Version class
+        :param key: Key of the tracked column
+        """
+        mask_key, bit = self.modified_bit(version_cls, key)
+        return getattr(version_cls, mask_key).bitwise_and(bit) == bit
+
+    def create_modified_index(self, version_cls, key: str, name: t.Optional[str] = None) -> sa.Index:
+        """Return an expression index serving :meth:`modified_criteria` of given column on databases
+        supporting indexes on expressions.
+
+        :param version_cls: Version class
+        :param key: Key of the tracked column
+        :param name: Name of the index, defaults to ``ix_<table>_<key>_mod``
+        """
+        mask_key, bit = self.modified_bit(version_cls, key)
+        column = sa.inspect(version_cls).get_property(mask_key).columns[0]
+        return sa.Index(name or f"ix_{column.table.name}_{key}{self.column_suffix}", column.bitwise_and(bit))
+
+    def merged_version_columns(self, table: sa.Table) -> list[str]:
+        # The flags of a released version are ORed into its stored mask when the version is updated
+        return [column.key for column in mask_columns(table)]
+
+    def version_mask_bits(self, uow: "UnitOfWork", parent_cls) -> dict[str, tuple[str, int]]:
+        """Return the mask attribute and flag of each tracked property of given parent class."""
+        try:
+            return self.mask_bits[parent_cls]
+        except KeyError:
+            plan = uow.manager.plan(parent_cls)
+            mapper = sa.inspect(plan.version_cls)
+            column_bits = {
+                key: (mapper.get_property_by_column(column).key, 1 << bit)
+                for table in mapper.tables
+                for column in mask_columns(table)
+                for key, bit in column.info[MOD_BITS_INFO_KEY].items()
+            }
+            mask_bits = self.mask_bits[parent_cls] = {
+                prop.key: column_bits[prop.columns[0].key]
+                for prop in plan.column_properties
+                if prop.columns[0].key in column_bits
+            }
+            return mask_bits
 
     def after_create_version_object(self, uow: "UnitOfWork", parent_obj, version_obj):
-        session = object_session(parent_obj)
-        is_deleted = parent_obj in session.deleted
-
-        for prop in versioned_column_properties(parent_obj):
-            if has_changes(parent_obj, prop.key) or is_deleted:
-                setattr(version_obj, prop.key + self.column_suffix, True)
+        column_keys = uow.manager.plan(parent_obj.__class__).column_keys
+        if version_obj.operation_type == Operation.DELETE:
+            keys = column_keys
+        else:
+            keys = uow.operations.changed_keys(parent_obj).intersection(column_keys)
+
+        if self.storage == "bitmask":
+            mask_bits = self.version_mask_bits(uow, parent_obj.__class__)
+            masks = {}
+            for key in keys:
+                if key in mask_bits:
+                    mask_key, bit = mask_bits[key]
+                    masks[mask_key] = masks.get(mask_key, 0) | bit
+            for mask_key, mask in masks.items():
+                # Flags of earlier flushes of the transaction are kept, for version rows released by the
+                # streaming mode they are merged by the UPDATE of the row
+                setattr(version_obj, mask_key, (getattr(version_obj, mask_key, None) or 0) | mask)
+            return
+
+        for key in keys:
+            setattr(version_obj, key + self.column_suffix, True)
 
     def after_construct_changeset(self, version_obj, changeset):
+        mask_keys = set()
+        if self.storage == "bitmask":
+            mapper = sa.inspect(version_obj.__class__)
+            mask_keys = {
+                mapper.get_property_by_column(column).key for table in mapper.tables for column in mask_columns(table)
+            }
         for key in copy(changeset):
-            if key.endswith(self.column_suffix):
+            if key.endswith(self.column_suffix) or key in mask_keys:
                 del changeset[key]
@@ -23,6 +23,7 @@ transaction_id          entity_name
 """
 
 import typing as t
+from weakref import WeakKeyDictionary
 
 import sqlalchemy as sa
 from sqlalchemy.orm import Session, backref, relationship
@@ -64,7 +65,10 @@ class TransactionChangesFactory(ModelFactory):
 
 
 class TransactionChangesPlugin(Plugin):
-    objects = None
+    def __init__(self) -> None:
+        # Key is the UnitOfWork, Value is the set of entity names recorded for its transaction or
+        # None when the set has to be reloaded from the database after a savepoint rollback.
+        self.entity_names = WeakKeyDictionary()
 
     def after_build_tx_class(self, manager: "VersioningManager") -> None:
         self.model_class = TransactionChangesFactory()(manager)
@@ -72,25 +76,47 @@ class TransactionChangesPlugin(Plugin):
     def after_build_models(self, manager: "VersioningManager") -> None:
         self.model_class = TransactionChangesFactory()(manager)
 
-    def before_create_version_objects(self, uow: "UnitOfWork", session: Session) -> None:
-        for entity in uow.operations.entities:
-            params = uow.current_transaction.id, str(entity.__name__)
-            changes = session.get(self.model_class, params)
-            if not changes:
-                changes = self.model_class(
-                    transaction_id=uow.current_transaction.id,
-                    entity_name=str(entity.__name__),
+    def recorded_entity_names(self, uow: "UnitOfWork", session: Session) -> set[str]:
+        """Return the names of the entities already recorded for the current transaction of given
+        UnitOfWork.
+
+        :param uow: UnitOfWork object
+        :param session: SQLAlchemy session object
+        """
+        names = self.entity_names.get(uow, set())
+        if names is None:
+            table = self.model_class.__table__
+            names = set(
+                session.connection().scalars(
+                    sa.select(table.c.entity_name).where(table.c.transaction_id == uow.current_transaction.id)
                 )
-                session.add(changes)
+            )
+        self.entity_names[uow] = names
+        return names
+
+    def before_create_version_objects(self, uow: "UnitOfWork", session: Session) -> None:
+        recorded = self.recorded_entity_names(uow, session)
+        names = {str(entity.__name__) for entity in uow.operations.entities} - recorded
+        if names:
+            session.connection().execute(
+                self.model_class.__table__.insert(),
+                [{"transaction_id": uow.current_transaction.id, "entity_name": name} for name in sorted(names)],
+            )
+            recorded.update(names)
 
     def clear(self) -> None:
-        self.objects = None
+        self.entity_names = WeakKeyDictionary()
 
     def after_rollback(self, uow: "UnitOfWork", session: Session) -> None:
-        self.clear()
-
-    def ater_commit(self, uow: "UnitOfWork", session: Session) -> None:
-        self.clear()
+        if session.in_nested_transaction():
+            # Rows written after the savepoint are gone, the names are reloaded on the next flush
+            self.entity_names[uow] = None
+        else:
+            self.entity_names.pop(uow, None)
+
+    def after_commit(self, uow: "UnitOfWork", session: Session) -> None:
+        if not session.in_nested_transaction():
+            self.entity_names.pop(uow, None)
 
     def after_version_class_built(self, parent_cls, version_cls) -> None:
         parent_cls.__versioned__["transaction_changes"] = self.model_class
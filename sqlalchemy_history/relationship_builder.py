@@ -4,14 +4,18 @@ module for versioned package
 
 import typing as t
 import warnings
+from collections import defaultdict
 
 import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import async_object_session
 from sqlalchemy.orm import RelationshipProperty, Session, aliased, object_session
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.sql.selectable import ExecutableReturnsRows
 
 from sqlalchemy_history.exc import ClassNotVersioned
 from sqlalchemy_history.expression_reflector import VersionExpressionReflector
 from sqlalchemy_history.operation import Operation
+from sqlalchemy_history.schema import key_criteria
 from sqlalchemy_history.table_builder import TableBuilder
 from sqlalchemy_history.utils import adapt_columns, option, version_class
 
@@ -32,6 +36,51 @@ class _WriteOnlyCollectionAdapter(t.Generic[_T]):
         return self._statement
 
 
+class ReflectedRelationship(property):
+    """Property of a version class reflecting a relationship of its parent class, keeps the
+    RelationshipBuilder of the relationship for :func:`load_relationships`."""
+
+    def __init__(self, fget, builder: "RelationshipBuilder"):
+        super().__init__(fget)
+        self.builder = builder
+
+
+class MappedRelationshipLoader:
+    """Loads a relationship mapped on version classes, such as `transaction` and `version_parent`,
+    for batches of version objects. Joins through secondary tables are not supported."""
+
+    def __init__(self, property_: RelationshipProperty):
+        self.property = property_
+        self.local_keys = [
+            property_.parent.get_property_by_column(local).key for local, _ in property_.local_remote_pairs
+        ]
+        self.remote_attrs = [
+            getattr(property_.mapper.class_, property_.mapper.get_property_by_column(remote).key)
+            for _, remote in property_.local_remote_pairs
+        ]
+
+    def row_key(self, version) -> tuple:
+        return tuple(getattr(version, key) for key in self.local_keys)
+
+    def batch_select(self, versions: list) -> sa.Select:
+        keys = {self.row_key(version) for version in versions}
+        keys.discard((None,) * len(self.local_keys))
+        return sa.select(*self.remote_attrs, self.property.mapper.class_).where(
+            key_criteria(self.remote_attrs, list(keys)) if keys else sa.false()
+        )
+
+    def fill(self, versions: list, rows) -> None:
+        related = defaultdict(list)
+        for *key, obj in rows:
+            related[tuple(key)].append(obj)
+        for version in versions:
+            objs = related.get(self.row_key(version), [])
+            if self.property.uselist:
+                set_committed_value(version, self.property.key, objs)
+            else:
+                set_committed_value(version, self.property.key, objs[0] if objs else None)
+
+
 class RelationshipBuilder:
     property: RelationshipProperty
 
@@ -40,7 +89,43 @@ class RelationshipBuilder:
         self.property = property_
         self.model = model
 
+    def validity_criteria(self, columns, obj):
+        """Returns the range predicate matching the versions valid at the transaction of given object.
+
+        Used instead of the correlated max() subqueries when the versions carry the end transaction ids
+        of the validity strategy, which makes the predicate sargable on the version table indexes.
+
+        .. code-block:: sql
+
+        tags_version.transaction_id <= 5
+        AND (tags_version.end_transaction_id > 5 OR tags_version.end_transaction_id IS NULL)
+
+        :param columns: Version class or columns of a version table
+        :param obj: Version object whose transaction the versions are matched against
+        """
+        tx_id = getattr(obj, option(obj, "transaction_column_name"))
+        end_tx_column = getattr(columns, option(obj, "end_transaction_column_name"))
+        return sa.and_(
+            getattr(columns, option(obj, "transaction_column_name")) <= tx_id,
+            sa.or_(end_tx_column > tx_id, end_tx_column.is_(None)),
+        )
+
+    @property  # noqa: A003
+    def remote_validity(self):
+        """Whether the versions of the remote class carry the end transaction ids of the validity strategy."""
+        return option(self.remote_cls, "strategy") == "validity"
+
+    @property  # noqa: A003
+    def association_validity(self):
+        """Whether the association version table carries the end transaction ids of the validity strategy."""
+        return (
+            self.manager.options["strategy"] == "validity"
+            and self.manager.options["end_transaction_column_name"] in self.association_version_table.c
+        )
+
     def one_to_many_subquery(self, obj):
+        if self.remote_validity:
+            return self.validity_criteria(self.remote_cls, obj)
         tx_column = option(obj, "transaction_column_name")
 
         remote_alias = aliased(self.remote_cls)
@@ -60,10 +145,12 @@ class RelationshipBuilder:
             )
             .group_by(*primary_keys)
             .having(sa.func.max(getattr(remote_alias, tx_column)) == getattr(self.remote_cls, tx_column))
-            .correlate(self.local_cls, self.remote_cls)
+            .correlate_except(remote_alias)
         )
 
     def many_to_one_subquery(self, obj):
+        if self.remote_validity:
+            return self.validity_criteria(self.remote_cls, obj)
         tx_column = option(obj, "transaction_column_name")
         reflector = VersionExpressionReflector(obj, self.property)
         subquery = sa.select(sa.func.max(getattr(self.remote_cls, tx_column))).where(
@@ -72,12 +159,48 @@ class RelationshipBuilder:
                 reflector(self.property.primaryjoin),
             )
         )
-        subquery = subquery.scalar_subquery()
+        subquery = subquery.correlate_except(self.remote_cls).scalar_subquery()
         return getattr(self.remote_cls, tx_column) == subquery
 
     def select(self, obj):
         return sa.select(self.remote_cls).filter(self.criteria(obj))
 
+    @property  # noqa: A003
+    def version_keys(self) -> tuple:
+        plan = self.manager.plan(self.model)
+        return (*plan.version_parent_keys, plan.tx_column_name)
+
+    def row_key(self, version) -> tuple:
+        return tuple(getattr(version, key) for key in self.version_keys)
+
+    def batch_select(self, versions: list) -> sa.Select:
+        """Returns the select of the related objects of all given version objects, each row holding the
+        primary key of the version object it is related to followed by the related object.
+
+        The version class is joined to the related class with the criteria of :meth:`criteria` built
+        against an alias of the version class instead of a single version object, so the whole batch is
+        matched by primary key in one query while keeping the as-of logic of the strategy.
+
+        :param versions: Version objects of the local class of this relationship
+        """
+        local_alias = aliased(self.local_cls, flat=True)
+        keys = [getattr(local_alias, key) for key in self.version_keys]
+        return (
+            sa.select(*keys, self.remote_cls)
+            .select_from(local_alias)
+            .join(self.remote_cls, self.criteria(local_alias))
+            .where(key_criteria(keys, [self.row_key(version) for version in versions]))
+        )
+
+    def fill(self, versions: list, rows) -> None:
+        """Caches the related objects found in given rows of :meth:`batch_select` on the version objects."""
+        related = defaultdict(list)
+        for *key, obj in rows:
+            related[tuple(key)].append(obj)
+        for version in versions:
+            objs = related.get(self.row_key(version), [])
+            version.__dict__[self.property.key] = objs if self.property.uselist is not False else next(iter(objs), None)
+
     def process_query(self, query: ExecutableReturnsRows, session: Session):
         """Process given SQLAlchemy Query object depending on the associated RelationshipProperty object.
 
@@ -259,12 +382,14 @@ class RelationshipBuilder:
         """Builds a reflected one-to-many, one-to-one and many-to-one relationship between two version
         classes."""
 
-        @property
         def relationship(obj):
+            # Cached by load_relationships
+            if self.property.key in obj.__dict__:
+                return obj.__dict__[self.property.key]
             session = object_session(obj)
             return self.process_query(self.select(obj), session)
 
-        return relationship
+        return ReflectedRelationship(relationship, self)
 
     def association_subquery(self, obj):
         """Returns an EXISTS clause that checks if an association exists for given
@@ -304,28 +429,33 @@ class RelationshipBuilder:
         object_join_column = self.property.primaryjoin.left.name
         reflector = VersionExpressionReflector(obj, self.property)
 
-        association_table_alias = self.association_version_table.alias()
-        association_cols = [
-            association_table_alias.c[association_col.name]
-            for _, association_col in self.remote_to_association_column_pairs
-        ]
-
-        association_exists = sa.exists(
-            sa.select(1)
-            .where(
-                sa.and_(
-                    association_table_alias.c[tx_column] <= getattr(obj, tx_column),
-                    association_table_alias.c[join_column] == getattr(obj, object_join_column),
-                    *[
-                        association_col == self.association_version_table.c[association_col.name]
-                        for association_col in association_cols
-                    ],
+        if self.association_validity:
+            association_exists = self.validity_criteria(self.association_version_table.c, obj)
+        else:
+            association_table_alias = self.association_version_table.alias()
+            association_cols = [
+                association_table_alias.c[association_col.name]
+                for _, association_col in self.remote_to_association_column_pairs
+            ]
+
+            association_exists = sa.exists(
+                sa.select(1)
+                .where(
+                    sa.and_(
+                        association_table_alias.c[tx_column] <= getattr(obj, tx_column),
+                        association_table_alias.c[join_column] == getattr(obj, object_join_column),
+                        *[
+                            association_col == self.association_version_table.c[association_col.name]
+                            for association_col in association_cols
+                        ],
+                    )
                 )
+                .group_by(*association_cols)
+                .having(
+                    sa.func.max(association_table_alias.c[tx_column]) == self.association_version_table.c[tx_column]
+                )
+                .correlate_except(association_table_alias)
             )
-            .group_by(*association_cols)
-            .having(sa.func.max(association_table_alias.c[tx_column]) == self.association_version_table.c[tx_column])
-            .correlate(self.association_version_table)
-        )
         return sa.exists(
             sa.select(1)
             .where(
@@ -336,7 +466,7 @@ class RelationshipBuilder:
                     adapt_columns(self.property.secondaryjoin),
                 )
             )
-            .correlate(self.local_cls, self.remote_cls)
+            .correlate_except(self.association_version_table)
         )
 
     def build_association_version_tables(self):
@@ -392,3 +522,79 @@ class RelationshipBuilder:
                     self.remote_to_association_column_pairs.append(column_pair)
 
         setattr(self.local_cls, self.property.key, self.reflected_relationship)
+
+
+def relationship_loader(version_cls, key: str):
+    """Return the loader of the relationship with given key of given version class.
+
+    :param version_cls: Version class
+    :param key: Key of a reflected relationship or of a relationship mapped on the version class
+    """
+    attr = getattr(version_cls, key, None)
+    if isinstance(attr, ReflectedRelationship):
+        if attr.builder.property.lazy in ("dynamic", "write_only"):
+            raise TypeError(f"Relationship {key!r} of {version_cls.__name__} returns a query and can not be loaded.")
+        return attr.builder
+    prop = sa.inspect(version_cls).relationships.get(key)
+    if prop is None or prop.secondary is not None or prop.lazy in ("dynamic", "write_only"):
+        raise TypeError(f"{version_cls.__name__} has no relationship {key!r} which could be loaded in batches.")
+    return MappedRelationshipLoader(prop)
+
+
+def relationship_batches(versions: list, keys: tuple[str, ...], batch_size: int) -> t.Iterator[tuple]:
+    """Yield the loader and the version objects of each batch of :func:`load_relationships`."""
+    by_class = defaultdict(list)
+    for version in versions:
+        by_class[version.__class__].append(version)
+    for version_cls, objs in by_class.items():
+        for key in keys:
+            loader = relationship_loader(version_cls, key)
+            for i in range(0, len(objs), batch_size):
+                yield loader, objs[i : i + batch_size]
+
+
+def load_relationships(versions: list, *keys: str, batch_size: int = 500) -> None:
+    """
+    Load given relationships of given version objects in bulk with one query
+    per relationship and version class, so that accessing them issues no
+    further queries.
+
+    Reflected relationships are matched with the same as-of logic as when
+    accessed one version at a time and cached on the version objects.
+    Relationships mapped on the version classes, such as ``transaction`` and
+    ``version_parent``, are populated as if they had been loaded by SQLAlchemy.
+
+    ::
+
+        versions = session.scalars(sa.select(ArticleVersion)).all()
+        load_relationships(versions, "tags", "transaction")
+        data = [(version.name, [tag.name for tag in version.tags]) for version in versions]
+
+    :param versions: List of version objects
+    :param keys: Keys of the relationships to load
+    :param batch_size: Maximum number of version objects per query
+    """
+    if not versions:
+        return
+    session = object_session(versions[0])
+    for loader, batch in relationship_batches(versions, keys, batch_size):
+        loader.fill(batch, session.execute(loader.batch_select(batch)))
+
+
+async def aload_relationships(versions: list, *keys: str, batch_size: int = 500) -> None:
+    """
+    Load given relationships of given version objects in bulk, see
+    :func:`load_relationships`.
+
+    Use this when working with async SQLAlchemy, the loaded relationships can
+    then be accessed without any IO.
+
+    :param versions: List of version objects
+    :param keys: Keys of the relationships to load
+    :param batch_size: Maximum number of version objects per query
+    """
+    if not versions:
+        return
+    async_session = async_object_session(versions[0])
+    for loader, batch in relationship_batches(versions, keys, batch_size):
+        loader.fill(batch, await async_session.execute(loader.batch_select(batch)))
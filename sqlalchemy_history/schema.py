@@ -1,6 +1,12 @@
+import typing as t
+
 import sqlalchemy as sa
 
 
+#: Key of the column-to-bit mapping in the ``info`` of the modification mask columns
+MOD_BITS_INFO_KEY = "property_mod_bits"
+
+
 def get_end_tx_column_query(
     table: sa.Table, end_tx_column_name: str = "end_transaction_id", tx_column_name: str = "transaction_id"
 ) -> sa.Select:
@@ -73,6 +79,99 @@ def update_end_tx_column(
             conn.execute(update_stmt)
 
 
+def supports_update_from(dialect) -> bool:
+    """Return whether given dialect can render UPDATE statements with additional FROM tables.
+
+    :param dialect: SQLAlchemy dialect object
+    """
+    if dialect.name == "sqlite":
+        # UPDATE ... FROM is available since SQLite 3.33
+        return dialect.server_version_info is not None and dialect.server_version_info >= (3, 33)
+    return dialect.name in ("postgresql", "mysql", "mariadb", "mssql")
+
+
+def key_criteria(columns: list[sa.Column], keys: list[tuple]) -> sa.ColumnElement[bool]:
+    """Return a criterion matching rows whose given columns equal any of given key tuples.
+
+    :param columns: Key columns
+    :param keys: List of value tuples in the same order as columns
+    """
+    if len(columns) == 1:
+        return columns[0].in_([key[0] for key in keys])
+    # Row value IN is not available on every dialect (for example MSSQL), so spell it out.
+    return sa.or_(*[sa.and_(*[column == value for column, value in zip(columns, key)]) for key in keys])
+
+
+def update_end_tx_column_for_keys(
+    table: sa.Table,
+    keys: list[tuple],
+    tx_id: int,
+    *,
+    end_tx_column_name: str = "end_transaction_id",
+    tx_column_name: str = "transaction_id",
+    key_columns: t.Optional[list[sa.Column]] = None,
+    conn=None,
+    batch_size: int = 500,
+) -> None:
+    """Sets the end transaction id of the previous version of each given key to given transaction id.
+
+    The previous version of a key is the version with the highest transaction id lower than
+    `tx_id`. Unlike :func:`update_end_tx_column` this only touches the versions of given keys and
+    updates them with one set-based statement per batch of keys. On dialects that support it the
+    statement is an UPDATE ... FROM joined to a grouped `max()` query, otherwise a correlated
+    `max()` subquery is used.
+
+    The previous versions are looked up in the database because the versions written by earlier
+    transactions are not known in-process. The unit of work only passes the keys whose previous
+    version was not already closed earlier in the same transaction.
+
+    :param table: SQLAlchemy version table object
+    :param keys: List of key value tuples in the order of `key_columns`
+    :param tx_id: Transaction id of the new versions
+    :param end_tx_column_name: Name of the end transaction column (Default value = "end_transaction_id")
+    :param tx_column_name: Transaction column name (Default value = "transaction_id")
+    :param key_columns: Columns identifying the versioned row. Defaults to the primary key columns of
+            the table without the transaction column. (Default value = None)
+    :param conn: SQLAlchemy Connection or Alembic Operations object. If no object is given then this
+            function tries to use alembic.op for executing the queries. (Default value = None)
+    :param batch_size: Maximum number of keys per statement (Default value = 500)
+    """
+    if conn is None:
+        from alembic import op  # noqa: PLC0415
+
+        conn = op.get_bind()
+
+    if key_columns is None:
+        key_columns = [c for c in table.primary_key if c.name != tx_column_name]
+    tx_column = table.c[tx_column_name]
+    batch_size = max(1, batch_size // max(1, len(key_columns)))
+
+    for index in range(0, len(keys), batch_size):
+        batch = keys[index : index + batch_size]
+        if supports_update_from(conn.dialect):
+            v = sa.alias(table, name="v")
+            v_key_columns = [v.c[c.key] for c in key_columns]
+            previous = (
+                sa.select(*v_key_columns, sa.func.max(v.c[tx_column.key]).label("previous_tx"))
+                .where(v.c[tx_column.key] < tx_id, key_criteria(v_key_columns, batch))
+                .group_by(*v_key_columns)
+                .subquery("previous")
+            )
+            criteria = [
+                tx_column == previous.c.previous_tx,
+                *[column == previous.c[column.key] for column in key_columns],
+            ]
+        else:
+            v = sa.alias(table, name="v")
+            previous_tx = (
+                sa.select(sa.func.max(v.c[tx_column.key]))
+                .where(v.c[tx_column.key] < tx_id, *[v.c[c.key] == c for c in key_columns])
+                .scalar_subquery()
+            )
+            criteria = [key_criteria(key_columns, batch), tx_column == previous_tx]
+        conn.execute(table.update().where(*criteria).values({end_tx_column_name: tx_id}))
+
+
 def get_property_mod_flags_query(
     table: sa.Table,
     tracked_columns: list[str],
@@ -173,3 +272,40 @@ def update_property_mod_flags(
             criteria = [getattr(table.c, pk) == row._mapping[pk] for pk in primary_keys]
             query = table.update().where(sa.and_(*criteria)).values(values)
             conn.execute(query)
+
+
+def update_property_mod_mask(table: sa.Table, mod_suffix: str = "_mod", conn=None) -> None:
+    """Fill the modification mask columns of given version table from the boolean modification
+    columns.
+
+    This function can be used for migrating a version table from the boolean columns layout of the
+    PropertyModTracker plugin to its bitmask storage. Both the boolean columns and the mask columns
+    need to exist in the database while the data is migrated.
+
+    :param table: SQLAlchemy version table object built with the bitmask storage of the plugin, the
+            column-to-bit mapping is read from the ``info`` of its mask columns
+    :param mod_suffix: Modification tracking columns suffix (Default value = "_mod")
+    :param conn: Either SQLAlchemy Connection, Engine, Session or Alembic
+            Operations object. If no object is given then this function tries to use
+            alembic.op for executing the queries. (Default value = None)
+
+    """
+    if conn is None:
+        from alembic import op  # noqa: PLC0415
+
+        conn = op.get_bind()
+
+    values = {}
+    for mask_column in table.c:
+        bits = mask_column.info.get(MOD_BITS_INFO_KEY)
+        if bits is None:
+            continue
+        values[mask_column.name] = sum(
+            (
+                sa.case((sa.column(key + mod_suffix, sa.Boolean) == sa.true(), 1 << bit), else_=0)
+                for key, bit in bits.items()
+            ),
+            sa.literal(0, sa.BigInteger),
+        )
+    if values:
+        conn.execute(table.update().values(values))
@@ -1,8 +1,17 @@
 """Table Builder Builds versioned table."""
 
 import sqlalchemy as sa
+from sqlalchemy.schema import conv
 from sqlalchemy.sql.sqltypes import Enum
 
+from sqlalchemy_history.exc import ImproperlyConfigured
+
+
+#: Index profiles of the version tables, see the ``indexes`` configuration option
+INDEX_PROFILES = ("default", "auto", "validity", "subquery", "minimal")
+#: Dialects supporting partial indexes
+PARTIAL_INDEX_DIALECTS = ("postgresql", "sqlite", "mssql")
+
 
 class ColumnReflector:
     def __init__(self, manager, parent_table, model=None):
@@ -50,6 +59,12 @@ class ColumnReflector:
                     column_copy.key = key
         return column_copy
 
+    @property
+    def column_indexes(self):
+        """Whether the internal version columns get single column indexes, which is the case with the
+        'default' index profile only. The other profiles are built by `TableBuilder.build_indexes`."""
+        return self.option("indexes") == "default"
+
     @property
     def operation_type_column(self):
         """Return the operation type column. By default the name of this column is 'operation_type'."""
@@ -57,7 +72,7 @@ class ColumnReflector:
             self.option("operation_type_column_name"),
             sa.SmallInteger,
             nullable=False,
-            index=True,
+            index=self.column_indexes,
         )
 
     @property
@@ -67,14 +82,14 @@ class ColumnReflector:
             self.option("transaction_column_name"),
             sa.BigInteger,
             primary_key=True,
-            index=True,
+            index=self.column_indexes,
             autoincrement=False,  # This is needed for MySQL
         )
 
     @property
     def end_transaction_column(self):
         """Returns end_transaction column. By default the name of this column is 'end_transaction_id'."""
-        return sa.Column(self.option("end_transaction_column_name"), sa.BigInteger, index=True)
+        return sa.Column(self.option("end_transaction_column_name"), sa.BigInteger, index=self.column_indexes)
 
     @property
     def reflected_parent_columns(self):
@@ -120,6 +135,46 @@ class TableBuilder:
     def columns(self):
         return list(ColumnReflector(self.manager, self.parent_table, self.model))
 
+    def build_indexes(self, version_table: sa.Table) -> None:
+        """Builds the indexes of the configured index profile for given version table.
+
+        The 'default' profile indexes each internal version column on its own, see `ColumnReflector`.
+        The 'subquery' profile only indexes the transaction column, the primary key serves the lookups
+        of the latest version of a row up to a transaction. The 'validity' profile adds an index on the
+        parent primary key and the end transaction column, serving the validity updates and range
+        predicates, along with a partial index of the current rows on dialects supporting them. The
+        'auto' profile is the 'validity' or 'subquery' profile following the versioning strategy. The
+        'minimal' profile adds no index besides the primary key. A callable profile is called with the
+        TableBuilder and the version table and creates the indexes on the version table.
+
+        The index names are truncated with a hash suffix when they exceed the maximum identifier length
+        of the dialect, for example 64 characters on MySQL.
+
+        :param version_table: Version table built by this builder
+        """
+        profile = self.option("indexes")
+        if callable(profile):
+            profile(self, version_table)
+            return
+        if profile not in INDEX_PROFILES:
+            raise ImproperlyConfigured(f"Unknown version table index profile {profile!r}.")
+        if profile == "auto":
+            profile = self.option("strategy")
+        if profile in ("default", "minimal"):
+            return
+
+        def name(suffix):
+            return conv(f"ix_{version_table.name}_{suffix}")
+
+        tx_column = version_table.c[self.option("transaction_column_name")]
+        sa.Index(name(tx_column.name), tx_column)
+        end_tx_column = version_table.c.get(self.option("end_transaction_column_name"))
+        key_columns = [column for column in version_table.primary_key if column is not tx_column]
+        if profile == "validity" and end_tx_column is not None and key_columns:
+            sa.Index(name(end_tx_column.name), *key_columns, end_tx_column)
+            where = {f"{dialect}_where": end_tx_column.is_(None) for dialect in PARTIAL_INDEX_DIALECTS}
+            sa.Index(name("current"), *key_columns, **where).ddl_if(dialect=PARTIAL_INDEX_DIALECTS)
+
     def __call__(self, extends=None):
         """Builds version table."""
 
@@ -134,6 +189,9 @@ class TableBuilder:
             extend_existing=extends is not None,
         )
         version_table.__versioning_manager__ = self.manager
+        if extends is None:
+            self.build_indexes(version_table)
         # Track Tables mapping.
         self.manager.version_table_map[self.parent_table] = version_table
+        self.manager.parent_table_map.setdefault(version_table, self.parent_table)
         return version_table
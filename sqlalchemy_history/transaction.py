@@ -7,6 +7,8 @@ if t.TYPE_CHECKING:
     from sqlalchemy_history.manager import VersioningManager
 
 import datetime
+import threading
+from abc import ABC, abstractmethod
 from collections import OrderedDict
 
 import sqlalchemy as sa
@@ -24,7 +26,7 @@ def compile_big_integer(element, compiler, **kw):
 
 class TransactionBase:
     issued_at = sa.Column(
-        sa.DateTime, default=lambda: datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+        sa.DateTime, default=lambda: datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None), index=True
     )
 
     @property
@@ -133,3 +135,143 @@ class TransactionFactory(ModelFactory):
                 )
 
         return Transaction
+
+
+class TransactionIdAllocator(ABC):
+    """Hands out transaction ids in-process from blocks of ids reserved in the database.
+
+    When a VersioningManager has an allocator, the id of each new Transaction is assigned up front
+    instead of being fetched with a separate flush of the Transaction object. The Transaction row is
+    then written by the flush that creates the versions.
+
+    .. warning::
+        Every session writing transactions to the database must use an allocator reserving blocks
+        from the same sequence or counter table. Ids taken from the Transaction id column default
+        are not reserved and collide with the ids of the blocks.
+
+    .. warning::
+        Ids are only increasing within a single allocator. Processes writing concurrently each use
+        their own block, so a later transaction of one process can get a lower id than an earlier
+        transaction of another. Version traversal relies on the ordering of transaction ids, hence
+        use a `block_size` of 1 if several processes can change the same rows.
+
+    :param block_size: Number of ids reserved with a single database round trip. (Default value = 100)
+    """
+
+    def __init__(self, block_size: int = 100) -> None:
+        self.block_size = block_size
+        self._lock = threading.Lock()
+        self._next_id = 0
+        self._end_id = 0
+
+    def allocate(self, connection: sa.Connection, transaction_cls: type) -> int:
+        """Return the next transaction id, reserving a new block of ids if the current one is used up.
+
+        :param connection: Connection of the versioned session
+        :param transaction_cls: Transaction class of the versioning manager
+        """
+        with self._lock:
+            if self._next_id >= self._end_id:
+                self._next_id = self.reserve_block(connection, transaction_cls)
+                self._end_id = self._next_id + self.block_size
+            tx_id = self._next_id
+            self._next_id += 1
+            return tx_id
+
+    @abstractmethod
+    def reserve_block(self, connection: sa.Connection, transaction_cls: type) -> int:
+        """Reserve `block_size` consecutive ids and return the first of them.
+
+        :param connection: Connection of the versioned session
+        :param transaction_cls: Transaction class of the versioning manager
+        """
+
+
+class SequenceIdAllocator(TransactionIdAllocator):
+    """Reserves blocks of transaction ids with the hi/lo algorithm on a database sequence.
+
+    Each value `hi` fetched from the sequence reserves the ids from `hi * block_size` up to
+    `(hi + 1) * block_size - 1`. The sequence must be dedicated to the blocks, the sequence of the
+    Transaction id column is rejected as its values fall within the reserved blocks.
+
+    :param sequence: Sequence to reserve the blocks from
+    :param block_size: Number of ids reserved with a single database round trip. (Default value = 100)
+    """
+
+    def __init__(self, sequence: sa.Sequence, block_size: int = 100) -> None:
+        super().__init__(block_size=block_size)
+        self.sequence = sequence
+
+    def reserve_block(self, connection: sa.Connection, transaction_cls: type) -> int:
+        id_default = sa.inspect(transaction_cls).c.id.default
+        if isinstance(id_default, sa.Sequence) and id_default.name == self.sequence.name:
+            raise ImproperlyConfigured(
+                f"SequenceIdAllocator needs a sequence of its own, {self.sequence.name!r} backs the Transaction id."
+            )
+        return connection.scalar(sa.select(self.sequence.next_value())) * self.block_size
+
+
+class TableIdAllocator(TransactionIdAllocator):
+    """Reserves blocks of transaction ids by incrementing a single row counter table.
+
+    The counter table is added to given metadata so that it is created along with the other tables.
+    Its row has the fixed primary key 1. On first use the counter starts after the highest existing
+    transaction id, a process losing the race to insert the counter row reserves its block from the
+    row inserted by the other process.
+
+    :param metadata: MetaData the counter table is added to
+    :param table_name: Name of the counter table (Default value = "transaction_id_block")
+    :param block_size: Number of ids reserved with a single database round trip. (Default value = 100)
+    :param engine: Engine used to reserve blocks in their own short transactions, so that
+            concurrent versioned transactions do not wait for each other on the counter row. If
+            None, blocks are reserved within the versioned transaction. (Default value = None)
+    """
+
+    #: Primary key of the single counter row
+    counter_id = 1
+
+    def __init__(
+        self,
+        metadata: sa.MetaData,
+        table_name: str = "transaction_id_block",
+        block_size: int = 100,
+        engine: t.Optional[sa.Engine] = None,
+    ) -> None:
+        super().__init__(block_size=block_size)
+        self.engine = engine
+        self.table = sa.Table(
+            table_name,
+            metadata,
+            sa.Column("id", sa.Integer, primary_key=True, autoincrement=False),
+            sa.Column("next_id", sa.BigInteger, nullable=False),
+            keep_existing=True,
+        )
+
+    def reserve_block(self, connection: sa.Connection, transaction_cls: type) -> int:
+        if self.engine is None:
+            return self._reserve_block(connection, transaction_cls)
+        with self.engine.begin() as block_connection:
+            return self._reserve_block(block_connection, transaction_cls)
+
+    def _increment(self, connection: sa.Connection) -> t.Optional[int]:
+        """Advance the counter row by one block and return the first id of the block, None if the
+        counter row does not exist yet."""
+        next_id = self.table.c.next_id
+        counter = self.table.c.id == self.counter_id
+        if connection.execute(self.table.update().where(counter).values(next_id=next_id + self.block_size)).rowcount:
+            return connection.scalar(sa.select(next_id).where(counter)) - self.block_size
+        return None
+
+    def _reserve_block(self, connection: sa.Connection, transaction_cls: type) -> int:
+        first_id = self._increment(connection)
+        if first_id is not None:
+            return first_id
+
+        first_id = connection.scalar(sa.select(sa.func.coalesce(sa.func.max(transaction_cls.id), 0) + 1))
+        try:
+            with connection.begin_nested():
+                connection.execute(self.table.insert().values(id=self.counter_id, next_id=first_id + self.block_size))
+        except sa.exc.IntegrityError:
+            # Another process inserted the counter row first
+            return self._increment(connection)
+        return first_id
@@ -1,23 +1,112 @@
 """UnitOfWork module tracks all unit of transaction needed to be done to track history models transactions"""
 
-from copy import copy
+from collections import defaultdict
 
 import sqlalchemy as sa
-from sqlalchemy.orm import Session, aliased, object_session
-from sqlalchemy.orm.exc import ObjectDeletedError
-from sqlalchemy_utils import get_primary_keys, identity
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.exc import ObjectDeletedError, UnmappedColumnError
 
 from sqlalchemy_history.operation import Operation, Operations
-from sqlalchemy_history.schema import update_end_tx_column
+from sqlalchemy_history.schema import key_criteria, update_end_tx_column_for_keys
 from sqlalchemy_history.utils import (
-    end_tx_column_name,
     is_session_modified,
-    tx_column_name,
-    version_class,
-    versioned_column_properties,
+    parent_table,
 )
 
 
+def version_table_rows(version_cls, values):
+    """Split the attribute values of a version object into column values per version table.
+
+    Joined table inheritance maps a version class to several tables, so a single version row
+    may need to be written into more than one table.
+
+    :param version_cls: Version class the values belong to
+    :param values: Dictionary of version class attribute keys and their values
+    """
+    mapper = sa.inspect(version_cls)
+    for table in mapper.tables:
+        row = {}
+        for column in table.c:
+            try:
+                prop = mapper.get_property_by_column(column)
+            except UnmappedColumnError:
+                continue
+            if prop.key in values:
+                row[column.key] = values[prop.key]
+        if row:
+            yield table, row
+
+
+def fill_missing_values(table: sa.Table, rows: list[dict]) -> None:
+    """Fill the values some of given rows of a version table are missing so that all rows have the
+    same keys and can be inserted with a single executemany.
+
+    A missing value takes the scalar default of its column, or None if its column has no default at
+    all. Columns with other defaults, such as callables or server defaults, are left out of the rows
+    missing them so that their default still applies.
+
+    :param table: Version table
+    :param rows: Dictionaries of column keys and values, filled in place
+    """
+    for key in set().union(*rows):
+        column = table.c[key]
+        if column.default is not None and column.default.is_scalar:
+            value = column.default.arg
+        elif column.default is None and column.server_default is None:
+            value = None
+        else:
+            continue
+        for row in rows:
+            row.setdefault(key, value)
+
+
+def association_key_columns(table: sa.Table, tx_column_name: str) -> list[sa.Column]:
+    """Return the columns identifying an association in given association version table.
+
+    These are the primary key columns of the association table. Association tables without a
+    primary key are identified by all of their columns.
+
+    :param table: Association version table
+    :param tx_column_name: Name of the transaction column
+    """
+    key_columns = [column for column in table.primary_key if column.name != tx_column_name]
+    if not key_columns:
+        parent = parent_table(table)
+        key_columns = [table.c[column.key] for column in parent.c]
+    return key_columns
+
+
+class VersionRow:
+    """Plain row of values standing in for a version object when the ``write_mode`` option is ``"core"``.
+
+    Attribute access reads and writes the underlying ``values`` dict so plugins using
+    ``after_create_version_object`` can treat it like a version object. Rows are written to the
+    database with bulk INSERT / UPDATE statements instead of the version session's unit of work.
+    """
+
+    __slots__ = ("persisted", "values", "version_cls")
+
+    def __init__(self, version_cls, *, persisted=False):
+        object.__setattr__(self, "version_cls", version_cls)
+        object.__setattr__(self, "values", {})
+        object.__setattr__(self, "persisted", persisted)
+
+    def __getattr__(self, key):
+        try:
+            return self.values[key]
+        except KeyError:
+            if key in sa.inspect(self.version_cls).attrs:
+                return None
+            raise AttributeError(key) from None
+
+    def __setattr__(self, key, value):
+        self.values[key] = value
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.version_cls.__name__} {self.values!r}>"
+
+
 class UnitOfWork:
     def __init__(self, manager):
         self.manager = manager
@@ -38,9 +127,13 @@ class UnitOfWork:
         """
         self.version_session = None
         self.current_transaction = None
-        self.operations = Operations()
-        self.pending_statements = []
+        self.operations = Operations(self.manager)
+        self.pending_association_rows = defaultdict(list)
         self.version_objs = {}
+        self.released_versions = set()
+        self.pending_version_rows = []
+        self.pending_validity = defaultdict(dict)
+        self.closed_versions = set()
 
     def is_modified(self, session):
         """Return whether or not given session has been modified.
@@ -122,6 +215,15 @@ class UnitOfWork:
 
         for key, value in args.items():
             setattr(self.current_transaction, key, value)
+
+        allocator = self.manager.transaction_id_allocator
+        if allocator is not None:
+            # The id is known up front, so the Transaction row can simply be written by the next flush
+            # of the session instead of a separate flush of the version session.
+            self.current_transaction.id = allocator.allocate(session.connection(), Transaction)
+            session.add(self.current_transaction)
+            return self.current_transaction
+
         if not self.version_session:
             self.version_session = self.create_version_session(session)
         self.version_session.add(self.current_transaction)
@@ -136,18 +238,40 @@ class UnitOfWork:
 
         :param target: Parent object to create the version object for
         """
-        version_cls = version_class(target.__class__)
-        version_id = (*identity(target), self.current_transaction.id)
+        plan = self.manager.plan(target.__class__)
+        version_cls = plan.version_cls
+        version_id = (*plan.identity(target), self.current_transaction.id)
         version_key = (version_cls, version_id)
 
         if version_key not in self.version_objs:
-            version_obj = version_cls()
+            if version_key in self.released_versions:
+                # The version row was written and released by an earlier flush in streaming mode
+                version_obj = VersionRow(version_cls, persisted=True)
+            elif self.manager.options["write_mode"] == "core":
+                version_obj = VersionRow(version_cls)
+            else:
+                version_obj = version_cls()
+                self.version_session.add(version_obj)
             self.version_objs[version_key] = version_obj
-            self.version_session.add(version_obj)
-            tx_column = self.manager.option(target, "transaction_column_name")
-            setattr(version_obj, tx_column, self.current_transaction.id)
-            return version_obj
-        return self.version_objs[version_key]
+            setattr(version_obj, plan.tx_column_name, self.current_transaction.id)
+        else:
+            version_obj = self.version_objs[version_key]
+        if isinstance(version_obj, VersionRow):
+            self.pending_version_rows.append(version_obj)
+        return version_obj
+
+    def version_object(self, target):
+        """Return the version object created for given parent object in the current transaction.
+
+        The version object is looked up by its version key, returns None if no version object of given
+        object is held by this UnitOfWork.
+
+        :param target: Parent object of the version object
+        """
+        if self.current_transaction is None:
+            return None
+        plan = self.manager.plan(target.__class__)
+        return self.version_objs.get((plan.version_cls, (*plan.identity(target), self.current_transaction.id)))
 
     def process_operation(self, operation):
         """Process given operation object. The operation processing has x stages:
@@ -159,6 +283,7 @@ class UnitOfWork:
         5. Mark operation as processed
 
         :param operation: Operation object
+        :returns: Version object of the operation target
 
         """
         target = operation.target
@@ -166,10 +291,12 @@ class UnitOfWork:
         version_obj.operation_type = operation.type
         self.assign_attributes(target, version_obj)
 
-        self.manager.plugins.after_create_version_object(self, target, version_obj)
-        if self.manager.option(target, "strategy") == "validity":
+        for hook in self.manager.plugins.hooks("after_create_version_object"):
+            hook(self, target, version_obj)
+        if self.manager.plan(target.__class__).strategy == "validity":
             self.update_version_validity(target, version_obj)
         operation.processed = True
+        return version_obj
 
     def create_version_objects(self, session):
         """Create version objects for given session based on operations collected by insert, update and
@@ -181,41 +308,138 @@ class UnitOfWork:
         if not self.manager.options["versioning"]:
             return
 
-        for _, operation in copy(self.operations).items():  # noqa: PERF102 -- Operations cannot work with .keys and .values
+        operations = self.operations.pop_unprocessed()
+        self.load_unloaded_attributes(session, operations)
+        batch_hooks = self.manager.plugins.hooks("after_create_version_objects_batch")
+        pairs = []
+        for operation in operations:
             if operation.processed:
                 continue
 
             if not self.current_transaction:
                 raise RuntimeError("Current transaction not available.")
-            self.process_operation(operation)
-
+            version_obj = self.process_operation(operation)
+            if batch_hooks:
+                pairs.append((operation.target, version_obj))
+
+        if pairs:
+            for hook in batch_hooks:
+                hook(self, pairs)
+
+        if self.pending_validity:
+            self.apply_version_validity()
+        if self.pending_version_rows:
+            self.flush_version_rows()
         self.version_session.flush()
 
-    def version_validity_subquery(self, parent, version_obj, alias=None):
-        """Return the subquery needed by :func:`update_version_validity`.
+    def load_unloaded_attributes(self, session, operations, batch_size=500):
+        """Load the expired and deferred versioned attributes of the targets of given operations.
 
-        This method is only used when using 'validity' versioning strategy.
+        Server generated values (server defaults, onupdate expressions, triggers) are expired by the
+        flush and deferred columns are not loaded at all. Instead of letting :meth:`assign_attributes`
+        refresh each object on its own, the missing values are selected with one query per class and
+        batch of primary keys and set as committed values of the objects.
 
-        :param parent: SQLAlchemy declarative parent object
-        :param version_obj: SQLAlchemy declarative version object
-        :param alias:  (Default value = None)
+        :param session: SQLAlchemy session object
+        :param operations: Operation objects about to be processed
+        :param batch_size: Maximum number of objects loaded with a single query (Default value = 500)
         """
-        fetcher = self.manager.fetcher(parent)
-        session = object_session(version_obj)
-
-        subquery = fetcher._transaction_id_subquery(version_obj, next_or_prev="prev", alias=alias)
-        if session.connection().engine.dialect.name == "mysql":
-            return sa.select(sa.text("max_1")).select_from(
-                sa.sql.expression.alias(
-                    subquery.subquery() if hasattr(subquery, "subquery") else subquery,
-                    name="subquery",
+        unloaded = defaultdict(dict)
+        for operation in operations:
+            if operation.processed or operation.type == Operation.DELETE:
+                continue
+            target = operation.target
+            plan = self.manager.plan(target.__class__)
+            state = sa.inspect(target)
+            # Unset attributes of objects inserted by this flush are not loaded from the database, only
+            # the expired ones holding server generated values are.
+            keys = (state.unloaded if state.key is not None else state.expired_attributes).intersection(
+                plan.column_keys
+            )
+            if keys:
+                identity = plan.identity(target)
+                if None not in identity:
+                    unloaded[target.__class__][identity] = (target, keys)
+
+        for cls, targets in unloaded.items():
+            plan = self.manager.plan(cls)
+            pk_attrs = [getattr(cls, key) for key in plan.primary_keys]
+            keys = sorted(set().union(*(keys for _, keys in targets.values())))
+            identities = list(targets)
+            for i in range(0, len(identities), batch_size):
+                batch = identities[i : i + batch_size]
+                stmt = (
+                    sa.select(*pk_attrs, *[getattr(cls, key) for key in keys])
+                    .select_from(cls)
+                    .where(key_criteria(pk_attrs, batch))
                 )
+                for row in session.execute(stmt):
+                    identity = tuple(row[: len(pk_attrs)])
+                    if identity not in targets:
+                        continue
+                    target, target_keys = targets[identity]
+                    for key, value in zip(keys, row[len(pk_attrs) :]):
+                        if key in target_keys:
+                            set_committed_value(target, key, value)
+
+    def flush_version_rows(self):
+        """Write the version rows collected while processing operations with the ``"core"`` write mode.
+
+        Rows are split per version table and written with one executemany INSERT per table, which
+        SQLAlchemy batches with insertmanyvalues where the dialect supports it. The values missing from
+        some of the rows of a table are filled by :func:`fill_missing_values` beforehand. Rows that were
+        already written during an earlier flush of this transaction are updated by primary key instead,
+        only setting the values they hold.
+        """
+        inserts = defaultdict(list)
+        updates = defaultdict(list)
+        for row in dict.fromkeys(self.pending_version_rows):
+            for table, values in version_table_rows(row.version_cls, row.values):
+                if row.persisted:
+                    updates[table, frozenset(values)].append(values)
+                else:
+                    inserts[table].append(values)
+            object.__setattr__(row, "persisted", True)
+        self.pending_version_rows = []
+
+        for table, rows in inserts.items():
+            fill_missing_values(table, rows)
+            batches = defaultdict(list)
+            for values in rows:
+                batches[frozenset(values)].append(values)
+            for batch in batches.values():
+                self.version_session.execute(table.insert(), batch)
+        for (table, keys), rows in updates.items():
+            stmt = table.update().where(*[column == sa.bindparam(f"pk_{column.key}") for column in table.primary_key])
+            # The rows only hold the values of the current flush for the columns the plugins merge, for
+            # example modification flags, so the values written by the earlier flushes of the
+            # transaction are kept by merging them in SQL.
+            merged = {key for plugin_keys in self.manager.plugins.merged_version_columns(table) for key in plugin_keys}
+            merged.intersection_update(keys)
+            if merged:
+                stmt = stmt.values({key: table.c[key].bitwise_or(sa.bindparam(f"merged_{key}")) for key in merged})
+            self.version_session.execute(
+                stmt,
+                [
+                    {
+                        **{
+                            f"merged_{key}" if key in merged else key: value
+                            for key, value in values.items()
+                            if not table.c[key].primary_key
+                        },
+                        **{f"pk_{column.key}": values[column.key] for column in table.primary_key},
+                    }
+                    for values in rows
+                ],
             )
-        return subquery
 
     def update_version_validity(self, parent, version_obj):
-        """Updates previous version object end_transaction_id based on given parent object and newly created
-         version object.
+        """Schedule the update of the previous version's end_transaction_id based on given parent object
+        and newly created version object.
+
+        The updates are collected per version table and applied by :meth:`apply_version_validity` with
+        one set-based statement per table once all operations of the flush have been processed. Keys
+        whose previous version was already closed earlier in this transaction are skipped.
 
         This method is only used when using 'validity' versioning strategy.
 
@@ -223,51 +447,69 @@ class UnitOfWork:
         :param version_obj: SQLAlchemy declarative version object
 
         """
-        session = object_session(version_obj)
-        for class_ in version_obj.__class__.__mro__:
-            if class_ in self.manager.version_class_map.values():
-                subquery = self.version_validity_subquery(parent, version_obj, alias=aliased(class_.__table__))
-                subquery = subquery.scalar_subquery()
-
-                session.execute(
-                    sa.update(class_.__table__)
-                    .where(
-                        sa.and_(
-                            getattr(class_, tx_column_name(version_obj)) == subquery,
-                            *[
-                                getattr(version_obj, pk) == getattr(class_.__table__.c, pk)
-                                for pk in get_primary_keys(class_)
-                                if pk != tx_column_name(class_)
-                            ],
-                        )
-                    )
-                    .values(**{end_tx_column_name(version_obj): self.current_transaction.id})
-                    .execution_options(synchronize_session=False)
-                )
+        plan = self.manager.plan(parent.__class__)
+        for table, key_attrs in plan.validity_tables:
+            key = tuple(getattr(version_obj, attr) for attr in key_attrs)
+            if (table, key) not in self.closed_versions:
+                self.pending_validity[table, plan.tx_column_name, plan.end_tx_column_name][key] = None
+
+    def apply_version_validity(self):
+        """Set end_transaction_id of the previous versions scheduled by :meth:`update_version_validity`."""
+        for (table, tx_column, end_tx_column), keys in self.pending_validity.items():
+            update_end_tx_column_for_keys(
+                table,
+                list(keys),
+                self.current_transaction.id,
+                end_tx_column_name=end_tx_column,
+                tx_column_name=tx_column,
+                conn=self.version_session.connection(),
+            )
+            self.closed_versions.update((table, key) for key in keys)
+        self.pending_validity = defaultdict(dict)
 
     def create_association_versions(self, session):
         """Creates association table version records for given session.
 
+        Pending association rows are written with one executemany INSERT per association version table.
+        With the validity strategy the end transaction ids of the previous versions of the touched
+        association keys are then updated with a single set-based statement per table.
+
         :param session: SQLAlchemy session object
 
         """
-        statements = copy(self.pending_statements)
-        for stmt in statements:
-            stmt = stmt.values(**{self.manager.options["transaction_column_name"]: self.current_transaction.id})
-            session.execute(stmt)
+        tx_column = self.manager.options["transaction_column_name"]
+        end_tx_column = self.manager.options["end_transaction_column_name"]
+        for table, rows in self.pending_association_rows.items():
+            batches = defaultdict(list)
+            for row in rows:
+                batches[tuple(row)].append({**row, tx_column: self.current_transaction.id})
+            for batch in batches.values():
+                session.execute(table.insert(), batch)
+
             if self.manager.options["strategy"] == "validity":
                 # FIXME: Currently we don't support setting versioning behaviour on bare table level
                 #        so we only refer to global configuration of manager and if it is set to validity
                 #        we always assign value to end_transaction_id table. which should have no impact as
                 #        if user is not using this column it won't impact except executing a redundant
                 #        assocition query for end_transaction_id, maybe provide a flag to disable this?
-                update_end_tx_column(
-                    stmt.table,
-                    end_tx_column_name=self.manager.options["end_transaction_column_name"],
-                    tx_column_name=self.manager.options["transaction_column_name"],
-                    conn=session.connection(),
-                )
-        self.pending_statements = []
+                key_columns = association_key_columns(table, tx_column)
+                keys = [
+                    key
+                    for key in dict.fromkeys(tuple(row.get(column.key) for column in key_columns) for row in rows)
+                    if (table, key) not in self.closed_versions
+                ]
+                if keys:
+                    update_end_tx_column_for_keys(
+                        table,
+                        keys,
+                        self.current_transaction.id,
+                        end_tx_column_name=end_tx_column,
+                        tx_column_name=tx_column,
+                        key_columns=key_columns,
+                        conn=session.connection(),
+                    )
+                    self.closed_versions.update((table, key) for key in keys)
+        self.pending_association_rows = defaultdict(list)
 
     def make_versions(self, session):
         """Create transaction, transaction changes records, version objects.
@@ -278,18 +520,32 @@ class UnitOfWork:
         if not self.manager.options["versioning"]:
             return
 
-        if self.pending_statements:
+        if self.pending_association_rows:
             self.create_association_versions(session)
 
         if self.operations:
             self.manager.plugins.before_create_version_objects(self, session)
             self.create_version_objects(session)
             self.manager.plugins.after_create_version_objects(self, session)
+            if self.manager.options["streaming"]:
+                self.release_versions()
+
+    def release_versions(self):
+        """Drop the references to the objects versioned so far in this transaction.
+
+        This is used by the streaming mode once the version rows of a flush have been written. Only
+        the keys of the written version rows are kept, so that changing the same object again later in
+        the transaction updates its version row instead of adding another one.
+        """
+        self.released_versions.update(self.version_objs)
+        self.version_objs = {}
+        self.operations.release_processed()
+        self.version_session.expunge_all()
 
     @property
     def has_changes(self):
         """Return whether or not this unit of work has changes."""
-        return self.operations or self.pending_statements
+        return self.operations or self.pending_association_rows
 
     def assign_attributes(self, parent_obj, version_obj):
         """Assign attributes values from parent object to version object.
@@ -299,7 +555,7 @@ class UnitOfWork:
 
         """
         state = sa.inspect(parent_obj)
-        for prop in versioned_column_properties(parent_obj):
+        for prop in self.manager.plan(parent_obj.__class__).column_properties:
             if version_obj.operation_type == Operation.DELETE and prop.key in state.unloaded:
                 value = None
             else:
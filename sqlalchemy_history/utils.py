@@ -4,19 +4,21 @@ Utility Functions
 
 import typing as t
 from collections import defaultdict
+from datetime import datetime
 from inspect import isclass
 from itertools import chain
 
 import sqlalchemy as sa
 from sqlalchemy.ext.associationproxy import AssociationProxy
-from sqlalchemy.orm import ColumnProperty, RelationshipProperty, Session, object_session
+from sqlalchemy.orm import ColumnProperty, RelationshipProperty, Session, aliased, object_session
 from sqlalchemy.orm.attributes import QueryableAttribute, get_history
 from sqlalchemy.orm.util import AliasedClass
 from sqlalchemy.sql import ClauseElement
 from sqlalchemy.sql.visitors import ReplacingCloningVisitor
-from sqlalchemy_utils.functions import get_primary_keys, identity, naturally_equivalent
+from sqlalchemy_utils.functions import get_primary_keys, naturally_equivalent
 
 from sqlalchemy_history.exc import ClassNotVersioned, TableNotVersioned
+from sqlalchemy_history.operation import Operation
 
 
 if t.TYPE_CHECKING:
@@ -90,11 +92,8 @@ def parent_class(version_cls):
     :returns:
     """
     manager = get_versioning_manager(version_cls)
-    try:
-        return next((k for k, v in manager.version_class_map.items() if v == version_cls))
-    except StopIteration:
-        # Should raise Key Error if we can't find the parent_object of a orphaned versioned_model
-        raise KeyError(version_cls) from None
+    # Should raise Key Error if we can't find the parent_object of a orphaned versioned_model
+    return manager.parent_class_map[version_cls]
 
 
 def parent_table(version_table: sa.Table) -> sa.Table:
@@ -104,11 +103,8 @@ def parent_table(version_table: sa.Table) -> sa.Table:
     :param version_table: A versioned table table which could be either association_table or model_table.
     """
     manager = get_versioning_manager(version_table)
-    try:
-        return next((k for k, v in manager.version_table_map.items() if v == version_table))
-    except StopIteration:
-        # Raise Key error as we couldn't find parent_object of versioned_object
-        raise KeyError(version_table) from None
+    # Raise Key error as we couldn't find parent_object of versioned_object
+    return manager.parent_table_map[version_table]
 
 
 def transaction_class(cls):
@@ -125,12 +121,7 @@ def transaction_class(cls):
 def version_obj(session: Session, parent_obj):
     manager = get_versioning_manager(parent_obj)
     uow = manager.unit_of_work(session)
-    for version_obj in uow.version_session:
-        if parent_class(version_obj.__class__) == parent_obj.__class__ and identity(version_obj)[:-1] == identity(
-            parent_obj
-        ):
-            return version_obj
-    return None
+    return uow.version_object(parent_obj)
 
 
 def version_class(model):
@@ -155,6 +146,78 @@ def version_table(table: sa.Table) -> t.Optional[sa.Table]:
     return manager.version_table_map.get(table, None)
 
 
+def as_of(model_or_table, tx):
+    """
+    Return the versions of given versioned class or table which were current
+    at given transaction, in other words the rows as they were right after
+    given transaction. The result can be joined like the class or table
+    itself. With the validity strategy the versions are picked with their
+    validity range, with the subquery strategy with the highest transaction
+    id up to given transaction of each row.
+
+    ::
+
+        ArticleAsOf = as_of(Article, 100)
+        TagAsOf = as_of(Tag, 100)
+        session.scalars(sa.select(TagAsOf).join(ArticleAsOf, TagAsOf.article_id == ArticleAsOf.id))
+
+        article_tag = as_of(article_tag_table, 100)
+        sa.select(article_tag.c.tag_id).where(article_tag.c.article_id == 1)
+
+    :param model_or_table: Versioned SQLAlchemy declarative class or versioned table
+    :param tx: Transaction id, transaction id expression or a datetime resolved to the last
+        transaction issued at or before it
+    :returns: Alias of the version class for a class, subquery of the version table for a table
+    """
+    manager = get_versioning_manager(model_or_table)
+    if isinstance(model_or_table, sa.Table):
+        versions = version_table(model_or_table)
+        previous = versions.alias()
+        strategy = manager.options["strategy"]
+        tx_column_name_ = manager.options["transaction_column_name"]
+        end_tx_column_name_ = manager.options["end_transaction_column_name"]
+        operation_type_column_name = manager.options["operation_type_column_name"]
+        columns, previous_columns = versions.c, previous.c
+        keys = [column.key for column in versions.primary_key if column.key != tx_column_name_]
+    else:
+        plan = manager.plan(model_or_table)
+        versions = plan.version_cls
+        previous = aliased(versions)
+        strategy = plan.strategy
+        tx_column_name_ = plan.tx_column_name
+        end_tx_column_name_ = plan.end_tx_column_name
+        operation_type_column_name = plan.operation_type_column_name
+        columns, previous_columns = versions, previous
+        keys = plan.version_parent_keys
+
+    if isinstance(tx, datetime):
+        tx_cls = manager.transaction_cls
+        tx = (
+            sa.select(tx_cls.id)
+            .where(tx_cls.issued_at <= tx)
+            .order_by(tx_cls.issued_at.desc(), tx_cls.id.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+
+    tx_column = getattr(columns, tx_column_name_)
+    if strategy == "validity":
+        end_tx_column = getattr(columns, end_tx_column_name_)
+        criteria = [tx_column <= tx, sa.or_(end_tx_column > tx, end_tx_column.is_(None))]
+    else:
+        last_tx_id = sa.select(sa.func.max(getattr(previous_columns, tx_column_name_))).where(
+            getattr(previous_columns, tx_column_name_) <= tx,
+            *[getattr(previous_columns, key) == getattr(columns, key) for key in keys],
+        )
+        criteria = [tx_column == last_tx_id.scalar_subquery()]
+    criteria.append(getattr(columns, operation_type_column_name) != Operation.DELETE)
+
+    query = sa.select(versions).where(*criteria)
+    if isinstance(model_or_table, sa.Table):
+        return query.subquery()
+    return aliased(versions, query.subquery())
+
+
 def versioned_objects(session: Session):
     """
     Return all versioned objects in given session.
@@ -218,7 +281,8 @@ def versioned_relationships(obj, versioned_column_keys: list[str]) -> t.Iterator
     :returns: declarative model object.
 
     """
-    for prop in sa.inspect(obj.__class__).relationships:
+    cls = obj if isclass(obj) else obj.__class__
+    for prop in sa.inspect(cls).relationships:
         if any(c.key in versioned_column_keys for c in prop.local_columns):
             yield prop
 
@@ -307,29 +371,43 @@ def is_modified(obj) -> bool:
     :returns: modified.
 
     """
-    column_names = sa.inspect(obj.__class__).columns.keys()
-    versioned_column_keys = [prop.key for prop in versioned_column_properties(obj)]
-    versioned_relationship_keys = [prop.key for prop in versioned_relationships(obj, versioned_column_keys)]
-    for key, attr in sa.inspect(obj).attrs.items():
-        if key in column_names:
-            if key not in versioned_column_keys:
-                continue
-            if attr.history.has_changes():
-                return True
-        if key in versioned_relationship_keys and attr.history.has_changes():
-            return True
-    return False
+    return bool(changed_versioned_keys(obj))
+
+
+def changed_versioned_keys(obj) -> frozenset[str]:
+    """
+    Return the keys of the versioned columns and the relationships backed by
+    them whose values of given object have changed.
+
+    Only the attributes recorded in the committed state of the object are
+    inspected, so the cost depends on the number of assigned attributes rather
+    than on the number of columns.
+
+    :param obj: SQLAlchemy declarative model object
+    :returns: frozenset of attribute keys
+
+    """
+    state = sa.inspect(obj)
+    tracked_keys = get_versioning_manager(obj).plan(obj.__class__).tracked_keys
+    return frozenset(
+        key for key in state.committed_state if key in tracked_keys and state.attrs[key].history.has_changes()
+    )
 
 
 def is_session_modified(session: Session) -> bool:
     """Return whether or not any of the versioned objects in given session have
     been either modified or deleted.
 
+    Only the pending, dirty and deleted objects of the session are inspected, so the cost
+    depends on the number of changed objects rather than on the size of the identity map.
+
     :param session: SQLAlchemy session object
     :returns: Bool
 
     """
-    return any(is_modified_or_deleted(obj) for obj in versioned_objects(session))
+    return any(is_versioned(obj) for obj in chain(session.new, session.deleted)) or any(
+        is_versioned(obj) and is_modified(obj) for obj in session.dirty
+    )
 
 
 def count_versions(obj) -> int:
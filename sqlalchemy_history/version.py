@@ -60,6 +60,9 @@ class VersionClassBase:
 
         Use this when working with async SQLAlchemy.
         """
+        # Cached by the synchronous accessor or prefetch_history
+        if "previous" in self.__dict__:
+            return self.__dict__["previous"]
         return await get_versioning_manager(self).fetcher(parent_class(self.__class__)).aprevious(self)
 
     @property
@@ -71,6 +74,8 @@ class VersionClassBase:
 
         Use this when working with async SQLAlchemy.
         """
+        if "next" in self.__dict__:
+            return self.__dict__["next"]
         return await get_versioning_manager(self).fetcher(parent_class(self.__class__)).anext(self)
 
     @property
@@ -79,6 +84,8 @@ class VersionClassBase:
         """Returns the index of this version in the version history.
 
         Use this when working with async SQLAlchemy."""
+        if "index" in self.__dict__:
+            return self.__dict__["index"]
         return await get_versioning_manager(self).fetcher(parent_class(self.__class__)).aindex(self)
 
     def revert(self, relations=None):
@@ -71,12 +71,17 @@ def get_dns_from_driver(driver, *, mode: t.Literal["sync", "async"] = "sync"):
 
 class TestCase:
     versioning_strategy = "subquery"
+    write_mode = "orm"
+    streaming = False
+    fetcher = "auto"
+    indexes = "default"
     transaction_column_name = "transaction_id"
     end_transaction_column_name = "end_transaction_id"
     composite_pk = False
     plugins = [TransactionChangesPlugin(), TransactionMetaPlugin()]
     transaction_cls = TransactionFactory()
     user_cls = None
+    transaction_id_allocator = None
     should_create_models = True
 
     @property
@@ -85,6 +90,10 @@ class TestCase:
             "create_models": self.should_create_models,
             "base_classes": (self.Model,),
             "strategy": self.versioning_strategy,
+            "write_mode": self.write_mode,
+            "streaming": self.streaming,
+            "fetcher": self.fetcher,
+            "indexes": self.indexes,
             "support_async": False,
             "transaction_column_name": self.transaction_column_name,
             "end_transaction_column_name": self.end_transaction_column_name,
@@ -101,6 +110,7 @@ class TestCase:
         make_versioned(options=self.options, plugins=self.plugins)
         versioning_manager.transaction_cls = self.transaction_cls
         versioning_manager.user_cls = self.user_cls
+        versioning_manager.transaction_id_allocator = self.transaction_id_allocator
 
     @pytest.fixture
     def setup_engine(self, setup_versioning):
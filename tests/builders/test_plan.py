@@ -0,0 +1,63 @@
+import pytest
+import sqlalchemy as sa
+
+from sqlalchemy_history import versioning_manager
+from sqlalchemy_history.plan import VersioningPlan
+from tests import TestCase
+
+
+class TestVersioningPlan(TestCase):
+    versioning_strategy = "validity"
+
+    def create_models(self):
+        class TextItem(self.Model):
+            __tablename__ = "text_item"
+            __versioned__ = {"exclude": ["content"]}
+            id = sa.Column(
+                sa.Integer, sa.Sequence(f"{__tablename__}_seq", start=1), autoincrement=True, primary_key=True
+            )
+            name = sa.Column(sa.Unicode(255))
+            content = sa.Column(sa.UnicodeText)
+            discriminator = sa.Column(sa.Unicode(100))
+            __mapper_args__ = {"polymorphic_on": discriminator}
+
+        class Article(TextItem):
+            __tablename__ = "article"
+            __mapper_args__ = {"polymorphic_identity": "article"}
+            id = sa.Column(sa.Integer, sa.ForeignKey(TextItem.id), primary_key=True)
+
+        self.TextItem = TextItem
+        self.Article = Article
+
+    def test_built_for_versioned_classes(self):
+        assert isinstance(versioning_manager.plans[self.TextItem], VersioningPlan)
+        assert isinstance(versioning_manager.plans[self.Article], VersioningPlan)
+
+    def test_options(self):
+        plan = versioning_manager.plan(self.Article)
+        assert plan.version_cls is versioning_manager.version_class_map[self.Article]
+        assert plan.tx_column_name == self.transaction_column_name
+        assert plan.end_tx_column_name == self.end_transaction_column_name
+        assert plan.strategy == "validity"
+
+    def test_column_keys(self):
+        assert set(versioning_manager.plan(self.TextItem).column_keys) == {"id", "name", "discriminator"}
+
+    def test_identity(self):
+        article = self.Article(id=3, name="Some article")
+        assert versioning_manager.plan(self.Article).identity(article) == (3,)
+
+    def test_validity_tables_include_inherited_version_tables(self):
+        plan = versioning_manager.plan(self.Article)
+        tables = [table.name for table, _ in plan.validity_tables]
+        assert tables == ["article_version", "text_item_version"]
+
+    def test_is_immutable(self):
+        plan = versioning_manager.plan(self.Article)
+        with pytest.raises(AttributeError):
+            plan.strategy = "subquery"
+
+    def test_reverse_maps(self):
+        version_cls = versioning_manager.version_class_map[self.Article]
+        assert versioning_manager.parent_class_map[version_cls] is self.Article
+        assert versioning_manager.parent_table_map[version_cls.__table__] is self.Article.__table__
@@ -4,6 +4,7 @@ from datetime import datetime
 
 import pytest
 import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
 
 from sqlalchemy_history import version_class
 from tests import TestCase
@@ -139,3 +140,117 @@ class TestEnumNaming(TestCase):
     def test_name_enums(self):
         version_model = version_class(self.Article)
         assert version_model.enum_col.type.name == "history_test_enum"
+
+
+class VersionTableIndexesTestCase(TestCase):
+    def table_indexes(self, table):
+        return {index.name: [column.name for column in index.columns] for index in table.indexes}
+
+
+class TestDefaultIndexProfile(VersionTableIndexesTestCase):
+    def test_indexes_internal_columns(self):
+        assert self.table_indexes(version_class(self.Article).__table__) == {
+            "ix_article_version_transaction_id": ["transaction_id"],
+            "ix_article_version_operation_type": ["operation_type"],
+        }
+
+
+class TestValidityIndexProfile(VersionTableIndexesTestCase):
+    versioning_strategy = "validity"
+    indexes = "validity"
+
+    def test_indexes(self):
+        assert self.table_indexes(version_class(self.Article).__table__) == {
+            "ix_article_version_transaction_id": ["transaction_id"],
+            "ix_article_version_end_transaction_id": ["id", "end_transaction_id"],
+            "ix_article_version_current": ["id"],
+        }
+
+    def test_partial_index_created_on_supported_dialects(self):
+        created = {index["name"] for index in sa.inspect(self.session.connection()).get_indexes("article_version")}
+        assert ("ix_article_version_current" in created) == (
+            self.engine.dialect.name in ("postgresql", "sqlite", "mssql")
+        )
+
+    def test_versioning(self):
+        article = self.Article(name="Some article")
+        self.session.add(article)
+        self.session.commit()
+        article.name = "Updated article"
+        self.session.commit()
+        assert article.versions[0].end_transaction_id == article.versions[1].transaction_id
+
+
+class TestAutoIndexProfile(VersionTableIndexesTestCase):
+    indexes = "auto"
+
+    def test_indexes_follow_strategy(self):
+        indexes = self.table_indexes(version_class(self.Article).__table__)
+        assert ("ix_article_version_end_transaction_id" in indexes) == (self.versioning_strategy == "validity")
+        assert "ix_article_version_transaction_id" in indexes
+
+
+class TestAutoIndexProfileWithValidity(TestAutoIndexProfile):
+    versioning_strategy = "validity"
+
+
+class TestLongIndexNames(VersionTableIndexesTestCase):
+    versioning_strategy = "validity"
+    indexes = "validity"
+
+    def create_models(self):
+        TestCase.create_models(self)
+
+        class Comment(self.Model):
+            __tablename__ = "comment_with_a_table_name_reaching_the_mysql_limit"
+            __versioned__ = copy(self.options)
+            id = sa.Column(sa.Integer, autoincrement=True, primary_key=True)
+
+        self.Comment = Comment
+
+    def test_names_truncated(self):
+        indexes = version_class(self.Comment).__table__.indexes
+        assert len(indexes) == 3
+        for index in indexes:
+            name = str(sa.schema.CreateIndex(index).compile(dialect=mysql.dialect())).split()[2]
+            assert len(name) <= 64
+
+
+class TestSubqueryIndexProfile(VersionTableIndexesTestCase):
+    indexes = "subquery"
+
+    def test_indexes(self):
+        assert self.table_indexes(version_class(self.Article).__table__) == {
+            "ix_article_version_transaction_id": ["transaction_id"],
+        }
+
+
+class TestMinimalIndexProfile(VersionTableIndexesTestCase):
+    indexes = "minimal"
+
+    def test_indexes(self):
+        assert self.table_indexes(version_class(self.Article).__table__) == {}
+
+
+def name_index(table_builder, table):
+    if "name" in table.c:
+        sa.Index(f"ix_{table.name}_name", table.c.name)
+
+
+class TestCustomIndexProfile(VersionTableIndexesTestCase):
+    indexes = staticmethod(name_index)
+
+    def test_indexes(self):
+        assert self.table_indexes(version_class(self.Article).__table__) == {
+            "ix_article_version_name": ["name"],
+        }
+
+
+class TestModelIndexProfile(VersionTableIndexesTestCase):
+    def create_models(self):
+        TestCase.create_models(self)
+        self.Tag.__versioned__["indexes"] = "minimal"
+
+    def test_indexes(self):
+        assert self.table_indexes(version_class(self.Tag).__table__) == {}
+        assert "ix_article_version_transaction_id" in self.table_indexes(version_class(self.Article).__table__)
@@ -1,7 +1,7 @@
 import pytest
 import sqlalchemy as sa
 
-from sqlalchemy_history import version_class
+from sqlalchemy_history import as_of, version_class
 from tests import TestCase, create_test_cases
 
 
@@ -125,6 +125,18 @@ class JoinTableInheritanceTestCase(TestCase):
             sa.text(f"SELECT {end_tx_column} FROM article_version ORDER BY {tx_column}")
         ).fetchone()[0]
 
+    def test_as_of(self):
+        article = self.Article(name="Some article")
+        self.session.add(article)
+        self.session.commit()
+        article.name = "Updated article"
+        self.session.commit()
+        tx_id = getattr(article.versions[0], self.options["transaction_column_name"])
+
+        ArticleAsOf = as_of(self.Article, tx_id)
+        versions = self.session.scalars(sa.select(ArticleAsOf)).all()
+        assert [(type(version), version.name) for version in versions] == [(self.ArticleVersion, "Some article")]
+
 
 create_test_cases(JoinTableInheritanceTestCase)
 
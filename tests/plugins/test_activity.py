@@ -1,3 +1,5 @@
+import gc
+
 import pytest
 import sqlalchemy as sa
 
@@ -196,3 +198,153 @@ class TestTargetTxIdGeneration(ActivityTestCase):
         assert activity.object_version == tag.versions.all()[-1]
         assert activity.target == article
         assert activity.target_version == article.versions.all()[-1]
+
+
+# ref : https://github.com/kvesteri/sqlalchemy-utils/issues/719
+@pytest.mark.skipif(str(sa.__version__).startswith("2."), reason="sqla-utils generic relations has issue with sqla 2.x")
+class TestBatchedTxIdGeneration(ActivityTestCase):
+    def test_resolves_tx_ids_with_one_query_per_class(self):
+        articles = []
+        for i in range(3):
+            articles.append(self.create_article())
+            articles[-1].name = f"Article {i}"
+            self.session.commit()
+        for article in articles:
+            self.create_activity(object_=article, target=articles[0])
+        QueryPool.queries = []
+        self.session.commit()
+
+        lookups = [query for query in QueryPool.queries if "max(article_version.transaction_id)" in query]
+        assert len(lookups) == 1
+        Activity = versioning_manager.activity_cls
+        for article, activity in zip(articles, self.session.scalars(sa.select(Activity).order_by(Activity.id))):
+            assert activity.object_version == article.versions.all()[-1]
+            assert activity.target_version == articles[0].versions.all()[-1]
+
+
+class TestActivityFeed(ActivityTestCase):
+    def create_activities(self):
+        article = self.create_article()
+        other = self.create_article()
+        self.session.flush()
+        activities = [
+            self.create_activity(object_=article),
+            self.create_activity(object_=other),
+            self.create_activity(object_=other, target=article),
+        ]
+        activities[1].verb = "update"
+        self.session.commit()
+        return article, activities
+
+    def test_indexes(self):
+        table = versioning_manager.activity_cls.__table__
+        indexes = {index.name: [column.name for column in index.columns] for index in table.indexes}
+        assert indexes["ix_activity_object"] == ["object_type", "object_id", "id"]
+        assert indexes["ix_activity_target"] == ["target_type", "target_id", "id"]
+
+    def test_keyset_pagination(self):
+        plugin = self.plugins[0]
+        _, activities = self.create_activities()
+        query = plugin.feed_query(limit=2)
+        assert "OFFSET" not in str(query)
+        page = self.session.scalars(query).all()
+        assert page == [activities[2], activities[1]]
+        page = self.session.scalars(plugin.feed_query(limit=2, before_id=page[-1].id)).all()
+        assert page == [activities[0]]
+
+    def test_filter_by_object_and_verb(self):
+        plugin = self.plugins[0]
+        article, activities = self.create_activities()
+        assert self.session.scalars(plugin.feed_query(article)).all() == [activities[2], activities[0]]
+        assert self.session.scalars(plugin.feed_query(verb="update")).all() == [activities[1]]
+
+    def test_object_feed_pagination(self):
+        plugin = self.plugins[0]
+        article, activities = self.create_activities()
+        activities.append(self.create_activity(object_=article, target=article))
+        self.session.commit()
+        query = plugin.feed_query(article, limit=2)
+        assert "UNION ALL" in str(query)
+        page = self.session.scalars(query).all()
+        assert page == [activities[3], activities[2]]
+        page = self.session.scalars(plugin.feed_query(article, limit=2, before_id=page[-1].id)).all()
+        assert page == [activities[0]]
+
+    def test_feed_of_unsaved_object(self):
+        with pytest.raises(ValueError, match="has not been saved"):
+            self.plugins[0].feed_query(self.Article(name="Some article"))
+
+
+class TestActivityFeedOfCompositeKey(ActivityTestCase):
+    def create_models(self):
+        ActivityTestCase.create_models(self)
+
+        class Membership(self.Model):
+            __tablename__ = "membership"
+            user_id = sa.Column(sa.Integer, primary_key=True)
+            group_id = sa.Column(sa.Integer, primary_key=True)
+
+        self.Membership = Membership
+
+    def test_composite_primary_key_rejected(self):
+        membership = self.Membership(user_id=1, group_id=1)
+        self.session.add(membership)
+        self.session.commit()
+        with pytest.raises(ValueError, match="composite"):
+            self.plugins[0].feed_query(membership)
+
+
+class TestActivityWithoutIndexes(ActivityTestCase):
+    plugins = [ActivityPlugin(object_index=False, target_index=False)]
+
+    def test_indexes(self):
+        assert [index.name for index in versioning_manager.activity_cls.__table__.indexes] == [
+            "ix_activity_transaction_id"
+        ]
+
+
+class TestLoadRelated(ActivityTestCase):
+    def test_loads_related_objects_and_versions_in_batches(self):
+        articles = [self.create_article() for _ in range(3)]
+        self.session.flush()
+        tag = self.Tag(name="Some tag")
+        self.session.add(tag)
+        self.session.flush()
+        for article in articles:
+            self.create_activity(object_=article, target=tag)
+        self.session.commit()
+        self.session.expunge_all()
+
+        activities = self.session.scalars(self.plugins[0].feed_query()).all()
+        QueryPool.queries = []
+        related = self.plugins[0].load_related(self.session, activities)
+        assert len(QueryPool.queries) == 4
+        assert len(related) == 8
+
+        QueryPool.queries = []
+        for activity in activities:
+            assert activity.object.name == "Some article"
+            assert activity.object_version.name == "Some article"
+            assert activity.target.name == "Some tag"
+            assert activity.target_version.name == "Some tag"
+        assert not QueryPool.queries
+
+    def test_related_objects_kept_by_returned_list(self):
+        article = self.create_article()
+        self.session.flush()
+        self.create_activity(object_=article)
+        self.session.commit()
+        self.session.expunge_all()
+
+        activities = self.session.scalars(self.plugins[0].feed_query()).all()
+        related = self.plugins[0].load_related(self.session, activities)
+        gc.collect()
+        QueryPool.queries = []
+        assert activities[0].object.name == "Some article"
+        assert not QueryPool.queries
+
+        # The session only holds weak references, the objects are gone with the list
+        del related
+        gc.collect()
+        assert activities[0].object_version.name == "Some article"
+        assert QueryPool.queries
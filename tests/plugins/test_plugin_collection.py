@@ -1,4 +1,7 @@
+from sqlalchemy_history import versioning_manager
 from sqlalchemy_history.plugins import PluginCollection
+from sqlalchemy_history.plugins.base import Plugin
+from tests import TestCase
 
 
 class TestPluginCollection:
@@ -30,6 +33,13 @@ class TestPluginCollection:
         coll.append(3)
         assert list(coll) == [1, 2, 3]
 
+    def test_copies_plugins(self):
+        plugins = [1, 2]
+        coll = PluginCollection(plugins)
+        plugins.append(3)
+        coll.plugins.append(3)
+        assert list(coll) == [1, 2]
+
     def test_getattr(self):
         class MyPlugin:
             def some_action(self):
@@ -37,3 +47,59 @@ class TestPluginCollection:
 
         coll = PluginCollection([MyPlugin(), MyPlugin()])
         assert list(coll.some_action()) == [4, 4]
+
+    def test_hooks_only_contain_overriding_plugins(self):
+        class MyPlugin(Plugin):
+            def before_flush(self, uow, session):
+                return 1
+
+        plugin = MyPlugin()
+        coll = PluginCollection([Plugin(), plugin])
+        assert coll.hooks("before_flush") == (plugin.before_flush,)
+        assert coll.hooks("after_create_version_object") == ()
+        assert coll.before_flush(None, None) == [1]
+        assert coll.after_create_version_object(None, None, None) == []
+
+    def test_hooks_are_refreshed_on_append(self):
+        class MyPlugin(Plugin):
+            def before_flush(self, uow, session):
+                return 1
+
+        coll = PluginCollection([Plugin()])
+        assert coll.before_flush(None, None) == []
+        coll.append(MyPlugin())
+        assert coll.before_flush(None, None) == [1]
+        del coll[1]
+        assert coll.before_flush(None, None) == []
+
+
+class BatchPlugin(Plugin):
+    def __init__(self):
+        self.batches = []
+
+    def after_create_version_objects_batch(self, uow, pairs):
+        self.batches.append(pairs)
+
+
+class TestAfterCreateVersionObjectsBatch(TestCase):
+    plugins = [BatchPlugin()]
+
+    def test_called_once_per_flush_with_all_pairs(self):
+        plugin = self.plugins[0]
+        plugin.batches = []
+        articles = [self.Article(name=f"Article {i}") for i in range(3)]
+        self.session.add_all(articles)
+        self.session.commit()
+
+        assert len(plugin.batches) == 1
+        pairs = plugin.batches[0]
+        assert [parent for parent, _ in pairs] == articles
+        assert all(isinstance(version_obj, self.ArticleVersion) for _, version_obj in pairs)
+
+    def test_not_called_without_version_objects(self):
+        plugin = self.plugins[0]
+        plugin.batches = []
+        self.session.add(self.Article(name="Some article"))
+        self.session.flush()
+        versioning_manager.unit_of_work(self.session).create_version_objects(self.session)
+        assert len(plugin.batches) == 1
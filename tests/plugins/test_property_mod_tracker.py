@@ -1,8 +1,12 @@
+import os
+
+import pytest
 import sqlalchemy as sa
 from sqlalchemy.orm import relationship
 
 from sqlalchemy_history import version_class
 from sqlalchemy_history.plugins import PropertyModTrackerPlugin
+from sqlalchemy_history.plugins.property_mod_tracker import MOD_BITS_INFO_KEY
 from tests import TestCase
 
 
@@ -178,3 +182,130 @@ class TestModTrackingWithRelationships(TestCase):
         self.session.commit()
 
         assert tag.versions.all()[-1].article_id_mod
+
+
+class TestPropertyModificationsBitmask(TestCase):
+    plugins = [PropertyModTrackerPlugin(storage="bitmask")]
+
+    def create_models(self):
+        class User(self.Model):
+            __tablename__ = "text_item"
+            __versioned__ = {"base_classes": (self.Model,)}
+            id = sa.Column(
+                sa.Integer, sa.Sequence(f"{__tablename__}_seq", start=1), autoincrement=True, primary_key=True
+            )
+
+            name = sa.Column(sa.Unicode(255))
+
+            age = sa.Column(sa.Integer)
+
+        self.User = User
+
+    def modified(self, key):
+        UserVersion = version_class(self.User)
+        query = sa.select(UserVersion.transaction_id).where(UserVersion.modified(key))
+        return self.session.scalars(query.order_by(UserVersion.transaction_id)).all()
+
+    def test_single_mask_column(self):
+        table = version_class(self.User).__table__
+        assert "name_mod" not in table.c
+        column = table.c["mod_mask"]
+        assert not column.nullable
+        assert isinstance(column.type, sa.BigInteger)
+        assert column.info[MOD_BITS_INFO_KEY] == {"name": 0, "age": 1}
+
+    def test_mod_flags(self):
+        user = self.User(name="John")
+        self.session.add(user)
+        self.session.commit()
+        user.age = 14
+        self.session.commit()
+        self.session.delete(user)
+        self.session.commit()
+        versions = self.session.scalars(
+            sa.select(version_class(self.User)).order_by(version_class(self.User).transaction_id)
+        ).all()
+        assert [version.mod_mask for version in versions] == [1, 2, 3]
+        assert self.modified("name") == [versions[0].transaction_id, versions[2].transaction_id]
+        assert self.modified("age") == [versions[1].transaction_id, versions[2].transaction_id]
+
+    def test_consequtive_update_and_update(self):
+        user = self.User(name="John")
+        self.session.add(user)
+        self.session.commit()
+        user.name = "Jack"
+        self.session.flush()
+        user.age = 15
+        self.session.commit()
+        assert user.versions.all()[-1].mod_mask == 3
+
+    def test_changeset_excludes_mask(self):
+        user = self.User(name="John")
+        self.session.add(user)
+        self.session.commit()
+        assert "mod_mask" not in user.versions[0].changeset
+
+    def test_untracked_key(self):
+        with pytest.raises(KeyError):
+            version_class(self.User).modified("id")
+
+    @pytest.mark.skipif(
+        os.environ.get("DB") in ["mssql", "oracle"],
+        reason="mssql and oracle don't support indexes on bitwise expressions",
+    )
+    def test_modified_index(self):
+        UserVersion = version_class(self.User)
+        index = self.plugins[0].create_modified_index(UserVersion, "age")
+        assert index.name == "ix_text_item_version_age_mod"
+        index.create(self.session.connection())
+        user = self.User(name="John", age=14)
+        self.session.add(user)
+        self.session.commit()
+        assert self.modified("age") == [user.versions[0].transaction_id]
+
+
+class TestPropertyModificationsBitmaskStreaming(TestPropertyModificationsBitmask):
+    streaming = True
+
+    def test_flags_of_released_version_kept(self):
+        user = self.User(name="John")
+        self.session.add(user)
+        self.session.flush()
+        user.age = 15
+        self.session.flush()
+        self.session.commit()
+        version = user.versions.all()[-1]
+        assert version.mod_mask == 3
+        assert self.modified("name") == [version.transaction_id]
+
+
+class TestPropertyModificationsBitmaskWideTable(TestCase):
+    plugins = [PropertyModTrackerPlugin(storage="bitmask")]
+
+    def create_models(self):
+        columns = {f"column_{i}": sa.Column(sa.Integer) for i in range(70)}
+        self.Wide = type(
+            "Wide",
+            (self.Model,),
+            {
+                "__tablename__": "wide",
+                "__versioned__": {},
+                "id": sa.Column(sa.Integer, sa.Sequence("wide_seq", start=1), autoincrement=True, primary_key=True),
+                **columns,
+            },
+        )
+
+    def test_mask_columns_split(self):
+        table = version_class(self.Wide).__table__
+        assert len(table.c["mod_mask"].info[MOD_BITS_INFO_KEY]) == 63
+        assert table.c["mod_mask_1"].info[MOD_BITS_INFO_KEY] == {f"column_{i}": i - 63 for i in range(63, 70)}
+
+    def test_mod_flags(self):
+        wide = self.Wide(column_1=1, column_65=1)
+        self.session.add(wide)
+        self.session.commit()
+        version = wide.versions[0]
+        assert version.mod_mask == 1 << 1
+        assert version.mod_mask_1 == 1 << 2
+        WideVersion = version_class(self.Wide)
+        assert self.session.scalar(sa.select(sa.func.count()).where(WideVersion.modified("column_65"))) == 1
@@ -1,8 +1,8 @@
 import sqlalchemy as sa
 
-from sqlalchemy_history import version_class
+from sqlalchemy_history import version_class, versioning_manager
 from sqlalchemy_history.plugins import TransactionChangesPlugin
-from tests import TestCase
+from tests import QueryPool, TestCase
 
 
 class TestTransactionChanges(TestCase):
@@ -67,3 +67,57 @@ class TestTransactionChangedEntities(TestCase):
         self.session.commit()
 
         assert self.session.scalar(sa.select(sa.func.count()).select_from(TransactionChanges)) == 1
+
+
+class TestTransactionChangesWrites(TestCase):
+    plugins = [TransactionChangesPlugin()]
+
+    def changes(self):
+        TransactionChanges = self.Article.__versioned__["transaction_changes"]
+        return self.session.scalars(
+            sa.select(TransactionChanges.entity_name).order_by(TransactionChanges.entity_name)
+        ).all()
+
+    def test_entity_names_written_once_per_transaction(self):
+        article = self.Article(name="Some article")
+        self.session.add(article)
+        QueryPool.queries = []
+        self.session.flush()
+        article.tags.append(self.Tag(name="Some tag"))
+        self.session.flush()
+        article.name = "Updated name"
+        self.session.flush()
+        self.session.commit()
+
+        inserts = [query for query in QueryPool.queries if query.startswith("INSERT INTO transaction_changes")]
+        selects = [query for query in QueryPool.queries if "FROM transaction_changes" in query]
+        assert len(inserts) == 2
+        assert not selects
+        assert self.changes() == ["Article", "Tag"]
+
+    def test_cache_cleared_after_commit(self):
+        plugin = self.plugins[0]
+        self.session.add(self.Article(name="Some article"))
+        self.session.commit()
+        assert not plugin.entity_names
+        self.session.add(self.Article(name="Another article"))
+        self.session.commit()
+        assert self.changes() == ["Article", "Article"]
+
+    def test_savepoint_rollback_reloads_entity_names(self):
+        plugin = self.plugins[0]
+        self.session.add(self.Article(name="Some article"))
+        self.session.flush()
+        uow = versioning_manager.unit_of_work(self.session)
+        savepoint = self.session.begin_nested()
+        self.session.add(self.Tag(name="Some tag"))
+        self.session.flush()
+        assert plugin.entity_names[uow] == {"Article", "Tag"}
+        savepoint.rollback()
+        assert plugin.entity_names[uow] is None
+
+        self.session.add(self.Article(name="Another article"))
+        self.session.flush()
+        assert "Article" in plugin.entity_names[uow]
+        self.session.commit()
+        assert self.changes().count("Article") == 1
@@ -0,0 +1,92 @@
+import pytest
+import sqlalchemy as sa
+
+from sqlalchemy_history import load_relationships
+from tests import QueryPool, TestCase, create_test_cases
+
+
+class LoadRelationshipsTestCase(TestCase):
+    def create_versions(self):
+        article = self.Article(name="Some article")
+        article.tags = [self.Tag(name="some tag"), self.Tag(name="other tag")]
+        article2 = self.Article(name="Another article")
+        self.session.add_all([article, article2])
+        self.session.commit()
+        article.name = "Updated article"
+        article.tags[0].name = "updated tag"
+        self.session.commit()
+        tag = article.tags[1]
+        article.tags.remove(tag)
+        article2.tags.append(tag)
+        article2.name = "Updated another article"
+        self.session.commit()
+        return article.versions.all() + article2.versions.all()
+
+    def tag_names(self, version):
+        return sorted(tag.name for tag in version.tags)
+
+    def test_loads_one_to_many_relationship(self):
+        versions = self.create_versions()
+        expected = [self.tag_names(version) for version in versions]
+        assert expected == [
+            ["other tag", "some tag"],
+            ["other tag", "updated tag"],
+            [],
+            ["other tag"],
+        ]
+        self.session.expunge_all()
+        versions = self.session.scalars(sa.select(self.ArticleVersion)).all()
+        versions.sort(key=lambda version: (version.id, getattr(version, self.transaction_column_name)))
+
+        QueryPool.queries = []
+        load_relationships(versions, "tags")
+        assert len(QueryPool.queries) == 1
+
+        QueryPool.queries = []
+        assert [self.tag_names(version) for version in versions] == expected
+        assert not QueryPool.queries
+
+    def test_loads_many_to_one_relationship(self):
+        self.create_versions()
+        self.session.expunge_all()
+        versions = self.session.scalars(sa.select(self.TagVersion)).all()
+        expected = [(version.name, version.article and version.article.name) for version in versions]
+
+        QueryPool.queries = []
+        load_relationships(versions, "article")
+        assert len(QueryPool.queries) == 1
+
+        QueryPool.queries = []
+        assert [(version.name, version.article and version.article.name) for version in versions] == expected
+        assert not QueryPool.queries
+
+    def test_loads_mapped_relationships(self):
+        self.create_versions()
+        self.session.expunge_all()
+        versions = self.session.scalars(sa.select(self.ArticleVersion)).all()
+
+        QueryPool.queries = []
+        load_relationships(versions, "transaction", "version_parent")
+        assert len(QueryPool.queries) == 2
+
+        QueryPool.queries = []
+        for version in versions:
+            assert version.transaction.id == getattr(version, self.transaction_column_name)
+            assert version.version_parent.id == version.id
+        assert not QueryPool.queries
+
+    def test_batches(self):
+        versions = self.create_versions()
+
+        QueryPool.queries = []
+        load_relationships(versions, "tags", batch_size=3)
+        load_relationships([], "tags")
+        assert len(QueryPool.queries) == 2
+
+    def test_unknown_relationship(self):
+        versions = self.create_versions()
+        with pytest.raises(TypeError):
+            load_relationships(versions, "name")
+
+
+create_test_cases(LoadRelationshipsTestCase)
@@ -5,8 +5,8 @@ import pytest
 import sqlalchemy as sa
 from sqlalchemy.orm import relationship
 
-from sqlalchemy_history import versioning_manager
-from tests import TestCase, create_test_cases
+from sqlalchemy_history import load_relationships, versioning_manager
+from tests import QueryPool, TestCase, create_test_cases
 
 
 class ManyToManyRelationshipsTestCase(TestCase):
@@ -53,6 +53,12 @@ class ManyToManyRelationshipsTestCase(TestCase):
         self.Article = Article
         self.Tag = Tag
 
+    def test_association_table_index(self):
+        article_tag = sa.inspect(self.Article).relationships["tags"].secondary
+        table_name = f"{article_tag.schema}.article_tag" if article_tag.schema else "article_tag"
+        assert versioning_manager.association_tables[table_name].name == "article_tag_version"
+        assert len(versioning_manager.association_tables) == 1
+
     def test_version_relations(self):
         article = self.Article()
         article.name = "Some article"
@@ -211,6 +217,108 @@ class ManyToManyRelationshipsTestCase(TestCase):
         assert tag1.versions[2] in article.versions[2].tags
         assert tag2.versions[0] in article.versions[2].tags
 
+    def test_association_versions_written_in_batch(self):
+        tags = [self.Tag(name=f"tag {i}") for i in range(5)]
+        article = self.Article(name="Some article", tags=tags[:2])
+        self.session.add(article)
+        self.session.commit()
+
+        QueryPool.queries = []
+        article.tags = tags[1:]
+        self.session.commit()
+        version_queries = [query for query in QueryPool.queries if "article_tag_version" in query]
+        assert len([query for query in version_queries if query.startswith("INSERT")]) <= 2
+        assert len([query for query in version_queries if query.startswith("UPDATE")]) == (
+            1 if self.versioning_strategy == "validity" else 0
+        )
+        article_tag_version = self.Model.metadata.tables["article_tag_version"]
+        tx_column = article_tag_version.c[self.transaction_column_name]
+        operations = self.session.scalars(
+            sa.select(article_tag_version.c.operation_type).where(
+                tx_column == sa.select(sa.func.max(tx_column)).scalar_subquery()
+            )
+        ).all()
+        assert sorted(operations) == [0, 0, 0, 2]
+
+    def test_relationship_criteria_of_strategy(self):
+        article = self.Article(name="Some article", tags=[self.Tag(name="some tag")])
+        self.session.add(article)
+        self.session.commit()
+        article.name = "Updated article"
+        article.tags.append(self.Tag(name="another tag"))
+        self.session.commit()
+        versions = article.versions.all()
+
+        QueryPool.queries = []
+        assert [tag.name for tag in versions[0].tags] == ["some tag"]
+        assert sorted(tag.name for tag in versions[1].tags) == ["another tag", "some tag"]
+        assert QueryPool.queries
+        assert all(("max(" in query) == (self.versioning_strategy == "subquery") for query in QueryPool.queries)
+
+    def test_association_rows_inserted_before_versioned_flush(self):
+        article = self.Article(name="Some article")
+        tag = self.Tag(name="some tag")
+        self.session.add_all([article, tag])
+        self.session.commit()
+
+        self.session.execute(
+            sa.insert(self.Article.tags.property.secondary).values(article_id=article.id, tag_id=tag.id)
+        )
+        article.name = "Updated article"
+        self.session.commit()
+        assert [tag.name for tag in article.versions[1].tags] == ["some tag"]
+        assert article.versions[0].tags == []
+
+    def test_association_rows_inserted_on_fresh_engine(self):
+        # The engine of each test case is new, so the association statement is the first statement
+        # executed with versioning on it.
+        self.session.execute(sa.insert(self.Article.__table__).values(id=1, name="Some article"))
+        self.session.execute(sa.insert(self.Tag.__table__).values(id=1, name="some tag"))
+        self.session.execute(sa.insert(self.Article.tags.property.secondary).values(article_id=1, tag_id=1))
+        article = self.session.get(self.Article, 1)
+        article.name = "Updated article"
+        self.session.commit()
+        article_tag_version = self.Model.metadata.tables["article_tag_version"]
+        rows = self.session.execute(
+            sa.select(
+                article_tag_version.c.article_id,
+                article_tag_version.c.tag_id,
+                article_tag_version.c[self.transaction_column_name],
+            )
+        ).all()
+        assert rows == [(1, 1, getattr(article.versions[0], self.transaction_column_name))]
+
+    def test_load_relationships(self):
+        article = self.Article(name="Some article", tags=[self.Tag(name="some tag")])
+        article2 = self.Article(name="Another article")
+        self.session.add_all([article, article2])
+        self.session.commit()
+        article.name = "Updated article"
+        article.tags.append(self.Tag(name="another tag"))
+        article2.tags = [article.tags[0]]
+        article2.name = "Updated another article"
+        self.session.commit()
+        article.tags.remove(article.tags[0])
+        article.name = "Article without some tag"
+        self.session.commit()
+        versions = article.versions.all() + article2.versions.all()
+        expected = [sorted(tag.name for tag in version.tags) for version in versions]
+        assert expected == [["some tag"], ["another tag", "some tag"], ["another tag"], [], ["some tag"]]
+        self.session.expunge_all()
+        versions = self.session.scalars(
+            sa.select(self.ArticleVersion).order_by(
+                self.ArticleVersion.id, getattr(self.ArticleVersion, self.transaction_column_name)
+            )
+        ).all()
+
+        QueryPool.queries = []
+        load_relationships(versions, "tags")
+        assert len(QueryPool.queries) == 1
+
+        QueryPool.queries = []
+        assert [sorted(tag.name for tag in version.tags) for version in versions] == expected
+        assert not QueryPool.queries
+
 
 create_test_cases(ManyToManyRelationshipsTestCase)
 
@@ -255,6 +363,7 @@ class TestManyToManyRelationshipWithViewOnly(TestCase):
 
     def test_does_not_add_association_table_to_manager_registry(self):
         assert self.article_tag not in versioning_manager.version_table_map
+        assert "article_tag" not in versioning_manager.association_tables
 
 
 class TestManyToManySelfReferential(TestCase):
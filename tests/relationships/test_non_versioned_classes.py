@@ -3,7 +3,8 @@ from copy import copy
 import sqlalchemy as sa
 from sqlalchemy.orm import relationship
 
-from tests import TestCase
+from sqlalchemy_history import load_relationships
+from tests import QueryPool, TestCase
 
 
 class TestRelationshipToNonVersionedClass(TestCase):
@@ -43,6 +44,20 @@ class TestRelationshipToNonVersionedClass(TestCase):
 
         assert isinstance(article.versions[0].author, self.User)
 
+    def test_load_relationships(self):
+        user = self.User(name="Some user")
+        self.session.add_all([self.Article(name="Some article", author=user), self.Article(name="Another article")])
+        self.session.commit()
+        versions = self.session.scalars(sa.select(self.ArticleVersion).order_by(self.ArticleVersion.id)).all()
+
+        QueryPool.queries = []
+        load_relationships(versions, "author")
+        assert len(QueryPool.queries) == 1
+
+        QueryPool.queries = []
+        assert [version.author for version in versions] == [user, None]
+        assert not QueryPool.queries
+
     def test_change_relationship(self):
         article = self.Article()
         article.name = "Some article"
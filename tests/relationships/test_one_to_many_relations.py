@@ -1,7 +1,7 @@
 import sqlalchemy as sa
 from sqlalchemy.orm import backref, relationship
 
-from tests import TestCase, create_test_cases
+from tests import QueryPool, TestCase, create_test_cases
 
 
 class OneToManyRelationshipsTestCase(TestCase):
@@ -121,6 +121,24 @@ class OneToManyRelationshipsTestCase(TestCase):
         assert len(article.versions[0].tags) == 1
         assert len(article.versions[1].tags) == 0
 
+    def test_relationship_criteria_of_strategy(self):
+        article = self.Article(name="Some article")
+        tag = self.Tag(name="some tag")
+        article.tags.append(tag)
+        self.session.add(article)
+        self.session.commit()
+        tag.name = "updated tag"
+        self.session.commit()
+        article_version = article.versions[0]
+        tag_versions = tag.versions.all()
+
+        QueryPool.queries = []
+        assert [tag.name for tag in article_version.tags] == ["some tag"]
+        assert tag_versions[0].article == article_version
+        assert tag_versions[1].article == article_version
+        assert QueryPool.queries
+        assert all(("max(" in query) == (self.versioning_strategy == "subquery") for query in QueryPool.queries)
+
 
 create_test_cases(OneToManyRelationshipsTestCase)
 
@@ -1,11 +1,12 @@
 import datetime
 
+import pytest
 import sqlalchemy as sa
 from sqlalchemy.orm import relationship
 
-from sqlalchemy_history import version_class
+from sqlalchemy_history import schema, version_class
 from sqlalchemy_history.operation import Operation
-from sqlalchemy_history.schema import update_end_tx_column
+from sqlalchemy_history.schema import update_end_tx_column, update_end_tx_column_for_keys
 from sqlalchemy_history.utils import version_table
 from tests import TestCase, create_test_cases
 
@@ -107,6 +108,22 @@ class UpdateEndTransactionID(TestCase):
             rows = self.session.execute(sa.text("SELECT * FROM article_version ORDER BY transaction_id")).fetchall()
             assert not hasattr(rows[0], "end_transaction_id")
 
+    @pytest.mark.parametrize("update_from", [True, False])
+    def test_update_end_transaction_id_for_keys(self, monkeypatch, update_from):
+        if self.versioning_strategy != "validity":
+            pytest.skip(reason="Skip end_tx_id test if not using validity strategy")
+        monkeypatch.setattr(schema, "supports_update_from", lambda dialect: update_from)
+        table = version_class(self.Article).__table__
+        for article_id, tx_id in [(1, 1), (1, 2), (2, 3), (3, 3)]:
+            self._insert({"id": article_id, "transaction_id": tx_id, "name": "Article", "operation_type": 1})
+        update_end_tx_column_for_keys(table, [(1,), (2,)], 4, conn=self.session.connection())
+        rows = self.session.execute(
+            sa.select(table.c.id, table.c.transaction_id, table.c.end_transaction_id).order_by(
+                table.c.transaction_id, table.c.id
+            )
+        ).all()
+        assert [tuple(row) for row in rows] == [(1, 1, None), (1, 2, 4), (2, 3, 4), (3, 3, None)]
+
     def test_assoc_update_end_transaction_id(self):
         article_label_table_version = version_table(self.article_label_table)
 
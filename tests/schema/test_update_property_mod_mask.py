@@ -0,0 +1,40 @@
+import sqlalchemy as sa
+
+from sqlalchemy_history.plugins.property_mod_tracker import MOD_BITS_INFO_KEY
+from sqlalchemy_history.schema import update_property_mod_mask
+from tests import TestCase
+
+
+class TestUpdatePropertyModMask(TestCase):
+    def create_models(self):
+        TestCase.create_models(self)
+        # A version table holding both the boolean columns and the mask column during the migration
+        self.table = sa.Table(
+            "legacy_article_version",
+            self.Model.metadata,
+            sa.Column("id", sa.Integer, primary_key=True, autoincrement=False),
+            sa.Column("transaction_id", sa.Integer, primary_key=True, autoincrement=False),
+            sa.Column("name_mod", sa.Boolean, nullable=False),
+            sa.Column("content_mod", sa.Boolean, nullable=False),
+            sa.Column(
+                "mod_mask",
+                sa.BigInteger,
+                nullable=False,
+                server_default="0",
+                info={MOD_BITS_INFO_KEY: {"name": 0, "content": 1}},
+            ),
+        )
+
+    def test_fills_mask_from_boolean_columns(self):
+        self.session.execute(
+            self.table.insert(),
+            [
+                {"id": 1, "transaction_id": 1, "name_mod": True, "content_mod": True},
+                {"id": 1, "transaction_id": 2, "name_mod": False, "content_mod": True},
+                {"id": 1, "transaction_id": 3, "name_mod": False, "content_mod": False},
+            ],
+        )
+
+        update_property_mod_mask(self.table, conn=self.session)
+        masks = self.session.scalars(sa.select(self.table.c.mod_mask).order_by(self.table.c.transaction_id)).all()
+        assert masks == [3, 2, 0]
@@ -3,7 +3,7 @@ from copy import copy
 import sqlalchemy as sa
 
 from sqlalchemy_history.utils import tx_column_name
-from tests import create_test_cases
+from tests import create_test_cases, setting_variants
 from tests.sqlalchemy_async import AsyncTestCase
 
 
@@ -219,5 +219,7 @@ class AsyncVersionModelAccessorsWithCompositePkTestCase(AsyncTestCase):
         assert await versions[1].anext == versions[2]
 
 
-create_test_cases(AsyncVersionModelAccessorsTestCase)
-create_test_cases(AsyncVersionModelAccessorsWithCompositePkTestCase)
+fetcher_setting_variants = {**setting_variants, "fetcher": ["auto", "window"]}
+
+create_test_cases(AsyncVersionModelAccessorsTestCase, fetcher_setting_variants)
+create_test_cases(AsyncVersionModelAccessorsWithCompositePkTestCase, fetcher_setting_variants)
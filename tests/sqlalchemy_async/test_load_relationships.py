@@ -0,0 +1,29 @@
+from sqlalchemy_history import aload_relationships
+from tests import QueryPool, create_test_cases
+from tests.sqlalchemy_async import AsyncTestCase
+
+
+class AsyncLoadRelationshipsTestCase(AsyncTestCase):
+    async def test_loads_relationships_without_io_on_access(self):
+        article = self.Article(name="Some article", tags=[self.Tag(name="Some tag")])
+        self.session.add(article)
+        await self.session.commit()
+        article.name = "Updated article"
+        self.session.add(self.Tag(name="Another tag", article=article))
+        await self.session.commit()
+        versions = await self.versions(article)
+
+        QueryPool.queries = []
+        await aload_relationships(versions, "tags", "transaction")
+        assert len(QueryPool.queries) == 2
+
+        QueryPool.queries = []
+        assert [tag.name for tag in versions[0].tags] == ["Some tag"]
+        assert sorted(tag.name for tag in versions[1].tags) == ["Another tag", "Some tag"]
+        assert [version.transaction.id for version in versions] == [
+            getattr(version, self.transaction_column_name) for version in versions
+        ]
+        assert not QueryPool.queries
+
+
+create_test_cases(AsyncLoadRelationshipsTestCase)
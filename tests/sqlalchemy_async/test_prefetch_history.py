@@ -0,0 +1,42 @@
+from sqlalchemy_history import aprefetch_history
+from tests import QueryPool, create_test_cases
+from tests.sqlalchemy_async import AsyncTestCase
+
+
+class AsyncPrefetchHistoryTestCase(AsyncTestCase):
+    async def test_fills_async_accessors(self):
+        article = self.Article(name="Some article", content="Some content")
+        self.session.add(article)
+        await self.session.commit()
+        article.name = "Updated article"
+        await self.session.commit()
+        versions = await self.versions(article)
+
+        QueryPool.queries = []
+        await aprefetch_history(versions)
+        assert len(QueryPool.queries) == 1
+
+        QueryPool.queries = []
+        assert await versions[0].aindex == 0
+        assert await versions[0].aprevious is None
+        assert await versions[0].anext is versions[1]
+        assert await versions[1].aindex == 1
+        assert await versions[1].aprevious is versions[0]
+        assert await versions[1].anext is None
+        assert not QueryPool.queries
+
+    async def test_finds_neighbours_in_session(self):
+        article = self.Article(name="Some article")
+        self.session.add(article)
+        await self.session.commit()
+        article.name = "Updated article"
+        await self.session.commit()
+        versions = await self.versions(article)
+
+        QueryPool.queries = []
+        await aprefetch_history(versions[1:])
+        assert len(QueryPool.queries) == 1
+        assert await versions[1].aprevious is versions[0]
+
+
+create_test_cases(AsyncPrefetchHistoryTestCase)
@@ -0,0 +1,35 @@
+from sqlalchemy_history import VersionHistory
+from tests import create_test_cases
+from tests.sqlalchemy_async import AsyncTestCase
+
+
+class AsyncVersionHistoryTestCase(AsyncTestCase):
+    async def create_history(self, count=5):
+        article = self.Article(name="Article 0")
+        self.session.add(article)
+        await self.session.commit()
+        for i in range(1, count):
+            article.name = f"Article {i}"
+            await self.session.commit()
+        return article
+
+    async def test_iterates_in_pages(self):
+        article = await self.create_history()
+        pages = [page async for page in VersionHistory(article, page_size=2).apages()]
+        assert [[version.name for version in page] for page in pages] == [
+            ["Article 0", "Article 1"],
+            ["Article 2", "Article 3"],
+            ["Article 4"],
+        ]
+
+    async def test_reverse(self):
+        article = await self.create_history()
+        names = [version.name async for version in VersionHistory(article, page_size=2).reverse()]
+        assert names == [f"Article {i}" for i in reversed(range(5))]
+
+    async def test_latest(self):
+        article = await self.create_history()
+        assert [version.name for version in await VersionHistory(article).alatest(2)] == ["Article 4", "Article 3"]
+
+
+create_test_cases(AsyncVersionHistoryTestCase)
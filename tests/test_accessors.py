@@ -2,8 +2,9 @@ from copy import copy
 
 import sqlalchemy as sa
 
+from sqlalchemy_history import versioning_manager
 from sqlalchemy_history.utils import tx_column_name
-from tests import TestCase, create_test_cases
+from tests import QueryPool, TestCase, create_test_cases, setting_variants
 
 
 class VersionModelAccessorsTestCase(TestCase):
@@ -185,6 +186,39 @@ class VersionModelAccessorsTestCase(TestCase):
 
         assert article.versions[0].index == 0
 
+    def test_index_counts_versions_of_parent_only(self):
+        article = self.Article(name="Some article")
+        self.session.add(article)
+        self.session.commit()
+        article2 = self.Article(name="Another article")
+        self.session.add(article2)
+        self.session.commit()
+        article2.name = "Updated article"
+        self.session.commit()
+
+        assert article2.versions[0].index == 0
+        assert article2.versions[1].index == 1
+
+    def test_window_fetcher_fetches_neighbours_together(self):
+        article = self.Article(name="Some article")
+        self.session.add(article)
+        self.session.commit()
+        article.name = "Updated article"
+        self.session.commit()
+        article.name = "Updated article 2"
+        self.session.commit()
+        versions = article.versions.all()
+
+        QueryPool.queries = []
+        assert versions[1].index == 1
+        assert versions[1].previous == versions[0]
+        assert versions[1].next == versions[2]
+        assert len(QueryPool.queries) == (1 if self.fetcher == "window" else 3)
+
+        fetcher = versioning_manager.fetcher(self.Article)
+        assert self.session.scalars(fetcher.previous_query(versions[1])).one() == versions[0]
+        assert self.session.scalars(fetcher.next_query(versions[1])).one() == versions[2]
+
 
 class VersionModelAccessorsWithCompositePkTestCase(TestCase):
     def create_models(self):
@@ -245,5 +279,7 @@ class VersionModelAccessorsWithCompositePkTestCase(TestCase):
         assert user.versions[1].next == user.versions[2]
 
 
-create_test_cases(VersionModelAccessorsTestCase)
-create_test_cases(VersionModelAccessorsWithCompositePkTestCase)
+fetcher_setting_variants = {**setting_variants, "fetcher": ["auto", "window"]}
+
+create_test_cases(VersionModelAccessorsTestCase, fetcher_setting_variants)
+create_test_cases(VersionModelAccessorsWithCompositePkTestCase, fetcher_setting_variants)
@@ -0,0 +1,91 @@
+import sqlalchemy as sa
+
+from sqlalchemy_history import prefetch_history
+from tests import QueryPool, TestCase, create_test_cases
+
+
+class PrefetchHistoryTestCase(TestCase):
+    def create_versions(self):
+        article = self.Article(name="Some article", content="Some content")
+        article2 = self.Article(name="Another article")
+        self.session.add_all([article, article2])
+        self.session.commit()
+        article.name = "Updated article"
+        self.session.commit()
+        article.content = "Updated content"
+        article2.name = "Updated another article"
+        self.session.commit()
+        return article.versions.all(), article2.versions.all()
+
+    def test_wires_consecutive_versions_in_memory(self):
+        versions, versions2 = self.create_versions()
+
+        QueryPool.queries = []
+        prefetch_history(versions + versions2)
+        assert len(QueryPool.queries) == 1
+
+        QueryPool.queries = []
+        assert [version.index for version in versions] == [0, 1, 2]
+        assert versions[0].previous is None
+        assert versions[0].next is versions[1]
+        assert versions[1].previous is versions[0]
+        assert versions[2].next is None
+        assert versions2[1].previous is versions2[0]
+        assert versions[2].changeset == {"content": ["Some content", "Updated content"]}
+        assert not QueryPool.queries
+
+    def test_loads_missing_neighbours(self):
+        versions, _ = self.create_versions()
+        tx_column = self.transaction_column_name
+        tx_id = getattr(versions[1], tx_column)
+        self.session.expunge_all()
+        version = self.session.scalars(
+            sa.select(self.ArticleVersion).where(getattr(self.ArticleVersion, tx_column) == tx_id)
+        ).one()
+
+        QueryPool.queries = []
+        prefetch_history([version])
+        assert len(QueryPool.queries) == 2
+
+        QueryPool.queries = []
+        assert version.index == 1
+        assert version.previous.name == "Some article"
+        assert version.next.content == "Updated content"
+        assert not QueryPool.queries
+
+    def test_finds_neighbours_in_session(self):
+        versions, _ = self.create_versions()
+
+        QueryPool.queries = []
+        prefetch_history([versions[1]])
+        assert len(QueryPool.queries) == 1
+
+        QueryPool.queries = []
+        assert versions[1].index == 1
+        assert versions[1].previous is versions[0]
+        assert versions[1].next is versions[2]
+        assert not QueryPool.queries
+
+    def test_multiple_version_classes(self):
+        article = self.Article(name="Some article")
+        article.tags.append(self.Tag(name="Some tag"))
+        self.session.add(article)
+        self.session.commit()
+        versions = article.versions.all() + article.tags[0].versions.all()
+
+        QueryPool.queries = []
+        prefetch_history(versions)
+        assert len(QueryPool.queries) == 2
+        assert all(version.index == 0 for version in versions)
+
+    def test_skips_cached_versions(self):
+        versions, _ = self.create_versions()
+        prefetch_history(versions)
+
+        QueryPool.queries = []
+        prefetch_history(versions)
+        prefetch_history([])
+        assert not QueryPool.queries
+
+
+create_test_cases(PrefetchHistoryTestCase)
@@ -1,3 +1,5 @@
+import sqlalchemy as sa
+from sqlalchemy.orm import Mapper
 from sqlalchemy.orm.session import Session
 
 from sqlalchemy_history import UnitOfWork, versioning_manager
@@ -64,3 +66,64 @@ class TestExternalTransactionSession(TestCase):
         session.close()
         t.rollback()
         conn.close()
+
+    def test_flush_only_processes_new_operations(self):
+        uow = versioning_manager.unit_of_work(self.session)
+        article = self.Article(name="Some article")
+        self.session.add(article)
+        self.session.flush()
+        assert not uow.operations.unprocessed
+
+        article2 = self.Article(name="Some article 2")
+        self.session.add(article2)
+        self.session.flush()
+        assert not uow.operations.unprocessed
+        assert len(uow.operations.objects) == 2
+        assert uow.operations.entities == {self.Article}
+        self.session.commit()
+        assert article.versions[0].transaction_id == article2.versions[0].transaction_id
+
+    def test_operations_capture_changed_keys(self):
+        uow = versioning_manager.unit_of_work(self.session)
+        article = self.Article(name="Some article")
+        self.session.add(article)
+        self.session.flush()
+        assert uow.operations.changed_keys(article) == {"name"}
+
+        article.content = "Some content"
+        self.session.flush()
+        assert uow.operations.changed_keys(article) == {"content"}
+        self.session.commit()
+
+
+class TestNonVersionedChanges(TestCase):
+    def create_models(self):
+        TestCase.create_models(self)
+
+        class Comment(self.Model):
+            __tablename__ = "comment"
+            id = sa.Column(
+                sa.Integer, sa.Sequence(f"{__tablename__}_seq", start=1), autoincrement=True, primary_key=True
+            )
+            text = sa.Column(sa.Unicode(255))
+
+        self.Comment = Comment
+
+    def test_operation_listeners_only_attached_to_versioned_mappers(self):
+        assert sa.event.contains(sa.inspect(self.Article), "after_insert", versioning_manager.track_inserts)
+        assert not sa.event.contains(sa.inspect(self.Comment), "after_insert", versioning_manager.track_inserts)
+        assert not sa.event.contains(Mapper, "after_insert", versioning_manager.track_inserts)
+
+    def test_flush_without_versioned_changes_creates_no_unit_of_work(self):
+        self.session.add(self.Comment(text="Some comment"))
+        self.session.flush()
+        assert not versioning_manager.units_of_work
+        self.session.commit()
+
+    def test_versioned_changes_after_non_versioned_flush(self):
+        self.session.add(self.Comment(text="Some comment"))
+        self.session.flush()
+        article = self.Article(name="Some article")
+        self.session.add(article)
+        self.session.commit()
+        assert article.versions[0].transaction_id
@@ -0,0 +1,66 @@
+import sqlalchemy as sa
+
+from sqlalchemy_history import versioning_manager
+from tests import TestCase, create_test_cases
+
+
+class StreamingTestCase(TestCase):
+    streaming = True
+
+    def test_releases_versioned_objects_after_flush(self):
+        self.session.add_all([self.Article(name=f"Article {i}") for i in range(3)])
+        self.session.flush()
+        uow = versioning_manager.unit_of_work(self.session)
+        assert not uow.operations.objects
+        assert not uow.version_objs
+        assert list(uow.version_session) == []
+        assert len(uow.released_versions) == 3
+        self.session.commit()
+        assert self.session.scalar(sa.select(sa.func.count()).select_from(self.ArticleVersion)) == 3
+
+    def test_change_after_release_updates_version_row(self):
+        article = self.Article(name="Some article")
+        self.session.add(article)
+        self.session.flush()
+        article.name = "Updated article"
+        self.session.flush()
+        self.session.commit()
+        assert article.versions.count() == 1
+        version = article.versions[0]
+        assert version.name == "Updated article"
+        assert version.operation_type == 0
+
+    def test_delete_after_release(self):
+        article = self.Article(name="Some article")
+        self.session.add(article)
+        self.session.commit()
+        article.name = "Updated article"
+        self.session.flush()
+        self.session.delete(article)
+        self.session.commit()
+        versions = self.session.scalars(
+            sa.select(self.ArticleVersion).order_by(getattr(self.ArticleVersion, self.transaction_column_name))
+        ).all()
+        assert [version.operation_type for version in versions] == [0, 2]
+        if self.versioning_strategy == "validity":
+            assert getattr(versions[0], self.end_transaction_column_name) == getattr(
+                versions[1], self.transaction_column_name
+            )
+
+    def test_transaction_changes_cover_released_entities(self):
+        self.session.add(self.Article(name="Some article"))
+        self.session.flush()
+        self.session.add(self.Tag(name="Some tag"))
+        self.session.commit()
+        TransactionChanges = self.Article.__versioned__["transaction_changes"]
+        entity_names = {change.entity_name for change in self.session.scalars(sa.select(TransactionChanges))}
+        assert entity_names == {"Article", "Tag"}
+
+
+create_test_cases(
+    StreamingTestCase,
+    {
+        "versioning_strategy": ["subquery", "validity"],
+        "write_mode": ["orm", "core"],
+    },
+)
@@ -6,7 +6,9 @@ import pytest
 import sqlalchemy as sa
 
 from sqlalchemy_history import versioning_manager
+from sqlalchemy_history.exc import ImproperlyConfigured
 from sqlalchemy_history.plugins import TransactionMetaPlugin
+from sqlalchemy_history.transaction import SequenceIdAllocator, TableIdAllocator, TransactionIdAllocator
 from tests import TestCase
 
 
@@ -142,3 +144,83 @@ class TestAssigningUserClassInOtherSchema(TestCase):
     def test_can_build_transaction_model(self):
         # If create_models didn't crash this should be good
         pass
+
+
+class TestTableIdAllocator(TestCase):
+    @property
+    def transaction_id_allocator(self):
+        return TableIdAllocator(self.Model.metadata, block_size=3)
+
+    def test_transaction_row_written_without_extra_flush(self):
+        article = self.Article(name="Some article")
+        self.session.add(article)
+        self.session.commit()
+        transaction = article.versions[0].transaction
+        assert transaction.id == 1
+        assert transaction.issued_at is not None
+
+    def test_allocates_ids_from_reserved_blocks(self):
+        article = self.Article(name="Some article")
+        self.session.add(article)
+        self.session.commit()
+        for i in range(4):
+            article.name = f"Some article {i}"
+            self.session.commit()
+        assert [version.transaction_id for version in article.versions] == [1, 2, 3, 4, 5]
+        allocator = versioning_manager.transaction_id_allocator
+        assert self.session.scalar(sa.select(allocator.table.c.next_id)) == 7
+
+    def test_first_block_starts_after_existing_transactions(self):
+        self.session.execute(sa.insert(versioning_manager.transaction_cls).values(id=10))
+        article = self.Article(name="Some article")
+        self.session.add(article)
+        self.session.commit()
+        assert article.versions[0].transaction_id == 11
+
+    def test_counter_row_inserted_concurrently(self, monkeypatch):
+        allocator = versioning_manager.transaction_id_allocator
+        increment = allocator._increment
+
+        def increment_after_concurrent_insert(connection):
+            # Another process inserts the counter row after this one found none
+            connection.execute(allocator.table.insert().values(id=allocator.counter_id, next_id=21))
+            monkeypatch.setattr(allocator, "_increment", increment)
+
+        monkeypatch.setattr(allocator, "_increment", increment_after_concurrent_insert)
+        article = self.Article(name="Some article")
+        self.session.add(article)
+        self.session.commit()
+        assert article.versions[0].transaction_id == 21
+        assert self.session.scalars(sa.select(allocator.table.c.next_id)).all() == [24]
+
+
+class TestTransactionIdAllocator(TestCase):
+    def test_reserve_block_is_abstract(self):
+        with pytest.raises(TypeError):
+            TransactionIdAllocator()
+
+    def test_sequence_of_transaction_id_rejected(self):
+        allocator = SequenceIdAllocator(sa.Sequence("transaction_id_seq"))
+        with pytest.raises(ImproperlyConfigured):
+            allocator.reserve_block(self.session.connection(), versioning_manager.transaction_cls)
+
+
+@pytest.mark.skipif(
+    os.environ.get("DB") in ["sqlite", "mysql"],
+    reason="sqlite and mysql don't support sequences",
+)
+class TestSequenceIdAllocator(TestCase):
+    @property
+    def transaction_id_allocator(self):
+        return SequenceIdAllocator(sa.Sequence("transaction_id_block_seq", metadata=self.Model.metadata), block_size=3)
+
+    def test_allocates_ids_from_sequence_blocks(self):
+        article = self.Article(name="Some article")
+        self.session.add(article)
+        self.session.commit()
+        for i in range(3):
+            article.name = f"Some article {i}"
+            self.session.commit()
+        tx_ids = [version.transaction_id for version in article.versions]
+        assert tx_ids[:3] == list(range(tx_ids[0], tx_ids[0] + 3))
+        assert tx_ids[3] > tx_ids[2]
@@ -1,6 +1,7 @@
 import sqlalchemy as sa
+from sqlalchemy.orm import deferred
 
-from tests import TestCase
+from tests import QueryPool, TestCase
 
 
 class TestUpdate(TestCase):
@@ -104,3 +105,34 @@ class TestUpdateWithDefaultValues(TestCase):
         self.session.commit()
         article = article.versions.all()[-1]
         assert article.name == "Some article"
+
+
+class TestUpdateWithDeferredColumns(TestCase):
+    def create_models(self):
+        class Article(self.Model):
+            __tablename__ = "article"
+            __versioned__ = {}
+
+            id = sa.Column(
+                sa.Integer, sa.Sequence(f"{__tablename__}_seq", start=1), autoincrement=True, primary_key=True
+            )
+            name = sa.Column(sa.Unicode(255))
+            content = deferred(sa.Column(sa.UnicodeText))
+
+        self.Article = Article
+
+    def test_loads_deferred_attributes_with_single_query(self):
+        self.session.add_all([self.Article(name=f"Article {i}", content=f"Content {i}") for i in range(3)])
+        self.session.commit()
+        self.session.expunge_all()
+
+        articles = self.session.scalars(sa.select(self.Article).order_by(self.Article.id)).all()
+        for article in articles:
+            article.name = "Updated name"
+        QueryPool.queries = []
+        self.session.commit()
+
+        loads = [query for query in QueryPool.queries if query.startswith("SELECT") and "article.content" in query]
+        assert len(loads) == 1
+        for i, article in enumerate(articles):
+            assert article.versions.all()[-1].content == f"Content {i}"
@@ -2,7 +2,7 @@ import pytest
 import sqlalchemy as sa
 
 from sqlalchemy_history import version_class
-from tests import TestCase
+from tests import QueryPool, TestCase
 
 
 class TestValidityStrategy(TestCase):
@@ -50,6 +50,39 @@ class TestValidityStrategy(TestCase):
         self.session.commit()
         assert article.versions.all()[-2].end_transaction_id == article.versions.all()[-1].transaction_id
 
+    def test_end_transaction_ids_updated_with_single_statement_per_flush(self):
+        articles = [self.Article(name=f"Article {i}") for i in range(3)]
+        self.session.add_all(articles)
+        self.session.commit()
+
+        for article in articles:
+            article.name += " updated"
+        QueryPool.queries = []
+        self.session.commit()
+        validity_updates = [
+            query for query in QueryPool.queries if query.startswith("UPDATE article_version SET end_transaction_id")
+        ]
+        assert len(validity_updates) == 1
+        for article in articles:
+            versions = article.versions.all()
+            assert versions[0].end_transaction_id == versions[1].transaction_id
+            assert versions[1].end_transaction_id is None
+
+    def test_end_transaction_id_not_updated_again_in_later_flush(self):
+        article = self.Article(name="Something")
+        self.session.add(article)
+        self.session.commit()
+
+        article.name = "Some other thing"
+        self.session.flush()
+        article.name = "Yet another thing"
+        QueryPool.queries = []
+        self.session.commit()
+        assert not [query for query in QueryPool.queries if "end_transaction_id" in query and "UPDATE" in query]
+        versions = article.versions.all()
+        assert versions[0].end_transaction_id == versions[1].transaction_id
+        assert versions[1].name == "Yet another thing"
+
 
 class TestJoinTableInheritanceWithValidityVersioning(TestCase):
     def create_models(self):
@@ -0,0 +1,126 @@
+import sqlalchemy as sa
+
+from sqlalchemy_history import version_changesets, version_class
+from sqlalchemy_history.plugins import PropertyModTrackerPlugin
+from tests import QueryPool, TestCase, create_test_cases
+
+
+class VersionChangesetsTestCase(TestCase):
+    def create_history(self):
+        article = self.Article(name="Some article", content="Some content")
+        article2 = self.Article(name="Another article")
+        self.session.add_all([article, article2])
+        self.session.commit()
+        article.name = "Updated article"
+        self.session.commit()
+        article.content = None
+        article2.name = "Updated another article"
+        self.session.commit()
+        self.session.delete(article)
+        self.session.commit()
+        return article
+
+    def tx_id(self, version):
+        return getattr(version, self.transaction_column_name)
+
+    def ordered_versions(self, *criteria):
+        tx_column = getattr(self.ArticleVersion, self.transaction_column_name)
+        return self.session.scalars(
+            sa.select(self.ArticleVersion).where(*criteria).order_by(self.ArticleVersion.id, tx_column)
+        ).all()
+
+    def test_equals_version_changesets(self):
+        self.create_history()
+        versions = self.ordered_versions()
+        expected = [(version, version.changeset) for version in versions]
+
+        assert list(version_changesets(self.session, self.ArticleVersion)) == expected
+
+    def test_single_query(self):
+        article = self.create_history()
+        self.session.expunge_all()
+
+        QueryPool.queries = []
+        changesets = list(version_changesets(self.session, self.ArticleVersion, self.ArticleVersion.id == article.id))
+        assert len(QueryPool.queries) == 1
+        assert [changeset for _, changeset in changesets] == [
+            {"id": [None, article.id], "name": [None, "Some article"], "content": [None, "Some content"]},
+            {"name": ["Some article", "Updated article"]},
+            {"content": ["Some content", None]},
+            {},
+        ]
+
+    def test_transaction_range(self):
+        article = self.create_history()
+        versions = self.ordered_versions(self.ArticleVersion.id == article.id)
+
+        changesets = list(
+            version_changesets(
+                self.session,
+                self.ArticleVersion,
+                self.ArticleVersion.id == article.id,
+                start_tx_id=self.tx_id(versions[1]),
+                end_tx_id=self.tx_id(versions[2]),
+            )
+        )
+        assert changesets == [
+            (versions[1], {"name": ["Some article", "Updated article"]}),
+            (versions[2], {"content": ["Some content", None]}),
+        ]
+
+    def test_case_only_change(self):
+        article = self.Article(name="Some article", content="Some content")
+        self.session.add(article)
+        self.session.commit()
+        article.name = "Some Article"
+        article.content = "Some CONTENT"
+        self.session.commit()
+
+        changesets = list(version_changesets(self.session, self.ArticleVersion, self.ArticleVersion.id == article.id))
+        assert changesets[1][1] == {
+            "name": ["Some article", "Some Article"],
+            "content": ["Some content", "Some CONTENT"],
+        }
+
+
+create_test_cases(VersionChangesetsTestCase)
+
+
+class TestVersionChangesetsPluginHook(TestCase):
+    plugins = [PropertyModTrackerPlugin()]
+
+    def test_after_construct_changeset_applied(self):
+        article = self.Article(name="Some article")
+        self.session.add(article)
+        self.session.commit()
+        article.name = "Updated article"
+        self.session.commit()
+
+        changesets = [changeset for _, changeset in version_changesets(self.session, self.ArticleVersion)]
+        assert changesets == [
+            {"id": [None, article.id], "name": [None, "Some article"]},
+            {"name": ["Some article", "Updated article"]},
+        ]
+
+
+class TestVersionChangesetsPythonComparedTypes(TestCase):
+    def create_models(self):
+        class Article(self.Model):
+            __tablename__ = "article"
+            __versioned__ = {}
+            id = sa.Column(
+                sa.Integer, sa.Sequence(f"{__tablename__}_seq", start=1), autoincrement=True, primary_key=True
+            )
+            data = sa.Column(sa.JSON)
+
+        self.Article = Article
+
+    def test_json_column(self):
+        article = self.Article(data={"a": 1})
+        self.session.add(article)
+        self.session.commit()
+        article.data = {"a": 2}
+        self.session.commit()
+
+        changesets = [changeset for _, changeset in version_changesets(self.session, version_class(self.Article))]
+        assert changesets[1] == {"data": [{"a": 1}, {"a": 2}]}
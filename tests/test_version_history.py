@@ -0,0 +1,58 @@
+from sqlalchemy_history import VersionHistory
+from tests import QueryPool, TestCase, create_test_cases
+
+
+class VersionHistoryTestCase(TestCase):
+    def create_history(self, count=5):
+        article = self.Article(name="Article 0")
+        self.session.add(article)
+        self.session.add(self.Article(name="Another article"))
+        self.session.commit()
+        for i in range(1, count):
+            article.name = f"Article {i}"
+            self.session.commit()
+        return article
+
+    def tx_id(self, version):
+        return getattr(version, self.transaction_column_name)
+
+    def test_iterates_in_pages(self):
+        article = self.create_history()
+        history = VersionHistory(article, page_size=2)
+
+        QueryPool.queries = []
+        pages = list(history.pages())
+        assert [[version.name for version in page] for page in pages] == [
+            ["Article 0", "Article 1"],
+            ["Article 2", "Article 3"],
+            ["Article 4"],
+        ]
+        assert len(QueryPool.queries) == 3
+
+    def test_full_page_at_end_of_history(self):
+        article = self.create_history(count=4)
+        assert [len(page) for page in VersionHistory(article, page_size=2).pages()] == [2, 2]
+
+    def test_reverse(self):
+        article = self.create_history()
+        names = [version.name for version in VersionHistory(article, page_size=2).reverse()]
+        assert names == [f"Article {i}" for i in reversed(range(5))]
+
+    def test_latest(self):
+        article = self.create_history()
+        assert [version.name for version in VersionHistory(article).latest(2)] == ["Article 4", "Article 3"]
+
+    def test_since_and_before(self):
+        article = self.create_history()
+        versions = list(VersionHistory(article))
+        history = VersionHistory(article, page_size=1).since(self.tx_id(versions[1])).before(self.tx_id(versions[4]))
+        assert list(history) == versions[2:4]
+        assert list(history.reverse()) == versions[3:1:-1]
+
+    def test_empty_history(self):
+        article = self.create_history()
+        latest = VersionHistory(article).latest(1)[0]
+        assert not list(VersionHistory(article).since(self.tx_id(latest)))
+
+
+create_test_cases(VersionHistoryTestCase)
@@ -0,0 +1,96 @@
+import sqlalchemy as sa
+
+from sqlalchemy_history import versioning_manager
+from sqlalchemy_history.plugins import NullDeletePlugin, PropertyModTrackerPlugin
+from tests import QueryPool, TestCase, create_test_cases
+
+
+class CoreWriteModeTestCase(TestCase):
+    write_mode = "core"
+
+    def test_insert_creates_version(self):
+        article = self.Article(name="Some article", content="Some content")
+        self.session.add(article)
+        self.session.commit()
+        version = article.versions.all()[-1]
+        assert version.name == "Some article"
+        assert version.content == "Some content"
+        assert version.operation_type == 0
+        assert version.transaction.id == getattr(version, self.transaction_column_name)
+
+    def test_version_rows_are_not_added_to_version_session(self):
+        article = self.Article(name="Some article")
+        self.session.add(article)
+        self.session.flush()
+        uow = versioning_manager.unit_of_work(self.session)
+        assert list(uow.version_session) == []
+        self.session.commit()
+
+    def test_multiple_flushes_update_same_version_row(self):
+        article = self.Article(name="Some article")
+        self.session.add(article)
+        self.session.flush()
+        article.name = "Updated article"
+        self.session.flush()
+        self.session.commit()
+        assert article.versions.count() == 1
+        assert article.versions[0].name == "Updated article"
+        assert article.versions[0].operation_type == 0
+
+    def test_update_and_delete(self):
+        article = self.Article(name="Some article")
+        self.session.add(article)
+        self.session.commit()
+        article.name = "Updated article"
+        self.session.commit()
+        self.session.delete(article)
+        self.session.commit()
+        versions = self.session.scalars(
+            sa.select(self.ArticleVersion).order_by(getattr(self.ArticleVersion, self.transaction_column_name))
+        ).all()
+        assert [v.operation_type for v in versions] == [0, 1, 2]
+        if self.versioning_strategy == "validity":
+            assert getattr(versions[0], self.end_transaction_column_name) == getattr(
+                versions[1], self.transaction_column_name
+            )
+            assert getattr(versions[1], self.end_transaction_column_name) == getattr(
+                versions[2], self.transaction_column_name
+            )
+            assert getattr(versions[2], self.end_transaction_column_name) is None
+
+
+create_test_cases(CoreWriteModeTestCase)
+
+
+class TestCoreWriteModeWithPlugins(TestCase):
+    write_mode = "core"
+    plugins = [PropertyModTrackerPlugin(), NullDeletePlugin()]
+
+    def test_plugins_modify_version_rows(self):
+        article = self.Article(name="Some article", content="Some content")
+        self.session.add(article)
+        self.session.commit()
+        article.content = "Updated content"
+        self.session.commit()
+        self.session.delete(article)
+        self.session.commit()
+        versions = self.session.scalars(
+            sa.select(self.ArticleVersion).order_by(self.ArticleVersion.transaction_id)
+        ).all()
+        assert versions[0].name_mod
+        assert versions[1].content_mod
+        assert not versions[1].name_mod
+        assert versions[2].name is None
+        assert versions[2].content is None
+
+    def test_one_insert_per_version_table(self):
+        articles = [self.Article(name="Some article"), self.Article(name="Other article", content="Some content")]
+        self.session.add_all(articles)
+        self.session.commit()
+        articles[0].name = "Updated article"
+        articles[1].content = "Updated content"
+        QueryPool.queries = []
+        self.session.commit()
+        assert len([query for query in QueryPool.queries if query.startswith("INSERT INTO article_version")]) == 1
+        versions = [article.versions[1] for article in articles]
+        assert [(version.name_mod, version.content_mod) for version in versions] == [(True, False), (False, True)]
@@ -0,0 +1,78 @@
+from datetime import datetime
+
+import sqlalchemy as sa
+
+from sqlalchemy_history import as_of, versioning_manager
+from tests import TestCase, create_test_cases
+
+
+class AsOfTestCase(TestCase):
+    def create_history(self):
+        article = self.Article(name="Some article")
+        article.tags.append(self.Tag(name="Some tag"))
+        self.session.add(article)
+        self.session.commit()
+        article.name = "Updated article"
+        article.tags[0].name = "Updated tag"
+        self.session.add(self.Article(name="Another article"))
+        self.session.commit()
+        self.session.delete(article.tags[0])
+        self.session.commit()
+        self.session.delete(article)
+        self.session.commit()
+        return article
+
+    def transaction_ids(self):
+        Transaction = versioning_manager.transaction_cls
+        return self.session.scalars(sa.select(Transaction.id).order_by(Transaction.id)).all()
+
+    def article_names(self, tx):
+        ArticleAsOf = as_of(self.Article, tx)
+        return self.session.scalars(sa.select(ArticleAsOf.name).order_by(ArticleAsOf.name)).all()
+
+    def test_orm_versions_at_transaction(self):
+        self.create_history()
+        tx_ids = self.transaction_ids()
+
+        assert self.article_names(tx_ids[0]) == ["Some article"]
+        assert self.article_names(tx_ids[1]) == ["Another article", "Updated article"]
+        assert self.article_names(tx_ids[2]) == ["Another article", "Updated article"]
+        assert self.article_names(tx_ids[3]) == ["Another article"]
+
+    def test_join(self):
+        self.create_history()
+        tx_ids = self.transaction_ids()
+
+        def tag_articles(tx):
+            ArticleAsOf = as_of(self.Article, tx)
+            TagAsOf = as_of(self.Tag, tx)
+            return self.session.execute(
+                sa.select(TagAsOf.name, ArticleAsOf.name).join(ArticleAsOf, TagAsOf.article_id == ArticleAsOf.id)
+            ).all()
+
+        assert tag_articles(tx_ids[0]) == [("Some tag", "Some article")]
+        assert tag_articles(tx_ids[1]) == [("Updated tag", "Updated article")]
+        assert tag_articles(tx_ids[2]) == []
+
+    def test_core_table(self):
+        self.create_history()
+        tx_ids = self.transaction_ids()
+
+        articles = as_of(self.Article.__table__, tx_ids[1])
+        assert sorted(self.session.scalars(sa.select(articles.c.name))) == ["Another article", "Updated article"]
+
+    def test_timestamp(self):
+        self.create_history()
+        tx_ids = self.transaction_ids()
+        Transaction = versioning_manager.transaction_cls
+        for day, tx_id in enumerate(tx_ids, start=1):
+            self.session.execute(
+                sa.update(Transaction).where(Transaction.id == tx_id).values(issued_at=datetime(2020, 1, day))
+            )
+
+        assert self.article_names(datetime(2019, 12, 31)) == []
+        assert self.article_names(datetime(2020, 1, 1, 12)) == ["Some article"]
+        assert self.article_names(datetime(2020, 1, 3)) == ["Another article", "Updated article"]
+
+
+create_test_cases(AsOfTestCase)
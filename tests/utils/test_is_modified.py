@@ -2,7 +2,7 @@ from datetime import datetime
 
 import sqlalchemy as sa
 
-from sqlalchemy_history import is_modified
+from sqlalchemy_history import changed_versioned_keys, is_modified
 from tests import TestCase
 
 
@@ -27,3 +27,17 @@ class TestIsModified(TestCase):
     def test_excluded_column(self):
         article = self.Article(content="Some content")
         assert not is_modified(article)
+
+    def test_changed_versioned_keys(self):
+        article = self.Article(name="Some article", content="Some content")
+        assert changed_versioned_keys(article) == {"name"}
+
+    def test_changed_versioned_keys_of_persistent_object(self):
+        article = self.Article(name="Some article")
+        self.session.add(article)
+        self.session.commit()
+        article.name = "Some article"
+        assert changed_versioned_keys(article) == frozenset()
+        article.name = "Updated article"
+        article.content = "Updated content"
+        assert changed_versioned_keys(article) == {"name"}
@@ -0,0 +1,60 @@
+import sqlalchemy as sa
+
+from sqlalchemy_history import is_session_modified
+from tests import TestCase
+
+
+class TestIsSessionModified(TestCase):
+    def create_models(self):
+        class Article(self.Model):
+            __tablename__ = "article"
+            __versioned__ = {"exclude": "content"}
+            id = sa.Column(
+                sa.Integer, sa.Sequence(f"{__tablename__}_seq", start=1), autoincrement=True, primary_key=True
+            )
+            name = sa.Column(sa.Unicode(255))
+            content = sa.Column(sa.Unicode(255))
+
+        class Comment(self.Model):
+            __tablename__ = "comment"
+            id = sa.Column(
+                sa.Integer, sa.Sequence(f"{__tablename__}_seq", start=1), autoincrement=True, primary_key=True
+            )
+            text = sa.Column(sa.Unicode(255))
+
+        self.Article = Article
+        self.Comment = Comment
+
+    def test_new_versioned_object(self):
+        self.session.add(self.Article(name="Some article"))
+        assert is_session_modified(self.session)
+
+    def test_new_non_versioned_object(self):
+        self.session.add(self.Comment(text="Some comment"))
+        assert not is_session_modified(self.session)
+
+    def test_unchanged_objects(self):
+        self.session.add(self.Article(name="Some article"))
+        self.session.commit()
+        assert not is_session_modified(self.session)
+
+    def test_dirty_versioned_column(self):
+        article = self.Article(name="Some article")
+        self.session.add(article)
+        self.session.commit()
+        article.name = "Updated article"
+        assert is_session_modified(self.session)
+
+    def test_dirty_excluded_column(self):
+        article = self.Article(name="Some article")
+        self.session.add(article)
+        self.session.commit()
+        article.content = "Some content"
+        assert not is_session_modified(self.session)
+
+    def test_deleted_versioned_object(self):
+        article = self.Article(name="Some article")
+        self.session.add(article)
+        self.session.commit()
+        self.session.delete(article)
+        assert is_session_modified(self.session)